@@ -0,0 +1,94 @@
+"""
+Measure the cost of the write-ahead move journal.
+
+Organizes the same synthetic tree with and without a journal and prints the
+wall time of each and the relative overhead:
+
+    python benchmarks/bench_journal.py --files 20000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from autoops.jobs.organize_files import organize_files
+from autoops.utils.journal import MoveJournal
+
+CATEGORIES = {
+    "documents": [".pdf", ".txt"],
+    "images": [".png", ".jpg"],
+    "archives": [".zip", ".tar.gz"],
+}
+EXTENSIONS = [".pdf", ".txt", ".png", ".jpg", ".zip", ".tar.gz", ".bin"]
+
+
+def _make_tree(root: Path, files: int) -> None:
+    root.mkdir(parents=True)
+    for i in range(files):
+        (root / f"file{i:07d}{EXTENSIONS[i % len(EXTENSIONS)]}").touch()
+
+
+def _run(root: Path, *, workers: int, journal: bool, fsync: bool) -> float:
+    move_journal = None
+    if journal:
+        move_journal = MoveJournal.create(
+            directory=root.parent / "journals", fsync=fsync
+        )
+    start = time.perf_counter()
+    organize_files(
+        source_dir=root,
+        destination_dir=root,
+        categories=CATEGORIES,
+        others_dir="others",
+        dry_run=False,
+        workers=workers,
+        journal=move_journal,
+    )
+    if move_journal is not None:
+        move_journal.close("completed")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-fsync", action="store_true")
+    args = parser.parse_args()
+
+    base = Path(tempfile.mkdtemp(prefix="autoops-bench-"))
+    try:
+        timings = {"plain": [], "journal": []}
+        for n in range(args.repeat):
+            for mode in timings:
+                root = base / f"{mode}-{n}"
+                _make_tree(root, args.files)
+                os.sync()
+                timings[mode].append(
+                    _run(
+                        root,
+                        workers=args.workers,
+                        journal=mode == "journal",
+                        fsync=not args.no_fsync,
+                    )
+                )
+                shutil.rmtree(root)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    plain = min(timings["plain"])
+    journaled = min(timings["journal"])
+    print(f"files:     {args.files}  workers: {args.workers}")
+    print(f"plain:     {plain:.3f}s  ({args.files / plain:,.0f} files/s)")
+    print(f"journal:   {journaled:.3f}s  ({args.files / journaled:,.0f} files/s)")
+    print(f"overhead:  {(journaled / plain - 1) * 100:+.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Throughput benchmark for organize-files.
+
+Generates synthetic source trees (in tmpfs when /dev/shm exists) with an
+extension mix drawn from configs/organize_files.yaml, then times full runs
+in dry-run, preview and move modes, each on a freshly generated copy of the
+tree (same seed), so the order of --modes does not matter. Phase times are
+the run's own instrumentation spans (scan, classify, plan, mkdir, claim,
+move, wait, ...), measured in that same run. Results are written as JSON so
+runs from different commits can be compared:
+
+    python benchmarks/bench_organize.py --sizes 10k,100k -o after.json
+    python benchmarks/bench_organize.py compare before.json after.json
+
+1M-file trees need ~1M inodes and a few minutes to generate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from autoops.config.categories import CategoryIndex
+from autoops.config.loader import load_organize_files_config
+from autoops.core.metrics import Metrics, collecting
+from autoops.jobs.organize_files import organize_files
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CONFIG = REPO_ROOT / "configs" / "organize_files.yaml"
+RESULTS_FORMAT = 2
+MODES = ("dry-run", "preview", "move")
+
+# Rough share of a real downloads folder per category; others weigh 1.
+CATEGORY_WEIGHTS = {
+    "images": 30,
+    "pdf": 15,
+    "documents": 12,
+    "archives": 8,
+    "videos": 6,
+    "audio": 5,
+    "spreadsheets": 5,
+    "apps": 4,
+    "presentations": 3,
+    "code": 3,
+}
+
+
+def _parse_size(raw: str) -> int:
+    raw = raw.strip().lower()
+    for suffix, factor in (("m", 1_000_000), ("k", 1_000)):
+        if raw.endswith(suffix):
+            return int(float(raw[: -len(suffix)]) * factor)
+    return int(raw)
+
+
+def _bench_root() -> Path:
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else None
+    return Path(tempfile.mkdtemp(prefix="autoops-bench-", dir=base))
+
+
+def _extension_table(index: CategoryIndex) -> Tuple[List[str], List[float]]:
+    extensions: List[str] = []
+    weights: List[float] = []
+    by_category: Dict[str, List[str]] = index.as_dict()
+    for category, exts in by_category.items():
+        if not exts:
+            continue
+        share = CATEGORY_WEIGHTS.get(category, 1) / len(exts)
+        extensions.extend(exts)
+        weights.extend([share] * len(exts))
+    return extensions, weights
+
+
+def make_tree(
+    source: Path,
+    files: int,
+    index: CategoryIndex,
+    *,
+    collision_rate: float,
+    unknown_rate: float,
+    seed: int,
+) -> Dict[str, int]:
+    """
+    Create `files` empty files in `source`. A `collision_rate` share of them
+    also gets a same-named file in its category folder (forcing a rename on
+    move); an `unknown_rate` share gets an extension no category knows.
+    """
+    rng = random.Random(seed)
+    extensions, weights = _extension_table(index)
+    source.mkdir(parents=True)
+    made_dirs = set()
+    collisions = unknown = 0
+
+    flags = os.O_CREAT | os.O_WRONLY | os.O_EXCL
+    ext_choices = rng.choices(extensions, weights, k=files)
+    for i, ext in enumerate(ext_choices):
+        if rng.random() < unknown_rate:
+            ext = f".x{rng.randrange(10_000):04d}"
+            unknown += 1
+        name = f"file{i:07d}{ext}"
+        os.close(os.open(source / name, flags, 0o644))
+
+        if rng.random() < collision_rate:
+            category = index.lookup(name) or "others"
+            target_dir = source / category
+            if category not in made_dirs:
+                target_dir.mkdir(exist_ok=True)
+                made_dirs.add(category)
+            os.close(os.open(target_dir / name, flags, 0o644))
+            collisions += 1
+
+    return {"files": files, "collisions": collisions, "unknown": unknown}
+
+
+def _timed(fn) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - start, value
+
+
+def run_mode(
+    source: Path, index: CategoryIndex, mode: str, workers: int
+) -> Dict[str, Any]:
+    """
+    One instrumented run; phases are its exclusive span times (busy time
+    summed over threads for spans recorded on move workers).
+    """
+    metrics = Metrics()
+    with collecting(metrics):
+        total, result = _timed(
+            lambda: organize_files(
+                source_dir=source,
+                destination_dir=source,
+                categories=index,
+                others_dir="others",
+                dry_run=mode != "move",
+                preview=mode == "preview",
+                workers=workers,
+            )
+        )
+    spans = metrics.as_dict()["spans"]
+    return {
+        "phases": {name: span["seconds"] for name, span in spans.items()},
+        "total": total,
+        "files_per_second": result["moved_total"] / total if total else 0.0,
+        "moved_total": result["moved_total"],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    index = load_organize_files_config(Path(args.config)).category_index
+    base = Path(args.dir) if args.dir else _bench_root()
+    base.mkdir(parents=True, exist_ok=True)
+    results: List[Dict[str, Any]] = []
+    try:
+        for size in args.sizes:
+            for repeat in range(args.repeat):
+                tree_args = dict(
+                    collision_rate=args.collision_rate,
+                    unknown_rate=args.unknown_rate,
+                    seed=args.seed + repeat,
+                )
+                for mode in args.modes:
+                    # a fresh tree per mode: "move" leaves its tree organized
+                    source = base / f"tree-{size}-{repeat}-{mode}"
+                    gen_s, stats = _timed(
+                        lambda: make_tree(source, size, index, **tree_args)
+                    )
+                    outcome = run_mode(source, index, mode, args.workers)
+                    results.append(
+                        {"size": size, "mode": mode, "repeat": repeat, **outcome}
+                    )
+                    _report(size, mode, outcome)
+                    shutil.rmtree(source)
+                print(f"  (tree generated in {gen_s:.1f}s: {stats})", file=sys.stderr)
+    finally:
+        if not args.dir:
+            shutil.rmtree(base, ignore_errors=True)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "filesystem_dir": str(base),
+        "params": {
+            "sizes": args.sizes,
+            "modes": args.modes,
+            "workers": args.workers,
+            "collision_rate": args.collision_rate,
+            "unknown_rate": args.unknown_rate,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def _report(size: int, mode: str, outcome: Dict[str, Any]) -> None:
+    phases = "  ".join(f"{k}={v:.3f}s" for k, v in outcome["phases"].items())
+    print(
+        f"{size:>9} {mode:<8} total={outcome['total']:.3f}s "
+        f"({outcome['files_per_second']:,.0f} files/s)  {phases}",
+        file=sys.stderr,
+    )
+
+
+def _best(results: List[Dict[str, Any]]) -> Dict[Tuple[int, str], Dict[str, Any]]:
+    best: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    for r in results:
+        key = (r["size"], r["mode"])
+        if key not in best or r["total"] < best[key]["total"]:
+            best[key] = r
+    return best
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """
+    Print per-phase ratios (after / before, best of repeats); < 1 is faster.
+    """
+    before = _best(json.loads(Path(before_path).read_text())["results"])
+    after = _best(json.loads(Path(after_path).read_text())["results"])
+    for key in sorted(before.keys() & after.keys()):
+        b, a = before[key], after[key]
+        cells = [f"total {a['total'] / b['total']:.2f}x"]
+        for phase, seconds in a["phases"].items():
+            old = b["phases"].get(phase)
+            if old:
+                cells.append(f"{phase} {seconds / old:.2f}x")
+        print(f"{key[0]:>9} {key[1]:<8} " + "  ".join(cells))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["compare"]:
+        if len(argv) != 3:
+            sys.exit("usage: bench_organize.py compare BEFORE.json AFTER.json")
+        compare(argv[1], argv[2])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10k", help="comma list, e.g. 10k,100k,1M")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--collision-rate", type=float, default=0.05)
+    parser.add_argument("--unknown-rate", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG))
+    parser.add_argument("--dir", help="where to build trees (default: tmpfs)")
+    parser.add_argument("-o", "--output", help="write JSON results here")
+    args = parser.parse_args(argv)
+    args.sizes = [_parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    args.modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown_modes = set(args.modes) - set(MODES)
+    if unknown_modes:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown_modes))}")
+
+    report = run_benchmarks(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
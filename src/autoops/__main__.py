@@ -1,4 +1,4 @@
-from autoops.cli import entry
+from autoops.launcher import entry
 
 if __name__ == "__main__":
     entry()
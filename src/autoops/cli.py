@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import builtins
 import json
+import os
+import signal
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import typer
 
-from autoops.config.loader import load_organize_files_config
-from autoops.core.job import Job
-from autoops.core.registry import Registry
-from autoops.jobs.example import example_handler
-from autoops.jobs.organize_files import organize_files
+from autoops import __version__
+from autoops.jobs import build_registry
 
 app = typer.Typer(
     name="autoops",
@@ -20,61 +21,6 @@ app = typer.Typer(
 )
 
 
-def build_registry(
-    *,
-    config_path: Optional[Path] = None,
-    source_dir: Optional[Path] = None,
-    destination_dir: Optional[Path] = None,
-    dry_run: bool = True,
-    preview: bool = False,
-) -> Registry:
-    """
-    Builds and returns a registry with all available jobs.
-    """
-    registry = Registry()
-
-    # Example job
-    registry.register(
-        Job(
-            name="example",
-            description="Example job for demonstration purposes",
-            handler=example_handler,
-        )
-    )
-
-    # organize-files job (configurable via YAML + CLI overrides)
-    cfg_file = config_path or Path("configs/organize_files.yaml")
-    loaded = load_organize_files_config(
-        cfg_file,
-        source_dir=source_dir,
-        destination_dir=destination_dir,
-        dry_run=dry_run,
-    )
-
-    def organize_handler():
-        # preview = show what would be moved, without touching files
-        effective_dry_run = True if preview else loaded.dry_run
-
-        return organize_files(
-            source_dir=loaded.source_dir,
-            destination_dir=loaded.destination_dir,
-            categories=loaded.categories,
-            others_dir=loaded.others_dir,
-            dry_run=effective_dry_run,
-            preview=preview,
-        )
-
-    registry.register(
-        Job(
-            name="organize-files",
-            description="Organize files into categorized folders",
-            handler=organize_handler,
-        )
-    )
-
-    return registry
-
-
 def _safe_to_dict(obj) -> dict:
     """
     Best-effort conversion to dict for pretty JSON output.
@@ -87,7 +33,7 @@ def _safe_to_dict(obj) -> dict:
         return obj
 
     d = {}
-    for key in ("success", "message", "data", "error"):
+    for key in ("success", "message", "data", "error", "metrics", "cached"):
         if hasattr(obj, key):
             d[key] = getattr(obj, key)
 
@@ -100,6 +46,24 @@ def _safe_to_dict(obj) -> dict:
     return {"value": str(obj)}
 
 
+def _ndjson_line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _ndjson_move_sink() -> Callable[[Dict[str, Any]], None]:
+    """
+    Build an on_move callback that prints one NDJSON line per move, immediately.
+    """
+    lock = threading.Lock()
+
+    def sink(record: Dict[str, Any]) -> None:
+        line = _ndjson_line(record)
+        with lock:
+            typer.echo(line)
+
+    return sink
+
+
 def _print_human_job_summary(
     *,
     job_name: str,
@@ -118,6 +82,8 @@ def _print_human_job_summary(
     mode = "PREVIEW" if preview else ("DRY-RUN" if data.get("dry_run") else "RUN")
 
     typer.echo(f"{header_icon} {job_name} ({mode})")
+    if d.get("cached"):
+        typer.echo("Inputs unchanged: reused the last run's result (--force to rerun)")
 
     source = data.get("source_dir")
     dest = data.get("destination_dir")
@@ -125,6 +91,14 @@ def _print_human_job_summary(
         typer.echo(f"Source: {source}")
     if dest:
         typer.echo(f"Destination: {dest}")
+    for shard in data.get("sources") or []:
+        if shard.get("error"):
+            typer.secho(
+                f"  ❌ {shard['source_dir']}: {shard['error']}", fg=typer.colors.RED
+            )
+        else:
+            run = f" (run id: {shard['run_id']})" if shard.get("run_id") else ""
+            typer.echo(f"  {shard['source_dir']}: {shard['moved_total']} file(s){run}")
 
     moved_total = data.get("moved_total")
     if moved_total is not None:
@@ -138,6 +112,20 @@ def _print_human_job_summary(
             for k, v in sorted(non_zero.items(), key=lambda kv: (-kv[1], kv[0])):
                 typer.echo(f"  {k}: {v}")
 
+    if data.get("stale") or data.get("missing"):
+        typer.echo(
+            f"Skipped: {data.get('stale', 0)} changed since planned, "
+            f"{data.get('missing', 0)} missing"
+        )
+
+    duplicates = data.get("duplicates")
+    if isinstance(duplicates, dict) and duplicates.get("total"):
+        typer.echo(f"\nDuplicates ({duplicates['action']}): {duplicates['total']}")
+
+    run_id = data.get("run_id")
+    if run_id:
+        typer.echo(f"\nRun id: {run_id} (undo with: autoops undo {run_id})")
+
     preview_moves = data.get("preview_moves") or []
     if preview and preview_moves:
         typer.echo("\nPreview moves:")
@@ -157,17 +145,84 @@ def _print_human_job_summary(
 
             shown += 1
 
+    metrics = d.get("metrics")
+    if isinstance(metrics, dict):
+        _print_metrics(metrics)
+
     err = d.get("error")
     if err:
         typer.secho(f"\nError: {err}", fg=typer.colors.RED)
 
 
+def _print_metrics(metrics: Dict[str, Any]) -> None:
+    """
+    Print the timing spans (slowest first) and counters of an instrumented run.
+    """
+    spans = metrics.get("spans") or {}
+    typer.echo(f"\nTiming: {metrics.get('wall_seconds', 0):.3f}s total")
+    ordered = sorted(spans.items(), key=lambda kv: -kv[1]["seconds"])
+    for name, span in ordered:
+        typer.echo(f"  {name:<10} {span['seconds']:>9.3f}s  ({span['calls']} calls)")
+
+    counters = metrics.get("counters") or {}
+    if counters:
+        typer.echo("Counters:")
+        for name, value in sorted(counters.items()):
+            typer.echo(f"  {name}: {value}")
+
+    copy_seconds = (spans.get("copy") or {}).get("seconds")
+    if counters.get("bytes_copied") and copy_seconds:
+        mib = counters["bytes_copied"] / (1024 * 1024)
+        typer.echo(
+            f"Copied across filesystems: {counters.get('files_copied', 0)} file(s),"
+            f" {mib:.1f} MiB at {mib / copy_seconds:.1f} MiB/s"
+        )
+
+
+_HISTORY_HELP = "Record the run in the run history (see: autoops history)"
+_FORCE_HELP = (
+    "Run even if the job's inputs are unchanged since its last successful run "
+    "(default: reuse that run's result)"
+)
+
+
+def _record_history(runs) -> None:
+    """
+    Record finished runs: (job name, JobResult, seconds, finished_at or None).
+    """
+    from autoops.utils.history import record_runs
+
+    if not record_runs(runs):
+        typer.secho(
+            "⚠️  Could not write the run history", fg=typer.colors.YELLOW, err=True
+        )
+
+
+def _batch_history(result, job_names: Optional[Dict[str, str]] = None) -> List[tuple]:
+    """
+    History rows for a run_many/pipeline result (jobs that actually ran).
+    job_names maps pipeline step names to the jobs they ran.
+    """
+    job_names = job_names or {}
+    batch_start = time.time() - result.seconds
+    return [
+        (
+            job_names.get(r.name, r.name),
+            r.result,
+            r.seconds,
+            batch_start + r.started_at + r.seconds,
+        )
+        for r in result.runs
+        if r.started_at is not None
+    ]
+
+
 @app.command()
 def version() -> None:
     """
     Show the current version of AutoOps.
     """
-    typer.echo("AutoOps version 0.1.0")
+    typer.echo(f"AutoOps version {__version__}")
 
 
 @app.command("list")
@@ -198,9 +253,41 @@ def run(
     preview: bool = typer.Option(
         False, "--preview", help="Show what would be moved without touching files"
     ),
+    recursive: Optional[bool] = typer.Option(
+        None,
+        "--recursive/--no-recursive",
+        help="Also organize files in subdirectories (default: from config)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Threads used to move files (default: from config, 1 = serial)",
+    ),
+    incremental: Optional[bool] = typer.Option(
+        None,
+        "--incremental/--no-incremental",
+        help="Skip files and folders unchanged since the last run (default: config)",
+    ),
+    journal: Optional[bool] = typer.Option(
+        None,
+        "--journal/--no-journal",
+        help="Journal every move so the run can be resumed or undone (default: config)",
+    ),
+    resume: Optional[str] = typer.Option(
+        None,
+        "--resume",
+        metavar="RUN_ID",
+        help="Finish an interrupted journaled run before organizing new files",
+    ),
     json_out: bool = typer.Option(
         False, "--json", help="Print full JSON output (developer/automation friendly)"
     ),
+    output: str = typer.Option(
+        "human",
+        "--output",
+        help="Output format: human, json, or ndjson (one record per move, streamed)",
+    ),
     quiet: bool = typer.Option(
         False,
         "--quiet",
@@ -209,20 +296,45 @@ def run(
     max_preview: int = typer.Option(
         20, "--max-preview", min=0, help="Max preview items to print (0 = none)"
     ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        help="Write a cProfile dump of the run here (main thread only; "
+        "inspect with python -m pstats)",
+    ),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help=_HISTORY_HELP
+    ),
+    force: bool = typer.Option(False, "--force", help=_FORCE_HELP),
 ) -> None:
     """
     Run a job by name.
     """
+    if json_out:
+        output = "json"
+    if output not in ("human", "json", "ndjson"):
+        typer.secho(f"❌ Unknown output format: {output}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    ndjson = output == "ndjson" and not quiet
+
     if job_name == "organize-files":
         if destination_dir is None and source_dir is not None:
             destination_dir = source_dir
 
     registry = build_registry(
+        for_job=job_name,
         config_path=config,
         source_dir=source_dir,
         destination_dir=destination_dir,
         dry_run=dry_run,
         preview=preview,
+        recursive=recursive,
+        workers=workers,
+        incremental=incremental,
+        journal=journal,
+        resume=resume,
+        on_move=_ndjson_move_sink() if ndjson else None,
+        preview_limit=max_preview if ndjson else None,
     )
 
     job = registry.get(job_name)
@@ -231,16 +343,47 @@ def run(
             typer.secho(f"❌ Job not found: {job_name}", fg=typer.colors.RED)
         raise typer.Exit(code=2)
 
-    result = job.run()
+    # timing spans/counters are shown in every output mode except --quiet
+    # (the history keeps the result's own totals, it needs no instrumentation)
+    instrument = not quiet
+    cache = None
+    if job.fingerprint is not None:
+        from autoops.core.memo import ResultCache
+
+        cache = ResultCache()
+    start = time.perf_counter()
+    if profile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        result = profiler.runcall(
+            job.run, instrument=instrument, cache=cache, force=force
+        )
+        profiler.dump_stats(str(profile))
+    else:
+        result = job.run(instrument=instrument, cache=cache, force=force)
+    if cache is not None:
+        cache.close()
+    if history:
+        _record_history([(job_name, result, time.perf_counter() - start, None)])
 
     if quiet:
         d = _safe_to_dict(result)
         ok = bool(d.get("success", True))
         raise typer.Exit(code=0 if ok else 1)
 
-    if json_out:
+    if ndjson:
         d = _safe_to_dict(result)
-        typer.echo(json.dumps(d, ensure_ascii=False, indent=2))
+        data = d.get("data")
+        if isinstance(data, dict) and "preview_moves" in data:
+            # moves were already streamed as individual records
+            d["data"] = {k: v for k, v in data.items() if k != "preview_moves"}
+        typer.echo(_ndjson_line({"type": "summary", **d}))
+        return
+
+    if output == "json":
+        d = _safe_to_dict(result)
+        typer.echo(json.dumps(d, ensure_ascii=False, indent=2, default=str))
         return
 
     _print_human_job_summary(
@@ -251,9 +394,759 @@ def run(
     )
 
 
+@app.command("run-many")
+def run_many_cmd(
+    job_names: List[str] = typer.Argument(..., help="Jobs to run together"),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Path to a YAML config file"
+    ),
+    dry_run: bool = typer.Option(
+        True, "--dry-run/--no-dry-run", help="Do not move files (default: dry-run)"
+    ),
+    max_parallel: int = typer.Option(
+        4, "--max-parallel", min=1, help="Jobs running at the same time"
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Do not start the remaining jobs once one has failed",
+    ),
+    isolate: bool = typer.Option(
+        False,
+        "--isolate",
+        help="Run each job in a worker process (uses all cores for CPU-bound jobs)",
+    ),
+    timeout: Optional[float] = typer.Option(
+        None,
+        "--timeout",
+        min=0,
+        help="Kill a job running longer than this many seconds (implies --isolate)",
+    ),
+    memory_limit: Optional[int] = typer.Option(
+        None,
+        "--memory-limit",
+        min=1,
+        metavar="MB",
+        help="Address-space limit of each worker process (implies --isolate)",
+    ),
+    json_out: bool = typer.Option(False, "--json", help="Print full JSON output"),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        help="Print nothing (exit code still indicates success/failure)",
+    ),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help=_HISTORY_HELP
+    ),
+) -> None:
+    """
+    Run several jobs concurrently in this process.
+    """
+    from autoops.core.runner import run_many
+    from autoops.jobs import BUILTIN_JOBS
+
+    builtin = {spec.name for spec in BUILTIN_JOBS}
+    registry = build_registry(
+        plugins=not set(job_names) <= builtin,
+        config_path=config,
+        dry_run=dry_run,
+    )
+    unknown = [name for name in job_names if registry.describe(name) is None]
+    if unknown:
+        if not quiet:
+            typer.secho(
+                f"❌ Job not found: {', '.join(unknown)}", fg=typer.colors.RED
+            )
+        raise typer.Exit(code=2)
+
+    pool = None
+    if isolate or timeout is not None or memory_limit is not None:
+        from autoops.core.process_pool import ProcessJobPool
+
+        pool = ProcessJobPool(
+            min(max_parallel, len(set(job_names))),
+            memory_limit=memory_limit * 1024 * 1024 if memory_limit else None,
+        )
+    try:
+        result = run_many(
+            registry,
+            job_names,
+            max_parallel=max_parallel,
+            fail_fast=fail_fast,
+            instrument=json_out,
+            pool=pool,
+            timeout=timeout,
+        )
+    finally:
+        if pool is not None:
+            pool.close()
+    if history:
+        _record_history(_batch_history(result))
+
+    if json_out:
+        typer.echo(
+            json.dumps(result.to_dict(), ensure_ascii=False, indent=2, default=str)
+        )
+    elif not quiet:
+        for job_run in result.runs:
+            icon = "✅" if job_run.status == "succeeded" else "❌"
+            typer.echo(
+                f"{icon} {job_run.name}: {job_run.status} "
+                f"({job_run.seconds:.3f}s) {job_run.result.message}"
+            )
+        ok = sum(1 for r in result.runs if r.status == "succeeded")
+        typer.echo(
+            f"\n{ok}/{len(result.runs)} job(s) succeeded in {result.seconds:.3f}s"
+        )
+
+    if not result.success:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def pipeline(
+    pipeline_file: Path = typer.Argument(..., help="YAML pipeline definition"),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Path to a YAML config file (for every step)"
+    ),
+    dry_run: bool = typer.Option(
+        True, "--dry-run/--no-dry-run", help="Do not move files (default: dry-run)"
+    ),
+    max_parallel: Optional[int] = typer.Option(
+        None,
+        "--max-parallel",
+        min=1,
+        help="Steps running at the same time (default: from the pipeline file)",
+    ),
+    isolate: bool = typer.Option(
+        False, "--isolate", help="Run each step in a worker process"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None,
+        "--timeout",
+        min=0,
+        help="Kill a step running longer than this many seconds (implies --isolate)",
+    ),
+    json_out: bool = typer.Option(False, "--json", help="Print full JSON output"),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        help="Print nothing (exit code still indicates success/failure)",
+    ),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help=_HISTORY_HELP
+    ),
+) -> None:
+    """
+    Run a pipeline of dependent jobs, independent branches in parallel.
+    """
+    from autoops.config.loader import load_pipeline_config
+    from autoops.core.pipeline import Pipeline, run_pipeline
+
+    try:
+        loaded = load_pipeline_config(pipeline_file)
+        dag = Pipeline.from_config(loaded)
+    except (FileNotFoundError, ValueError) as e:
+        if not quiet:
+            typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+
+    registry = build_registry(config_path=config, dry_run=dry_run)
+    pool = None
+    if isolate or timeout is not None:
+        from autoops.core.process_pool import ProcessJobPool
+
+        pool = ProcessJobPool(max_parallel or loaded.max_parallel)
+    try:
+        result = run_pipeline(
+            registry,
+            dag,
+            max_parallel=max_parallel or loaded.max_parallel,
+            instrument=json_out,
+            pool=pool,
+            timeout=timeout,
+        )
+    except ValueError as e:
+        if not quiet:
+            typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    finally:
+        if pool is not None:
+            pool.close()
+    if history:
+        _record_history(
+            _batch_history(result, {step.name: step.job for step in dag.steps})
+        )
+
+    if json_out:
+        typer.echo(
+            json.dumps(result.to_dict(), ensure_ascii=False, indent=2, default=str)
+        )
+    elif not quiet:
+        icons = {"succeeded": "✅", "skipped": "⏭️ "}
+        for step in result.runs:
+            timing = (
+                f"+{step.started_at:.3f}s, {step.seconds:.3f}s"
+                if step.started_at is not None
+                else "not run"
+            )
+            typer.echo(
+                f"{icons.get(step.status, '❌')} {step.name}: {step.status} "
+                f"({timing}) {step.result.message}"
+            )
+        typer.echo(
+            f"\nCritical path: {' -> '.join(result.critical_path) or '-'} "
+            f"({result.critical_path_seconds:.3f}s of {result.seconds:.3f}s)"
+        )
+
+    if not result.success:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def schedule(
+    schedule_file: Path = typer.Argument(..., help="YAML file with a schedule section"),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Path to a YAML config file (for every job)"
+    ),
+    dry_run: bool = typer.Option(
+        True, "--dry-run/--no-dry-run", help="Do not move files (default: dry-run)"
+    ),
+    max_parallel: Optional[int] = typer.Option(
+        None,
+        "--max-parallel",
+        min=1,
+        help="Jobs running at the same time (default: from the schedule file)",
+    ),
+    output: str = typer.Option(
+        "human", "--output", help="Output format: human or ndjson"
+    ),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help=_HISTORY_HELP
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Run every occurrence, even when the job's inputs are unchanged",
+    ),
+) -> None:
+    """
+    Stay resident and run jobs on their cron or interval schedules (Ctrl+C to stop).
+    """
+    if output not in ("human", "ndjson"):
+        typer.secho(f"❌ Unknown output format: {output}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+
+    from autoops.config.loader import load_schedule_config
+    from autoops.core.memo import ResultCache
+    from autoops.core.scheduler import ScheduledJob, Scheduler
+
+    import sqlite3
+
+    from autoops.utils.history import RunHistory
+
+    lock = threading.Lock()
+    # one store for the daemon's lifetime: runs are written in batches
+    run_history = RunHistory() if history else None
+    cache = None if force else ResultCache()
+    jobs_of: Dict[str, str] = {}
+
+    def report(job_run) -> None:
+        if run_history is not None:
+            try:
+                run_history.record(
+                    jobs_of[job_run.name], job_run.result, job_run.seconds
+                )
+            except (sqlite3.Error, OSError):
+                typer.secho(
+                    "⚠️  Could not write the run history",
+                    fg=typer.colors.YELLOW,
+                    err=True,
+                )
+        if output == "ndjson":
+            line = _ndjson_line({"type": "run", **job_run.to_dict()})
+        else:
+            icon = "✅" if job_run.status == "succeeded" else "❌"
+            cached = " (cached)" if job_run.result.cached else ""
+            line = (
+                f"{time.strftime('%Y-%m-%d %H:%M:%S')} {icon} {job_run.name} "
+                f"({job_run.seconds:.3f}s) {job_run.result.message}{cached}"
+            )
+        with lock:
+            typer.echo(line)
+
+    try:
+        loaded = load_schedule_config(schedule_file)
+        scheduler = Scheduler(
+            build_registry(config_path=config, dry_run=dry_run),
+            [
+                ScheduledJob(
+                    name=e.name,
+                    job=e.job,
+                    cron=e.cron,
+                    every=e.every,
+                    jitter=e.jitter,
+                    catch_up=e.catch_up,
+                    options=e.options,
+                )
+                for e in loaded.entries
+            ],
+            max_parallel=max_parallel or loaded.max_parallel,
+            on_run=report,
+            cache=cache,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+    jobs_of.update((e.name, e.job) for e in loaded.entries)
+
+    if output == "human":
+        names = ", ".join(scheduler.entries)
+        typer.echo(f"⏰ Scheduling {names} (Ctrl+C to stop)")
+
+    # SIGTERM (service managers) stops like Ctrl+C: running jobs finish and
+    # the buffered history rows are written before the process exits
+    stop = threading.Event()
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    try:
+        scheduler.run(stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        if cache is not None:
+            cache.close()
+        if run_history is not None:
+            try:
+                run_history.close()
+            except (sqlite3.Error, OSError):
+                pass
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    """
+    A point in time from a duration ago ("7d", "12h") or an ISO date/time.
+    """
+    if value is None:
+        return None
+    from datetime import datetime
+
+    from autoops.config.loader import parse_duration
+
+    try:
+        return time.time() - parse_duration(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise typer.BadParameter(
+            f"expected a duration ago (7d, 12h) or an ISO date: '{value}'"
+        ) from None
+
+
+def _format_time(ts: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
+@app.command("history")
+def history_cmd(
+    job: Optional[str] = typer.Option(None, "--job", help="Only runs of this job"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Runs started after this (7d, 12h or an ISO date)"
+    ),
+    until: Optional[str] = typer.Option(
+        None, "--until", help="Runs started before this (7d, 12h or an ISO date)"
+    ),
+    failed: bool = typer.Option(False, "--failed", help="Only failed runs"),
+    limit: int = typer.Option(20, "--limit", min=1, help="Max runs to list"),
+    stats: bool = typer.Option(
+        False, "--stats", help="Per-job p50/p95 duration and failure rate instead"
+    ),
+    compact: Optional[str] = typer.Option(
+        None,
+        "--compact",
+        metavar="KEEP",
+        help="Delete runs older than KEEP (e.g. 30d) and shrink the database",
+    ),
+    json_out: bool = typer.Option(False, "--json", help="Print full JSON output"),
+) -> None:
+    """
+    Show recorded job runs.
+    """
+    from autoops.config.loader import parse_duration
+    from autoops.utils.history import RunHistory
+
+    since_ts = _parse_time(since)
+    until_ts = _parse_time(until)
+
+    with RunHistory() as run_history:
+        if compact is not None:
+            try:
+                keep = parse_duration(compact)
+            except ValueError as e:
+                raise typer.BadParameter(str(e), param_hint="--compact") from None
+            deleted = run_history.compact(keep)
+            if json_out:
+                typer.echo(json.dumps({"deleted": deleted}))
+            else:
+                typer.echo(f"🧹 Deleted {deleted} run(s) older than {compact}")
+            return
+
+        if stats:
+            rows = run_history.stats(job=job, since=since_ts, until=until_ts)
+            if json_out:
+                typer.echo(json.dumps([r.to_dict() for r in rows], indent=2))
+                return
+            if not rows:
+                typer.echo("No runs recorded.")
+            for r in rows:
+                typer.echo(
+                    f"{r.job}: {r.runs} run(s), {r.failure_rate:.1%} failed, "
+                    f"p50 {r.p50:.3f}s, p95 {r.p95:.3f}s, "
+                    f"last {_format_time(r.last_run)}"
+                )
+            return
+
+        entries = run_history.query(
+            job=job,
+            since=since_ts,
+            until=until_ts,
+            success=False if failed else None,
+            limit=limit,
+        )
+
+    if json_out:
+        typer.echo(
+            json.dumps([e.to_dict() for e in entries], ensure_ascii=False, indent=2)
+        )
+        return
+    if not entries:
+        typer.echo("No runs recorded.")
+    for e in entries:
+        icon = "✅" if e.success else "❌"
+        line = f"{_format_time(e.started_at)} {icon} {e.job} ({e.duration:.3f}s)"
+        if e.error:
+            line += f" {e.error}"
+        typer.echo(line)
+
+
+@app.command()
+def watch(
+    job_name: str = typer.Argument(..., help="Job to keep running (organize-files)"),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Path to a YAML config file"
+    ),
+    source_dir: Optional[Path] = typer.Option(
+        None, "--source-dir", help="Override the source directory"
+    ),
+    destination_dir: Optional[Path] = typer.Option(
+        None, "--destination-dir", help="Override the destination directory"
+    ),
+    dry_run: bool = typer.Option(
+        True, "--dry-run/--no-dry-run", help="Do not move files (default: dry-run)"
+    ),
+    polling: Optional[bool] = typer.Option(
+        None,
+        "--polling/--no-polling",
+        help="Poll instead of using inotify (default: from config)",
+    ),
+    output: str = typer.Option(
+        "human", "--output", help="Output format: human or ndjson"
+    ),
+) -> None:
+    """
+    Keep a job resident and run it as files arrive (Ctrl+C to stop).
+    """
+    if job_name != "organize-files":
+        typer.secho(
+            f"❌ Job does not support watch mode: {job_name}", fg=typer.colors.RED
+        )
+        raise typer.Exit(code=2)
+    if output not in ("human", "ndjson"):
+        typer.secho(f"❌ Unknown output format: {output}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+
+    from autoops.config.loader import load_organize_files_config
+    from autoops.jobs.organize_watch import watch_organize
+
+    if destination_dir is None and source_dir is not None:
+        destination_dir = source_dir
+
+    try:
+        loaded = load_organize_files_config(
+            config or Path("configs/organize_files.yaml"),
+            source_dir=source_dir,
+            destination_dir=destination_dir,
+            dry_run=dry_run,
+        )
+        if loaded.sources:
+            raise ValueError("Watch mode covers one source folder (use --source-dir)")
+    except (OSError, ValueError) as e:
+        typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    def on_batch(result: Dict[str, Any]) -> None:
+        if output == "ndjson":
+            data = {k: v for k, v in result.items() if k != "preview_moves"}
+            typer.echo(_ndjson_line({"type": "batch", **data}))
+            return
+        label = "Would move" if result.get("dry_run") else "Moved"
+        counts = ", ".join(
+            f"{k}: {v}" for k, v in sorted(result["moved_by_category"].items()) if v
+        )
+        typer.echo(f"{label} {result['moved_total']} file(s)  {counts}")
+
+    def on_error(exc: Exception, files: List[str]) -> None:
+        if output == "ndjson":
+            typer.echo(
+                _ndjson_line({"type": "error", "error": str(exc), "files": files})
+            )
+            return
+        typer.secho(
+            f"❌ {len(files)} file(s) not organized: {exc}",
+            fg=typer.colors.RED,
+            err=True,
+        )
+
+    if output == "human":
+        typer.echo(f"👀 Watching {loaded.source_dir} (Ctrl+C to stop)")
+
+    try:
+        watch_organize(
+            loaded,
+            dry_run=loaded.dry_run,
+            on_batch=on_batch,
+            on_move=_ndjson_move_sink() if output == "ndjson" else None,
+            force_polling=polling,
+            on_error=on_error,
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command("plan")
+def plan_cmd(
+    job_name: str = typer.Argument(..., help="Job to plan (organize-files)"),
+    output_path: Path = typer.Option(
+        ..., "-o", "--output", help="Write the plan to this file"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Path to a YAML config file"
+    ),
+    source_dir: Optional[Path] = typer.Option(
+        None, "--source-dir", help="Override the source directory"
+    ),
+    destination_dir: Optional[Path] = typer.Option(
+        None, "--destination-dir", help="Override the destination directory"
+    ),
+    recursive: Optional[bool] = typer.Option(
+        None,
+        "--recursive/--no-recursive",
+        help="Also plan files in subdirectories (default: from config)",
+    ),
+    json_out: bool = typer.Option(False, "--json", help="Print full JSON output"),
+    max_preview: int = typer.Option(
+        20, "--max-preview", min=0, help="Max planned moves to print (0 = none)"
+    ),
+) -> None:
+    """
+    Decide what a run would move and save it as a plan (see: autoops apply).
+    """
+    if job_name != "organize-files":
+        typer.secho(
+            f"❌ Job cannot be planned: {job_name} (only organize-files)",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=2)
+
+    from autoops.config.loader import load_organize_files_config
+    from autoops.jobs.organize_files import plan_organize
+
+    if destination_dir is None and source_dir is not None:
+        destination_dir = source_dir
+    try:
+        loaded = load_organize_files_config(
+            config or Path("configs/organize_files.yaml"),
+            source_dir=source_dir,
+            destination_dir=destination_dir,
+            recursive=recursive,
+        )
+        if loaded.sources:
+            raise ValueError("A plan covers one source folder (use --source-dir)")
+        move_plan = plan_organize(
+            loaded.source_dir,
+            loaded.destination_dir,
+            loaded.category_index,
+            loaded.others_dir,
+            recursive=loaded.recursive,
+            max_depth=loaded.max_depth,
+            exclude=loaded.exclude,
+            sniff=loaded.sniff,
+        )
+        size = move_plan.write(output_path)
+    except (OSError, ValueError) as e:
+        typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    counts = move_plan.counts()
+    if json_out:
+        payload = {
+            "plan": str(output_path),
+            "bytes": size,
+            "source_dir": move_plan.source_dir,
+            "destination_dir": move_plan.destination_dir,
+            "moved_total": len(move_plan),
+            "moved_by_category": counts,
+        }
+        typer.echo(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    typer.echo(
+        f"📝 Planned {len(move_plan)} move(s) -> {output_path} ({size} bytes)"
+    )
+    typer.echo(f"Source: {move_plan.source_dir}")
+    typer.echo(f"Destination: {move_plan.destination_dir}")
+    for k, v in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
+        if v:
+            typer.echo(f"  {k}: {v}")
+    for i, entry in enumerate(move_plan.entries()):
+        if i >= max_preview:
+            typer.echo(f"  ... and {len(move_plan) - i} more")
+            break
+        rel_source = os.path.join(move_plan.dirs[entry.dir_id], entry.name)
+        category = move_plan.categories[entry.category_id]
+        typer.echo(f"  {rel_source}  ->  {os.path.join(category, entry.name)}")
+    typer.echo(f"\nApply with: autoops apply {output_path}")
+
+
+@app.command()
+def apply(
+    plan_file: Path = typer.Argument(..., help="Plan written by autoops plan"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Only check the plan against the files"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Threads used to move files (1 = serial)"
+    ),
+    journal: bool = typer.Option(
+        False,
+        "--journal/--no-journal",
+        help="Journal every move so the run can be undone",
+    ),
+    json_out: bool = typer.Option(False, "--json", help="Print full JSON output"),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help=_HISTORY_HELP
+    ),
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        help="YAML config to take the throttle and transfer settings from",
+    ),
+) -> None:
+    """
+    Move the files of a saved plan, skipping files changed since it was made.
+    """
+    from autoops.config.loader import load_organize_files_config
+    from autoops.core.job import Job
+    from autoops.jobs.organize_files import apply_plan
+    from autoops.utils.journal import MoveJournal
+    from autoops.utils.plan import MovePlan
+
+    try:
+        move_plan = MovePlan.read(plan_file)
+    except (OSError, ValueError) as e:
+        typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+
+    throttle = transfer = None
+    if config is not None:
+        try:
+            loaded = load_organize_files_config(
+                config, source_dir=Path(move_plan.source_dir)
+            )
+        except (OSError, ValueError) as e:
+            typer.secho(f"❌ {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=2)
+        throttle, transfer = loaded.throttle, loaded.transfer
+
+    def apply_handler() -> Dict[str, Any]:
+        move_journal = None
+        if journal and not dry_run:
+            move_journal = MoveJournal.create(
+                source_dir=move_plan.source_dir,
+                destination_dir=move_plan.destination_dir,
+            )
+        status = "failed"
+        try:
+            result = apply_plan(
+                move_plan,
+                workers=workers,
+                journal=move_journal,
+                dry_run=dry_run,
+                throttle=throttle,
+                transfer=transfer,
+            )
+            status = "completed"
+            return result
+        finally:
+            if move_journal is not None:
+                move_journal.close(status)
+
+    start = time.perf_counter()
+    result = Job("organize-files", "", apply_handler).run(instrument=True)
+    if history:
+        _record_history(
+            [("organize-files", result, time.perf_counter() - start, None)]
+        )
+
+    if json_out:
+        d = _safe_to_dict(result)
+        typer.echo(json.dumps(d, ensure_ascii=False, indent=2, default=str))
+    else:
+        _print_human_job_summary(
+            job_name=f"apply {plan_file}",
+            result=result,
+            preview=False,
+            max_preview=0,
+        )
+    if not result.success:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def undo(
+    run_id: str = typer.Argument(..., help="Run id printed by a journaled run"),
+    json_out: bool = typer.Option(False, "--json", help="Print full JSON output"),
+) -> None:
+    """
+    Move the files of a journaled run back to where they came from.
+    """
+    from autoops.utils.journal import undo_run
+
+    try:
+        result = undo_run(run_id)
+    except (FileNotFoundError, ValueError) as e:
+        typer.secho(f"❌ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+
+    if json_out:
+        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        typer.echo(f"↩️  Restored {result['restored']} file(s) from run {run_id}")
+        for path in result["conflicts"]:
+            typer.echo(f"  kept (original path is taken): {path}")
+        for path in result["missing"]:
+            typer.echo(f"  missing: {path}")
+
+    if result["conflicts"] or result["missing"]:
+        raise typer.Exit(code=1)
+
+
 def entry() -> None:
     """
-    Console entry point (used by [project.scripts]).
+    Run the full typer CLI (the console script goes through
+    autoops.launcher first, which falls back to this app).
     """
     app()
 
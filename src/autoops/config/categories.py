@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+def _normalize_extension(raw: str) -> str:
+    """
+    Normalize an extension to its lookup form: lowercase, single leading dot.
+    "PDF" -> ".pdf", ".Tar.GZ" -> ".tar.gz"
+    """
+    ext = str(raw).strip().lower()
+    if not ext:
+        return ""
+    if not ext.startswith("."):
+        ext = "." + ext
+    return ext
+
+
+def _rebuild_index(
+    categories: Tuple[str, ...],
+    by_extension: Dict[str, str],
+    max_parts: int,
+    conflicts: Tuple[Tuple[str, str, str], ...],
+) -> "CategoryIndex":
+    return CategoryIndex(
+        categories=categories,
+        by_extension=MappingProxyType(by_extension),
+        max_parts=max_parts,
+        conflicts=conflicts,
+    )
+
+
+@dataclass(frozen=True)
+class CategoryIndex:
+    """
+    Frozen extension -> category lookup table.
+
+    Built once (usually by the config loader) so classifying a file is a few
+    dict lookups instead of a scan over every category list.
+    Multi-part suffixes (".tar.gz") are supported; the longest match wins.
+    """
+
+    categories: Tuple[str, ...]
+    by_extension: Mapping[str, str]
+    max_parts: int = 1
+    conflicts: Tuple[Tuple[str, str, str], ...] = field(default=())
+
+    @classmethod
+    def compile(cls, categories: Mapping[str, Iterable[str]]) -> "CategoryIndex":
+        """
+        Compile a {category: [extensions]} mapping into an index.
+
+        When an extension is declared in more than one category, the first
+        category (in mapping order) keeps it and the clash is recorded in
+        `conflicts` as (extension, kept_category, ignored_category).
+        """
+        by_extension: Dict[str, str] = {}
+        conflicts: List[Tuple[str, str, str]] = []
+        max_parts = 1
+
+        for category, extensions in categories.items():
+            for raw in extensions:
+                ext = _normalize_extension(raw)
+                if not ext or ext == ".":
+                    continue
+
+                owner = by_extension.get(ext)
+                if owner is not None:
+                    if owner != category:
+                        conflicts.append((ext, owner, category))
+                    continue
+
+                by_extension[ext] = category
+                max_parts = max(max_parts, ext.count("."))
+
+        return cls(
+            categories=tuple(categories.keys()),
+            by_extension=MappingProxyType(by_extension),
+            max_parts=max_parts,
+            conflicts=tuple(conflicts),
+        )
+
+    def __reduce__(self):
+        # MappingProxyType cannot be pickled: store the dict, re-wrap on load
+        return (
+            _rebuild_index,
+            (self.categories, dict(self.by_extension), self.max_parts, self.conflicts),
+        )
+
+    def lookup(self, filename: str) -> Optional[str]:
+        """
+        Return the category for a file name, or None when no suffix matches.
+        Leading dots (".env") are part of the name, not a suffix, like Path.suffix.
+        """
+        name = filename.lower().lstrip(".")
+        if not name or name.endswith("."):
+            return None
+
+        parts = name.split(".")
+        by_extension = self.by_extension
+        for n in range(min(self.max_parts, len(parts) - 1), 0, -1):
+            category = by_extension.get("." + ".".join(parts[-n:]))
+            if category is not None:
+                return category
+        return None
+
+    def as_dict(self) -> Dict[str, List[str]]:
+        """
+        Expand the index back into a {category: [extensions]} mapping.
+        """
+        out: Dict[str, List[str]] = {category: [] for category in self.categories}
+        for ext, category in self.by_extension.items():
+            out[category].append(ext)
+        return out
@@ -1,10 +1,112 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import glob
+import hashlib
+import os
+import pickle
+import warnings
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+from autoops.config.categories import CategoryIndex
+from autoops.utils.appdirs import cache_dir
+
+# Bump when OrganizeFilesLoadedConfig (or anything it contains) changes shape
+_CONFIG_CACHE_FORMAT = 4
+
+# Configs loaded by this process, by cache path: long-running processes
+# (autoops schedule, watch) skip even the pickle load while the file is
+# unchanged.
+_MEMORY_CACHE: Dict[Path, Tuple[Tuple[int, int, str], OrganizeFilesLoadedConfig]] = {}
+
+
+@dataclass(frozen=True)
+class OrganizeWatchConfig:
+    """
+    Settings for `autoops watch organize-files` (organize_files.watch in YAML).
+    """
+
+    settle_seconds: float = 0.3
+    debounce_seconds: float = 0.1
+    poll_interval: float = 1.0
+    polling: bool = False
+    hold_categories: Tuple[str, ...] = ("partial_downloads",)
+
+
+DEDUP_ACTIONS = ("skip", "hardlink", "quarantine")
+
+
+@dataclass(frozen=True)
+class OrganizeDedupConfig:
+    """
+    Duplicate detection settings (organize_files.dedup in YAML).
+    action: skip (leave duplicates in the source), hardlink (replace them with a
+    hard link to the existing copy) or quarantine (move them to quarantine_dir).
+    """
+
+    enabled: bool = False
+    action: str = "skip"
+    quarantine_dir: str = "duplicates"
+    hash_workers: int = 4
+
+
+@dataclass(frozen=True)
+class OrganizeSniffConfig:
+    """
+    Content sniffing for files whose extension matches no category
+    (organize_files.sniff in YAML).
+    """
+
+    enabled: bool = False
+    workers: int = 4
+
+
+@dataclass(frozen=True)
+class OrganizeThrottleConfig:
+    """
+    I/O limits for moves (organize_files.throttle in YAML), shared by the
+    move threads of a run: bytes_per_second caps copied bytes (a rename
+    within one filesystem copies none), ops_per_second caps moves. With
+    target_latency (seconds), moves pause while their latency stays above
+    it. nice (the niceness to run at, 0-19) and ionice (idle, best-effort
+    with ionice_level 0-7) lower the CPU and I/O priority of the run's move
+    threads (Linux).
+    """
+
+    bytes_per_second: Optional[int] = None
+    ops_per_second: Optional[float] = None
+    target_latency: Optional[float] = None
+    nice: Optional[int] = None
+    ionice: Optional[str] = None
+    ionice_level: int = 7
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            v is not None
+            for v in (
+                self.bytes_per_second,
+                self.ops_per_second,
+                self.target_latency,
+                self.nice,
+                self.ionice,
+            )
+        )
+
+
+@dataclass(frozen=True)
+class OrganizeTransferConfig:
+    """
+    Cross-device copies (organize_files.transfer in YAML): files of at least
+    parallel_min_size bytes are copied by `workers` threads in parallel
+    ranges; with verify, each copy is hashed against its source before the
+    source is removed.
+    """
+
+    workers: int = 4
+    parallel_min_size: int = 256 * 1024 * 1024
+    verify: bool = False
 
 
 @dataclass(frozen=True)
@@ -13,7 +115,49 @@ class OrganizeFilesLoadedConfig:
     destination_dir: Path
     dry_run: bool
     categories: Dict[str, list[str]]
+    category_index: CategoryIndex
     others_dir: str = "others"
+    recursive: bool = False
+    max_depth: Optional[int] = None
+    exclude: Tuple[str, ...] = ()
+    workers: int = 1
+    incremental: bool = False
+    journal: bool = False
+    watch: OrganizeWatchConfig = field(default_factory=OrganizeWatchConfig)
+    dedup: OrganizeDedupConfig = field(default_factory=OrganizeDedupConfig)
+    sniff: OrganizeSniffConfig = field(default_factory=OrganizeSniffConfig)
+    throttle: OrganizeThrottleConfig = field(default_factory=OrganizeThrottleConfig)
+    transfer: OrganizeTransferConfig = field(default_factory=OrganizeTransferConfig)
+    # several source roots (absolute, glob patterns allowed) organized in
+    # parallel shards instead of source_dir; see organize_sources
+    sources: Tuple[str, ...] = ()
+    # no destination_dir configured: every source is its own destination
+    in_place: bool = False
+    # worker processes for multi-source runs (None: one per CPU)
+    processes: Optional[int] = None
+
+
+def organize_sources(loaded: OrganizeFilesLoadedConfig) -> List[Tuple[Path, Path]]:
+    """
+    (source, destination) folders a run covers: (source_dir,
+    destination_dir), or one pair per existing folder matched by `sources`
+    (globs are expanded now, so new matches are picked up on every run).
+    """
+    if not loaded.sources:
+        return [(loaded.source_dir, loaded.destination_dir)]
+
+    roots: Dict[Path, None] = {}
+    for pattern in loaded.sources:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern]
+        for match in matches:
+            if os.path.isdir(match):
+                roots[Path(match)] = None
+    return [
+        (root, root if loaded.in_place else loaded.destination_dir) for root in roots
+    ]
 
 
 def _project_root(from_path: Path) -> Path:
@@ -52,28 +196,278 @@ def _as_path(value: Any, project_root: Path) -> Path:
     return p
 
 
+def _as_int(value: Any, name: str, *, minimum: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{name} must be an integer")
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return value
+
+
+def _as_float(value: Any, name: str, *, minimum: float) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{name} must be a number")
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return float(value)
+
+
+def _as_str_tuple(value: Any, name: str) -> Tuple[str, ...]:
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        raise ValueError(f"{name} must be a list")
+    return tuple(str(v) for v in value)
+
+
+def _load_watch_config(raw: Any) -> OrganizeWatchConfig:
+    if raw is None:
+        return OrganizeWatchConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("organize_files.watch must be a mapping")
+
+    defaults = OrganizeWatchConfig()
+    return OrganizeWatchConfig(
+        settle_seconds=_as_float(
+            raw.get("settle_seconds", defaults.settle_seconds),
+            "organize_files.watch.settle_seconds",
+            minimum=0,
+        ),
+        debounce_seconds=_as_float(
+            raw.get("debounce_seconds", defaults.debounce_seconds),
+            "organize_files.watch.debounce_seconds",
+            minimum=0.01,
+        ),
+        poll_interval=_as_float(
+            raw.get("poll_interval", defaults.poll_interval),
+            "organize_files.watch.poll_interval",
+            minimum=0.05,
+        ),
+        polling=bool(raw.get("polling", defaults.polling)),
+        hold_categories=_as_str_tuple(
+            raw.get("hold_categories", list(defaults.hold_categories)),
+            "organize_files.watch.hold_categories",
+        ),
+    )
+
+
+def _load_dedup_config(raw: Any) -> OrganizeDedupConfig:
+    if raw is None:
+        return OrganizeDedupConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("organize_files.dedup must be a mapping")
+
+    defaults = OrganizeDedupConfig()
+    action = str(raw.get("action", defaults.action))
+    if action not in DEDUP_ACTIONS:
+        raise ValueError(
+            f"organize_files.dedup.action must be one of: {', '.join(DEDUP_ACTIONS)}"
+        )
+    return OrganizeDedupConfig(
+        enabled=bool(raw.get("enabled", defaults.enabled)),
+        action=action,
+        quarantine_dir=str(raw.get("quarantine_dir", defaults.quarantine_dir)),
+        hash_workers=_as_int(
+            raw.get("hash_workers", defaults.hash_workers),
+            "organize_files.dedup.hash_workers",
+            minimum=1,
+        ),
+    )
+
+
+def _load_sniff_config(raw: Any) -> OrganizeSniffConfig:
+    if raw is None:
+        return OrganizeSniffConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("organize_files.sniff must be a mapping")
+
+    defaults = OrganizeSniffConfig()
+    return OrganizeSniffConfig(
+        enabled=bool(raw.get("enabled", defaults.enabled)),
+        workers=_as_int(
+            raw.get("workers", defaults.workers),
+            "organize_files.sniff.workers",
+            minimum=1,
+        ),
+    )
+
+
+_SIZE_UNITS = {"k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+def _as_size(value: Any, name: str) -> int:
+    """
+    Bytes from an integer or a string such as "512k", "50MB" or "1GiB"
+    (binary multiples).
+    """
+    if isinstance(value, str):
+        text = value.strip().lower().removesuffix("ib").removesuffix("b")
+        factor = _SIZE_UNITS.get(text[-1:])
+        try:
+            value = int(float(text[:-1] if factor else text) * (factor or 1))
+        except ValueError:
+            raise ValueError(f"{name} must be a size like 512k or 50MB") from None
+    return _as_int(value, name, minimum=1)
+
+
+def _load_throttle_config(raw: Any) -> OrganizeThrottleConfig:
+    if raw is None:
+        return OrganizeThrottleConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("organize_files.throttle must be a mapping")
+
+    name = "organize_files.throttle"
+    config = OrganizeThrottleConfig(
+        ionice=raw.get("ionice"),
+        ionice_level=_as_int(
+            raw.get("ionice_level", 7), f"{name}.ionice_level", minimum=0
+        ),
+    )
+    if config.ionice not in (None, "idle", "best-effort", "realtime"):
+        raise ValueError(f"{name}.ionice must be idle, best-effort or realtime")
+    if config.ionice_level > 7:
+        raise ValueError(f"{name}.ionice_level must be <= 7")
+    if raw.get("bytes_per_second") is not None:
+        config = replace(
+            config,
+            bytes_per_second=_as_size(
+                raw["bytes_per_second"], f"{name}.bytes_per_second"
+            ),
+        )
+    if raw.get("ops_per_second") is not None:
+        config = replace(
+            config,
+            ops_per_second=_as_float(
+                raw["ops_per_second"], f"{name}.ops_per_second", minimum=0.001
+            ),
+        )
+    if raw.get("target_latency") is not None:
+        config = replace(
+            config,
+            target_latency=_as_duration(
+                raw["target_latency"], f"{name}.target_latency", minimum=0.0
+            ),
+        )
+    if raw.get("nice") is not None:
+        nice = _as_int(raw["nice"], f"{name}.nice", minimum=0)
+        if nice > 19:
+            raise ValueError(f"{name}.nice must be <= 19")
+        config = replace(config, nice=nice)
+    return config
+
+
+def _load_transfer_config(raw: Any) -> OrganizeTransferConfig:
+    if raw is None:
+        return OrganizeTransferConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("organize_files.transfer must be a mapping")
+
+    defaults = OrganizeTransferConfig()
+    return OrganizeTransferConfig(
+        workers=_as_int(
+            raw.get("workers", defaults.workers),
+            "organize_files.transfer.workers",
+            minimum=1,
+        ),
+        parallel_min_size=_as_size(
+            raw.get("parallel_min_size", defaults.parallel_min_size),
+            "organize_files.transfer.parallel_min_size",
+        ),
+        verify=bool(raw.get("verify", defaults.verify)),
+    )
+
+
 def load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
     raw = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(raw) or {}
+    return _parse_yaml(raw)
+
+
+def _parse_yaml(raw: str) -> Dict[str, Any]:
+    # Imported here: a cached config never needs PyYAML. Prefer libyaml's C
+    # parser when PyYAML was built with it (much faster).
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(raw, Loader=loader) or {}
     if not isinstance(data, dict):
         raise ValueError("Config root must be a mapping (YAML dict)")
     return data
 
 
+def _config_cache_path(config_path: Path, overrides: Tuple[Any, ...]) -> Path:
+    """
+    One cache file per (config path, CLI overrides, home directory): the
+    overrides and ${HOME} are baked into the resolved config.
+    """
+    key = repr((_CONFIG_CACHE_FORMAT, str(config_path), overrides, str(Path.home())))
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return cache_dir() / "config" / f"{digest}.pickle"
+
+
+def _read_cached_config(
+    cache_path: Path, signature: Tuple[int, int, str]
+) -> Optional[OrganizeFilesLoadedConfig]:
+    try:
+        with open(cache_path, "rb") as fh:
+            cached_signature, loaded = pickle.load(fh)
+    except Exception:  # missing, stale format or corrupt: rebuild
+        return None
+    if cached_signature != signature or not isinstance(
+        loaded, OrganizeFilesLoadedConfig
+    ):
+        return None
+    return loaded
+
+
+def _write_cached_config(
+    cache_path: Path,
+    signature: Tuple[int, int, str],
+    loaded: OrganizeFilesLoadedConfig,
+) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump((signature, loaded), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # the cache is an optimization only
+
+
+def _warn_conflicts(config_path: Path, index: CategoryIndex) -> None:
+    for ext, kept, ignored in index.conflicts:
+        warnings.warn(
+            f"{config_path}: extension '{ext}' is listed in both '{kept}' and "
+            f"'{ignored}'; using '{kept}'",
+            stacklevel=3,
+        )
+
+
 def load_organize_files_config(
     config_path: Path,
     *,
     source_dir: Optional[Path] = None,
     destination_dir: Optional[Path] = None,
     dry_run: Optional[bool] = None,
+    recursive: Optional[bool] = None,
+    workers: Optional[int] = None,
+    incremental: Optional[bool] = None,
+    journal: Optional[bool] = None,
+    use_cache: bool = True,
 ) -> OrganizeFilesLoadedConfig:
     """
     Load organize_files config from YAML, applying CLI overrides (when provided).
     Precedence: CLI > YAML > defaults.
 
+    The resolved config (with its compiled CategoryIndex) is cached as a pickle
+    under the user cache dir, keyed by config path and overrides, and reused
+    while the file's mtime, size and content hash are unchanged; anything else
+    rebuilds it. Within one process the loaded object itself is reused on the
+    same terms. use_cache=False always parses the YAML.
+
     Path resolution rules:
     - Supports ${PROJECT_ROOT} and ${HOME} placeholders in YAML strings.
     - Relative paths are resolved relative to PROJECT_ROOT (where pyproject.toml is).
@@ -82,9 +476,39 @@ def load_organize_files_config(
     - If destination_dir is not provided (CLI/YAML), defaults to source_dir.
     """
     config_path = config_path.resolve()
-    project_root = _project_root(config_path)
+    try:
+        with open(config_path, "rb") as fh:
+            st = os.fstat(fh.fileno())
+            raw = fh.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-    data = load_yaml(config_path)
+    cache_path: Optional[Path] = None
+    signature = (st.st_mtime_ns, st.st_size, hashlib.sha256(raw).hexdigest())
+    if use_cache:
+        cache_path = _config_cache_path(
+            config_path,
+            (
+                None if source_dir is None else str(source_dir),
+                None if destination_dir is None else str(destination_dir),
+                dry_run,
+                recursive,
+                workers,
+                incremental,
+                journal,
+            ),
+        )
+        remembered = _MEMORY_CACHE.get(cache_path)
+        if remembered is not None and remembered[0] == signature:
+            return remembered[1]  # its conflicts were reported when first loaded
+        cached = _read_cached_config(cache_path, signature)
+        if cached is not None:
+            _warn_conflicts(config_path, cached.category_index)
+            _MEMORY_CACHE[cache_path] = (signature, cached)
+            return cached
+
+    project_root = _project_root(config_path)
+    data = _parse_yaml(raw.decode("utf-8"))
     section = data.get("organize_files", {}) or {}
     if not isinstance(section, dict):
         raise ValueError("organize_files section must be a mapping")
@@ -95,6 +519,14 @@ def load_organize_files_config(
     yaml_dry = section.get("dry_run", True)
     yaml_others = section.get("others_dir", "others")
     yaml_categories = section.get("categories", {})
+    yaml_recursive = section.get("recursive", False)
+    yaml_max_depth = section.get("max_depth", None)
+    yaml_exclude = section.get("exclude", [])
+    yaml_workers = section.get("workers", 1)
+    yaml_incremental = section.get("incremental", False)
+    yaml_journal = section.get("journal", False)
+    yaml_sources = section.get("sources", None)
+    yaml_processes = section.get("processes", None)
 
     if not isinstance(yaml_categories, dict):
         raise ValueError("organize_files.categories must be a mapping")
@@ -109,7 +541,43 @@ def load_organize_files_config(
     else:
         final_dest = final_source  # <<< key behavior: same folder
 
+    # --source-dir picks one folder even when the YAML lists several
+    final_sources: Tuple[str, ...] = ()
+    if yaml_sources is not None and source_dir is None:
+        final_sources = tuple(
+            str(_as_path(s, project_root))
+            for s in _as_str_tuple(yaml_sources, "organize_files.sources")
+        )
+        if not final_sources:
+            raise ValueError("organize_files.sources must not be empty")
+    if yaml_processes is not None:
+        yaml_processes = _as_int(
+            yaml_processes, "organize_files.processes", minimum=1
+        )
+
     final_dry = bool(dry_run if dry_run is not None else yaml_dry)
+    final_recursive = bool(recursive if recursive is not None else yaml_recursive)
+    final_incremental = bool(
+        incremental if incremental is not None else yaml_incremental
+    )
+
+    if yaml_max_depth is not None:
+        yaml_max_depth = _as_int(
+            yaml_max_depth, "organize_files.max_depth", minimum=0
+        )
+
+    final_workers = _as_int(
+        workers if workers is not None else yaml_workers,
+        "organize_files.workers",
+        minimum=1,
+    )
+    final_exclude = _as_str_tuple(yaml_exclude, "organize_files.exclude")
+    final_journal = bool(journal if journal is not None else yaml_journal)
+    final_watch = _load_watch_config(section.get("watch"))
+    final_dedup = _load_dedup_config(section.get("dedup"))
+    final_sniff = _load_sniff_config(section.get("sniff"))
+    final_throttle = _load_throttle_config(section.get("throttle"))
+    final_transfer = _load_transfer_config(section.get("transfer"))
 
     # Normalize category extensions to list[str]
     categories: Dict[str, list[str]] = {}
@@ -120,10 +588,245 @@ def load_organize_files_config(
             raise ValueError(f"Category '{cat}' extensions must be a list")
         categories[str(cat)] = [str(e) for e in exts]
 
-    return OrganizeFilesLoadedConfig(
+    category_index = CategoryIndex.compile(categories)
+    _warn_conflicts(config_path, category_index)
+
+    loaded = OrganizeFilesLoadedConfig(
         source_dir=final_source,
         destination_dir=final_dest,
         dry_run=final_dry,
         categories=categories,
+        category_index=category_index,
         others_dir=str(yaml_others),
+        recursive=final_recursive,
+        max_depth=yaml_max_depth,
+        exclude=final_exclude,
+        workers=final_workers,
+        incremental=final_incremental,
+        journal=final_journal,
+        watch=final_watch,
+        dedup=final_dedup,
+        sniff=final_sniff,
+        throttle=final_throttle,
+        transfer=final_transfer,
+        sources=final_sources,
+        in_place=destination_dir is None and yaml_dest is None,
+        processes=yaml_processes,
+    )
+    if cache_path is not None:
+        _write_cached_config(cache_path, signature, loaded)
+        _MEMORY_CACHE[cache_path] = (signature, loaded)
+    return loaded
+
+
+# Job options holding paths: resolved like the organize_files paths
+_JOB_PATH_OPTIONS = ("config_path", "source_dir", "destination_dir")
+
+
+def _load_job_options(raw: Any, owner: str, project_root: Path) -> Dict[str, Any]:
+    """
+    Job factory options given in YAML (pipeline steps, schedule entries).
+    """
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise ValueError(f"{owner}: options must be a mapping")
+    options = {str(k): v for k, v in raw.items()}
+    for key in _JOB_PATH_OPTIONS:
+        if options.get(key) is not None:
+            options[key] = _as_path(options[key], project_root)
+    return options
+
+
+@dataclass(frozen=True)
+class PipelineStepConfig:
+    """
+    One pipeline step: run `job` once every step in `needs` has succeeded.
+    options are job factory options (source_dir, dry_run, ...) that override
+    the command line ones for this step only.
+    """
+
+    name: str
+    job: str
+    needs: Tuple[str, ...] = ()
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    name: str
+    steps: Tuple[PipelineStepConfig, ...]
+    max_parallel: int = 4
+
+
+def _load_pipeline_step(name: str, raw: Any, project_root: Path) -> PipelineStepConfig:
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ValueError(f"pipeline step '{name}' must be a mapping")
+
+    return PipelineStepConfig(
+        name=name,
+        job=str(raw.get("job", name)),
+        needs=_as_str_tuple(raw.get("needs", []), f"pipeline step '{name}': needs"),
+        options=_load_job_options(
+            raw.get("options"), f"pipeline step '{name}'", project_root
+        ),
+    )
+
+
+def load_pipeline_config(config_path: Path) -> PipelineConfig:
+    """
+    Load a pipeline definition (the `pipeline` section of a YAML file):
+
+        pipeline:
+          name: nightly
+          max_parallel: 2
+          steps:
+            organize:
+              job: organize-files        # defaults to the step name
+              options: {source_dir: ${HOME}/Downloads}
+            report:
+              job: example
+              needs: [organize]
+
+    Paths in step options follow the organize_files rules (placeholders,
+    relative to PROJECT_ROOT). Dependencies are checked when the pipeline
+    is built (autoops.core.pipeline.Pipeline.from_config).
+    """
+    config_path = config_path.resolve()
+    data = load_yaml(config_path)
+    section = data.get("pipeline")
+    if not isinstance(section, dict):
+        raise ValueError("pipeline section must be a mapping")
+
+    raw_steps = section.get("steps")
+    if not isinstance(raw_steps, dict) or not raw_steps:
+        raise ValueError("pipeline.steps must be a non-empty mapping")
+
+    project_root = _project_root(config_path)
+    return PipelineConfig(
+        name=str(section.get("name", config_path.stem)),
+        steps=tuple(
+            _load_pipeline_step(str(name), raw, project_root)
+            for name, raw in raw_steps.items()
+        ),
+        max_parallel=_as_int(
+            section.get("max_parallel", 4), "pipeline.max_parallel", minimum=1
+        ),
+    )
+
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(raw: str) -> float:
+    """
+    Seconds from a string such as "90", "90s", "15m", "2h", "1d" or "250ms".
+    Raises ValueError for anything else.
+    """
+    text = raw.strip().lower()
+    unit = "ms" if text.endswith("ms") else text[-1:]
+    factor = _DURATION_UNITS.get(unit)
+    try:
+        return float(text[: -len(unit)] if factor else text) * (factor or 1)
+    except ValueError:
+        raise ValueError(f"Not a duration (like 30s, 15m or 2h): '{raw}'") from None
+
+
+def _as_duration(value: Any, name: str, *, minimum: float) -> float:
+    if isinstance(value, str):
+        try:
+            value = parse_duration(value)
+        except ValueError:
+            raise ValueError(f"{name} must be a duration like 30s, 15m or 2h") from None
+    return _as_float(value, name, minimum=minimum)
+
+
+@dataclass(frozen=True)
+class ScheduleEntryConfig:
+    """
+    When to run one job: on a cron expression or every `every` seconds
+    (aligned to multiples of the interval), delayed by a random 0..jitter
+    seconds. catch_up runs a missed occurrence once at startup.
+    """
+
+    name: str
+    job: str
+    cron: Optional[str] = None
+    every: Optional[float] = None
+    jitter: float = 0.0
+    catch_up: bool = False
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ScheduleConfig:
+    entries: Tuple[ScheduleEntryConfig, ...]
+    max_parallel: int = 4
+
+
+def _load_schedule_entry(
+    name: str, raw: Any, project_root: Path
+) -> ScheduleEntryConfig:
+    from autoops.utils.cron import CronExpression
+
+    owner = f"schedule entry '{name}'"
+    if not isinstance(raw, dict):
+        raise ValueError(f"{owner} must be a mapping")
+    cron = raw.get("cron")
+    every = raw.get("every")
+    if (cron is None) == (every is None):
+        raise ValueError(f"{owner} needs exactly one of: cron, every")
+    if cron is not None:
+        CronExpression(str(cron))  # validate now rather than at the first tick
+
+    return ScheduleEntryConfig(
+        name=name,
+        job=str(raw.get("job", name)),
+        cron=None if cron is None else str(cron),
+        every=(
+            None
+            if every is None
+            else _as_duration(every, f"{owner}: every", minimum=0.01)
+        ),
+        jitter=_as_duration(raw.get("jitter", 0), f"{owner}: jitter", minimum=0),
+        catch_up=bool(raw.get("catch_up", False)),
+        options=_load_job_options(raw.get("options"), owner, project_root),
+    )
+
+
+def load_schedule_config(config_path: Path) -> ScheduleConfig:
+    """
+    Load job schedules (the `schedule` section of a YAML file):
+
+        schedule:
+          max_parallel: 2
+          jobs:
+            organize-downloads:
+              job: organize-files      # defaults to the entry name
+              every: 15m               # or cron: "*/15 * * * *"
+              jitter: 30s
+              catch_up: true
+              options: {source_dir: ${HOME}/Downloads}
+    """
+    config_path = config_path.resolve()
+    data = load_yaml(config_path)
+    section = data.get("schedule")
+    if not isinstance(section, dict):
+        raise ValueError("schedule section must be a mapping")
+
+    raw_jobs = section.get("jobs")
+    if not isinstance(raw_jobs, dict) or not raw_jobs:
+        raise ValueError("schedule.jobs must be a non-empty mapping")
+
+    project_root = _project_root(config_path)
+    return ScheduleConfig(
+        entries=tuple(
+            _load_schedule_entry(str(name), raw, project_root)
+            for name, raw in raw_jobs.items()
+        ),
+        max_parallel=_as_int(
+            section.get("max_parallel", 4), "schedule.max_parallel", minimum=1
+        ),
     )
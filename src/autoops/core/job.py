@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Optional
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from autoops.core.metrics import Metrics, collecting
+
+if TYPE_CHECKING:
+    from autoops.core.memo import ResultCache
 
 
 @dataclass
@@ -10,6 +16,11 @@ class JobResult:
     message: str
     data: Any = None
     error: Optional[BaseException] = None
+    # {"wall_seconds", "spans": {name: {"seconds", "calls"}}, "counters"}
+    # when the job ran with instrument=True
+    metrics: Optional[Dict[str, Any]] = None
+    # True when Job.run returned the stored result of an earlier run
+    cached: bool = False
 
 
 @dataclass(frozen=True)
@@ -17,11 +28,67 @@ class Job:
     name: str
     description: str
     handler: Callable[[], Any]
+    # cheap identity of the job's inputs (None: cannot tell, always run)
+    fingerprint: Optional[Callable[[], Optional[str]]] = None
 
-    def run(self) -> JobResult:
+    def run(
+        self,
+        *,
+        instrument: bool = False,
+        cache: Optional[ResultCache] = None,
+        force: bool = False,
+    ) -> JobResult:
         """
         Execute the job handler and wrap the outcome into a JobResult.
+
+        With instrument=True, the handler runs with a live Metrics collector
+        (see autoops.core.metrics.current_metrics) and the collected spans and
+        counters are attached to the result.
+
+        With a `cache`, a job that has a fingerprint is memoized: when its
+        fingerprint matches the one of an earlier successful run, that run's
+        result is returned (with cached=True) without calling the handler.
+        force=True runs the handler anyway and stores the new result.
         """
+        if not instrument:
+            return self._memoized(cache, force)
+
+        metrics = Metrics()
+        start = time.perf_counter()
+        with collecting(metrics):
+            result = self._memoized(cache, force)
+        if result.metrics is None:
+            result.metrics = {
+                "wall_seconds": round(time.perf_counter() - start, 6),
+                **metrics.as_dict(),
+            }
+        return result
+
+    def _fingerprint(self) -> Optional[str]:
+        try:
+            return self.fingerprint() if self.fingerprint is not None else None
+        except Exception:  # e.g. a broken config: let the run report it
+            return None
+
+    def _memoized(self, cache: Optional[ResultCache], force: bool) -> JobResult:
+        if cache is None:
+            return self._run()
+        before = self._fingerprint()
+        if before is None:
+            return self._run()
+        if not force:
+            hit = cache.get(self.name, before)
+            if isinstance(hit, JobResult):
+                return replace(hit, cached=True)
+
+        result = self._run()
+        # a run that changed its own inputs (files moved) is not a no-op:
+        # the next run has different inputs, so there is nothing to reuse
+        if result.success and self._fingerprint() == before:
+            cache.put(self.name, before, replace(result, metrics=None, cached=False))
+        return result
+
+    def _run(self) -> JobResult:
         try:
             result = self.handler()
 
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from autoops.utils.appdirs import cache_dir
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    job TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    result BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (job, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS results_by_use ON results (last_used);
+"""
+
+
+def default_result_cache_path() -> Path:
+    return cache_dir() / "results.sqlite3"
+
+
+class ResultCache:
+    """
+    Results of successful job runs keyed by (job name, input fingerprint),
+    for Job.run(cache=...): a run whose fingerprint matches a stored one
+    returns the stored JobResult instead of running again.
+
+    Results are pickled into SQLite (user cache dir). When the stored
+    results exceed `max_bytes`, the least recently used are evicted.
+    The cache is an optimization only: a database that cannot be read or
+    written behaves as an empty cache, and results that cannot be pickled
+    are not stored.
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, *, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.path = path or default_result_cache_path()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, job: str, fingerprint: str) -> Any:
+        """
+        The result stored for this job and fingerprint, or None.
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT result FROM results WHERE job = ? AND fingerprint = ?",
+                    (job, fingerprint),
+                ).fetchone()
+                if row is None:
+                    return None
+                with conn:
+                    conn.execute(
+                        "UPDATE results SET last_used = ?"
+                        " WHERE job = ? AND fingerprint = ?",
+                        (time.time(), job, fingerprint),
+                    )
+            return pickle.loads(row[0])
+        except Exception:  # unreadable database or pickle (class moved): a miss
+            return None
+
+    def put(self, job: str, fingerprint: str, result: Any) -> bool:
+        """
+        Store `result` for this job and fingerprint, then evict the least
+        recently used results beyond max_bytes. Returns False if it was not
+        stored.
+        """
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # locks, open files, lambdas...
+            return False
+        if len(blob) > self.max_bytes:
+            return False
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (job, fingerprint, result,"
+                        " size, last_used) VALUES (?, ?, ?, ?, ?)",
+                        (job, fingerprint, blob, len(blob), time.time()),
+                    )
+                    self._evict(conn)
+        except (sqlite3.Error, OSError):
+            return False
+        return True
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT job, fingerprint, size FROM results ORDER BY last_used"
+        ).fetchall()
+        for job, fingerprint, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute(
+                "DELETE FROM results WHERE job = ? AND fingerprint = ?",
+                (job, fingerprint),
+            )
+            total -= size
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Metrics:
+    """
+    Named timing spans and counters collected while a job runs.
+
+    Span times are exclusive: time spent in a span or timed iterator nested
+    inside another (on the same thread) is not counted again by the outer
+    one, so the spans of a lazy pipeline (scan -> classify -> plan) add up
+    to the wall time they took together. Safe to use from several threads;
+    spans recorded on worker threads add up busy time across threads, so
+    they can exceed the wall time.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._spans: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+        self._counters: Dict[str, int] = {}
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def add_time(self, name: str, seconds: float, calls: int = 1) -> None:
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                self._spans[name] = [seconds, calls]
+            else:
+                span[0] += seconds
+                span[1] += calls
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        stack = self._stack()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.add_time(name, elapsed - nested)
+
+    def timed_iter(
+        self, name: str, iterable: Iterable[T], counter: Optional[str] = None
+    ) -> Iterator[T]:
+        """
+        Yield from `iterable`, recording the time spent producing items as
+        span `name` (one call per item) and the item count as `counter`.
+        """
+        clock = time.perf_counter
+        stack = self._stack()
+        it = iter(iterable)
+        total = 0.0
+        items = 0
+        try:
+            while True:
+                stack.append(0.0)
+                start = clock()
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed = clock() - start
+                    nested = stack.pop()
+                    if stack:
+                        stack[-1] += elapsed
+                    total += elapsed - nested
+                items += 1
+                yield item
+        finally:
+            self.add_time(name, total, items)
+            if counter is not None:
+                self.count(counter, items)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "spans": {
+                    name: {"seconds": round(seconds, 6), "calls": calls}
+                    for name, (seconds, calls) in self._spans.items()
+                },
+                "counters": dict(self._counters),
+            }
+
+
+class NullMetrics(Metrics):
+    """
+    Disabled instrumentation: every call is a no-op and timed_iter returns
+    the iterable unchanged, so instrumented code pays one method call per
+    span (not per item). Check `metrics.enabled` before computing values
+    that are only needed for a counter.
+    """
+
+    enabled = False
+
+    def __init__(self) -> None:
+        pass
+
+    def add_time(self, name: str, seconds: float, calls: int = 1) -> None:
+        pass
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def span(self, name: str):  # type: ignore[override]
+        return _NULL_SPAN
+
+    def timed_iter(  # type: ignore[override]
+        self, name: str, iterable: Iterable[T], counter: Optional[str] = None
+    ) -> Iterable[T]:
+        return iterable
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"spans": {}, "counters": {}}
+
+
+class _NullSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+NULL_METRICS = NullMetrics()
+
+_current: ContextVar[Metrics] = ContextVar("autoops_metrics", default=NULL_METRICS)
+
+
+def current_metrics() -> Metrics:
+    """
+    Metrics of the job running in this context (NULL_METRICS when the job
+    runs uninstrumented). Worker threads do not inherit the context: fetch
+    it once on the calling thread and pass it along.
+    """
+    return _current.get()
+
+
+@contextmanager
+def collecting(metrics: Metrics) -> Iterator[Metrics]:
+    """
+    Make `metrics` current for the duration of the block.
+    """
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
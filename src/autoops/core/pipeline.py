@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from autoops.core.job import Job, JobResult
+from autoops.core.registry import JobSpec, Registry
+from autoops.core.runner import DEFAULT_MAX_PARALLEL, JobRun
+
+if TYPE_CHECKING:
+    from autoops.config.loader import PipelineConfig
+    from autoops.core.process_pool import ProcessJobPool
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    """
+    Run registered job `job` once every step in `needs` has succeeded.
+    options override the registry options for this step (lazy jobs only).
+    """
+
+    name: str
+    job: str
+    needs: Tuple[str, ...] = ()
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class Pipeline:
+    """
+    A DAG of job steps. Steps are added in any order; dependencies and
+    cycles are checked by `order()` (and so before run_pipeline starts).
+    """
+
+    def __init__(self, name: str = "pipeline") -> None:
+        self.name = name
+        self._steps: Dict[str, PipelineStep] = {}
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "Pipeline":
+        pipeline = cls(config.name)
+        for step in config.steps:
+            pipeline.add(
+                step.name, job=step.job, needs=step.needs, options=step.options
+            )
+        pipeline.order()
+        return pipeline
+
+    def add(
+        self,
+        name: str,
+        *,
+        job: Optional[str] = None,
+        needs: Iterable[str] = (),
+        options: Optional[Dict[str, Any]] = None,
+    ) -> "Pipeline":
+        """
+        Add a step (running job `job`, by default the job called `name`).
+        Raises ValueError if the step name already exists.
+        """
+        if name in self._steps:
+            raise ValueError(f"Step '{name}' is already defined")
+        self._steps[name] = PipelineStep(
+            name=name,
+            job=job or name,
+            needs=tuple(dict.fromkeys(needs)),
+            options=dict(options or {}),
+        )
+        return self
+
+    @property
+    def steps(self) -> List[PipelineStep]:
+        return list(self._steps.values())
+
+    def order(self) -> List[str]:
+        """
+        Step names in a dependency-respecting order (ties keep insertion
+        order). Raises ValueError for an unknown dependency or a cycle.
+        """
+        for step in self._steps.values():
+            for dep in step.needs:
+                if dep not in self._steps:
+                    raise ValueError(f"Step '{step.name}' needs unknown step '{dep}'")
+
+        remaining = {name: len(step.needs) for name, step in self._steps.items()}
+        dependents = self.dependents()
+        ready = [name for name, count in remaining.items() if count == 0]
+        order: List[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            del remaining[name]
+            for child in dependents[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+
+        if remaining:
+            raise ValueError(f"Dependency cycle: {' -> '.join(self._cycle(remaining))}")
+        return order
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """
+        Step name -> names of the steps that need it.
+        """
+        dependents: Dict[str, List[str]] = {name: [] for name in self._steps}
+        for step in self._steps.values():
+            for dep in step.needs:
+                dependents[dep].append(step.name)
+        return dependents
+
+    def _cycle(self, candidates: Iterable[str]) -> List[str]:
+        """
+        One cycle among `candidates` (steps left over by the topological
+        sort, so every one of them has a need among them).
+        """
+        left = set(candidates)
+        name = next(iter(sorted(left)))
+        path: List[str] = []
+        seen: Dict[str, int] = {}
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = next(dep for dep in self._steps[name].needs if dep in left)
+        return path[seen[name]:] + [name]
+
+
+@dataclass
+class PipelineResult:
+    name: str
+    runs: List[JobRun] = field(default_factory=list)
+    seconds: float = 0.0
+    # steps on the longest chain of dependent steps, by measured duration
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return all(r.status == "succeeded" for r in self.runs)
+
+    @property
+    def critical_path_seconds(self) -> float:
+        by_name = {r.name: r.seconds for r in self.runs}
+        return sum(by_name[name] for name in self.critical_path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pipeline": self.name,
+            "success": self.success,
+            "seconds": round(self.seconds, 6),
+            "critical_path": self.critical_path,
+            "critical_path_seconds": round(self.critical_path_seconds, 6),
+            "steps": [r.to_dict() for r in self.runs],
+        }
+
+
+def _resolve(
+    registry: Registry, step: PipelineStep, pool: Optional[ProcessJobPool]
+) -> Union[Job, JobSpec]:
+    spec = registry.get_spec(step.job)
+    if spec is not None and (pool is not None or step.options):
+        return spec
+    if step.options and registry.describe(step.job) is not None:
+        raise ValueError(
+            f"Step '{step.name}': options need a lazily registered job "
+            f"('{step.job}' was registered as a Job)"
+        )
+    job = registry.get(step.job)
+    if job is None:
+        raise ValueError(f"Step '{step.name}': job '{step.job}' not found")
+    return job
+
+
+def run_pipeline(
+    registry: Registry,
+    pipeline: Pipeline,
+    *,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    instrument: bool = False,
+    pool: Optional[ProcessJobPool] = None,
+    timeout: Optional[float] = None,
+) -> PipelineResult:
+    """
+    Run the steps of `pipeline`, each as soon as all its needs succeeded,
+    at most `max_parallel` at a time (on threads, or on `pool` workers with
+    an optional per-step `timeout`, as in run_many).
+
+    When a step fails, every step downstream of it is skipped; independent
+    branches keep running. Raises ValueError before running anything if the
+    pipeline has a cycle or refers to unknown steps or jobs.
+    """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
+    if timeout is not None and pool is None:
+        raise ValueError("timeout needs a process pool (threads cannot be killed)")
+
+    order = pipeline.order()
+    steps = {step.name: step for step in pipeline.steps}
+    dependents = pipeline.dependents()
+    # resolved on the calling thread: Registry is not thread-safe
+    jobs = {name: _resolve(registry, steps[name], pool) for name in order}
+
+    batch_start = time.perf_counter()
+
+    def execute(name: str) -> JobRun:
+        step = steps[name]
+        job = jobs[name]
+        start = time.perf_counter()
+        if pool is not None:
+            result = pool.run(
+                job,
+                {**registry.options, **step.options},
+                timeout=timeout,
+                instrument=instrument,
+            )
+        elif isinstance(job, JobSpec):
+            # a step with its own options: build this step's job here
+            try:
+                built = job.load(**{**registry.options, **step.options})
+            except Exception as exc:
+                result = JobResult(
+                    success=False, message="Job could not be loaded", error=exc
+                )
+            else:
+                result = built.run(instrument=instrument)
+        else:
+            result = job.run(instrument=instrument)
+        return JobRun(
+            name=name,
+            status="succeeded" if result.success else "failed",
+            result=result,
+            started_at=start - batch_start,
+            seconds=time.perf_counter() - start,
+        )
+
+    runs: Dict[str, JobRun] = {}
+    waiting = {name: len(steps[name].needs) for name in order}
+    skipped: Set[str] = set()
+
+    def skip_downstream(failed: str) -> None:
+        stack = list(dependents[failed])
+        while stack:
+            name = stack.pop()
+            if name in skipped:
+                continue
+            skipped.add(name)
+            runs[name] = JobRun(
+                name=name,
+                status="skipped",
+                result=JobResult(
+                    success=False, message=f"Skipped: upstream step '{failed}' failed"
+                ),
+            )
+            stack.extend(dependents[name])
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parallel, len(order)),
+        thread_name_prefix="autoops-step",
+    ) as executor:
+        futures: Dict[Future, str] = {
+            executor.submit(execute, name): name
+            for name in order
+            if waiting[name] == 0
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: order.index(futures[f])):
+                name = futures[future]
+                runs[name] = future.result()
+                if runs[name].status != "succeeded":
+                    skip_downstream(name)
+                    continue
+                for child in dependents[name]:
+                    waiting[child] -= 1
+                    if waiting[child] == 0 and child not in skipped:
+                        child_future = executor.submit(execute, child)
+                        futures[child_future] = child
+                        pending.add(child_future)
+
+    return PipelineResult(
+        name=pipeline.name,
+        runs=[runs[name] for name in order],
+        seconds=time.perf_counter() - batch_start,
+        critical_path=_critical_path(order, steps, runs),
+    )
+
+
+def _critical_path(
+    order: List[str], steps: Dict[str, PipelineStep], runs: Dict[str, JobRun]
+) -> List[str]:
+    """
+    The chain of dependent steps with the largest total duration: the steps
+    that bound the pipeline's wall time however many workers it gets.
+    """
+    length: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for name in order:
+        if runs[name].status == "skipped":
+            continue
+        best: Optional[str] = None
+        for dep in steps[name].needs:
+            if dep in length and (best is None or length[dep] > length[best]):
+                best = dep
+        length[name] = runs[name].seconds + (length[best] if best else 0.0)
+        previous[name] = best
+
+    if not length:
+        return []
+    node: Optional[str] = max(length, key=lambda n: length[n])
+    path: List[str] = []
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    return path[::-1]
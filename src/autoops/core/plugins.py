@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from autoops.core.registry import JobSpec
+from autoops.utils.appdirs import cache_dir
+
+# Third-party packages expose jobs as entry points in this group:
+#
+#   [project.entry-points."autoops.jobs"]
+#   backup-photos = "mypkg.jobs:backup_photos_factory"
+#
+# The entry point name is the job name and its value a JobFactory. The
+# description comes from the factory's `description` attribute or the first
+# line of its docstring.
+ENTRY_POINT_GROUP = "autoops.jobs"
+
+_MANIFEST_VERSION = 1
+
+
+def default_manifest_path() -> Path:
+    return cache_dir() / "plugins.json"
+
+
+def environment_key() -> str:
+    """
+    Fingerprint of the installed-distribution state: installing, upgrading
+    or removing a distribution adds or removes a *.dist-info entry, which
+    changes the mtime of its sys.path directory. Costs one stat per entry.
+    The working directory (on sys.path for `python -m`) is left out: its
+    mtime changes with any file created there.
+    """
+    parts: List[str] = [sys.version, str(_MANIFEST_VERSION)]
+    cwd = os.getcwd()
+    for entry in sys.path:
+        if entry in ("", ".") or entry == cwd:
+            continue
+        try:
+            st = os.stat(entry)
+        except OSError:
+            continue
+        parts.append(f"{entry}:{st.st_mtime_ns}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _describe(factory: Any) -> str:
+    description = getattr(factory, "description", None)
+    if description:
+        return str(description)
+    doc = (getattr(factory, "__doc__", None) or "").strip()
+    return doc.splitlines()[0] if doc else ""
+
+
+def _scan_entry_points() -> List[Dict[str, str]]:
+    from importlib.metadata import entry_points
+
+    jobs: List[Dict[str, str]] = []
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            factory = ep.load()
+        except Exception as exc:  # a broken plugin must not break the CLI
+            warnings.warn(
+                f"Skipping job plugin '{ep.name}' ({ep.value}): {exc}",
+                stacklevel=2,
+            )
+            continue
+        jobs.append(
+            {"name": ep.name, "description": _describe(factory), "target": ep.value}
+        )
+    return jobs
+
+
+def _read_manifest(path: Path, key: str) -> Optional[List[Dict[str, str]]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+    jobs = data.get("jobs")
+    return jobs if isinstance(jobs, list) else None
+
+
+def _write_manifest(path: Path, key: str, jobs: List[Dict[str, str]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"key": key, "jobs": jobs}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache is an optimization; discovery still worked
+
+
+def discover_jobs(manifest_path: Optional[Path] = None) -> List[JobSpec]:
+    """
+    Return lazy specs for the jobs installed through entry points.
+
+    Scanning entry points means reading every distribution's metadata and
+    importing each plugin (for its description), so the result is cached in
+    a manifest (user cache dir) keyed by environment_key(). While the
+    installed distributions stay the same, discovery is one small JSON read
+    and no plugin module is imported.
+    """
+    path = manifest_path or default_manifest_path()
+    key = environment_key()
+    jobs = _read_manifest(path, key)
+    if jobs is None:
+        jobs = _scan_entry_points()
+        _write_manifest(path, key, jobs)
+
+    return [
+        JobSpec(name=job["name"], description=job["description"], factory=job["target"])
+        for job in jobs
+    ]
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from autoops.core.job import Job, JobResult
+from autoops.core.registry import JobSpec
+
+# What a worker can run: a lazy spec (built in the worker from the factory
+# options) or a Job whose handler pickles (a module-level function).
+JobRef = Union[JobSpec, Job]
+
+
+def _limit_memory(limit_bytes: int) -> None:
+    import resource
+
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+def _portable(result: JobResult) -> JobResult:
+    """
+    Make a worker's result safe to send back: an error or data that cannot
+    be pickled is replaced by its description.
+    """
+    try:
+        pickle.dumps(result)
+        return result
+    except Exception:
+        pass
+
+    error = result.error
+    if error is not None:
+        try:
+            pickle.loads(pickle.dumps(error))
+        except Exception:
+            error = RuntimeError(f"{type(error).__name__}: {error}")
+    data = result.data
+    try:
+        pickle.dumps(data)
+    except Exception:
+        data = repr(data)
+    return JobResult(
+        success=result.success,
+        message=result.message,
+        data=data,
+        error=error,
+        metrics=result.metrics,
+    )
+
+
+def _worker_main(conn: Any, memory_limit: Optional[int]) -> None:
+    """
+    Worker loop: receive (job_ref, options, instrument), send a JobResult,
+    until the pipe closes or None is received.
+    """
+    if memory_limit:
+        _limit_memory(memory_limit)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        job_ref, options, instrument = task
+        try:
+            if isinstance(job_ref, JobSpec):
+                job_ref = job_ref.load(**options)
+            result = job_ref.run(instrument=instrument)
+        except BaseException as exc:  # building the job failed
+            result = JobResult(
+                success=False, message="Job could not be loaded", error=exc
+            )
+        conn.send(_portable(result))
+
+
+class _Worker:
+    def __init__(self, context: Any, memory_limit: Optional[int]) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit),
+            name="autoops-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ProcessJobPool:
+    """
+    Warm worker processes that run jobs out of the orchestrator's process.
+
+    Each worker is started once and reused across jobs, so the interpreter
+    and import cost is paid per worker rather than per job. `run` is
+    blocking and thread-safe: call it from up to `workers` threads to run
+    that many jobs at once (run_many does this). A job that exceeds its
+    timeout has its worker killed and replaced; a worker that dies (crash,
+    OOM kill) is replaced too. With memory_limit (bytes), RLIMIT_AS is set
+    in every worker, so an oversized allocation fails with MemoryError
+    inside the job instead of taking the machine down.
+
+    Uses the "forkserver" start method where available (workers do not
+    inherit the threads or state of the orchestrator), "spawn" elsewhere.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        memory_limit: Optional[int] = None,
+        start_method: Optional[str] = None,
+    ) -> None:
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if memory_limit is not None and memory_limit <= 0:
+            raise ValueError("memory_limit must be > 0")
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in methods else "spawn"
+
+        self.workers = workers
+        self.memory_limit = memory_limit
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> "ProcessJobPool":
+        """
+        Start every worker now rather than on first use.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("pool is closed")
+            while len(self._all) < self.workers:
+                worker = _Worker(self._context, self.memory_limit)
+                self._all.append(worker)
+                self._idle.put(worker)
+        return self
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+            if self._closed:
+                return
+            fresh = _Worker(self._context, self.memory_limit)
+            self._all.append(fresh)
+        self._idle.put(fresh)
+
+    def run(
+        self,
+        job: JobRef,
+        options: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+        instrument: bool = False,
+    ) -> JobResult:
+        """
+        Run `job` on a worker and return its JobResult. `options` are the
+        factory options for a JobSpec and must pickle (no callbacks).
+        """
+        if not self._all:
+            self.start()
+        worker = self._idle.get()
+        try:
+            worker.conn.send((job, options or {}, instrument))
+        except Exception as exc:  # job or options do not pickle
+            self._idle.put(worker)
+            return JobResult(
+                success=False,
+                message="Job cannot be sent to a worker process",
+                error=exc,
+            )
+
+        start = time.monotonic()
+        try:
+            if not worker.conn.poll(timeout):
+                self._replace(worker)
+                return JobResult(
+                    success=False,
+                    message=f"Job timed out after {timeout:g}s",
+                    error=TimeoutError(
+                        f"{_name(job)} ran longer than {timeout:g}s and was killed"
+                    ),
+                )
+            result = worker.conn.recv()
+        except (EOFError, OSError):
+            self._replace(worker)
+            code = worker.process.exitcode
+            return JobResult(
+                success=False,
+                message="Worker process died",
+                error=RuntimeError(
+                    f"{_name(job)}: worker exited with code {code} after "
+                    f"{time.monotonic() - start:.3f}s"
+                ),
+            )
+
+        self._idle.put(worker)
+        return result
+
+    def close(self) -> None:
+        """
+        Stop every worker (waiting for the jobs they are running).
+        """
+        with self._lock:
+            self._closed = True
+            workers, self._all = self._all, []
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> "ProcessJobPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _name(job: JobRef) -> str:
+    return f"Job '{job.name}'"
@@ -1,35 +1,113 @@
 from __future__ import annotations
 
+import importlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from autoops.core.job import Job
 
+# Builds a job handler from the registry options (CLI flags such as
+# config_path or dry_run); factories ignore options they do not use.
+# A handler may carry a `fingerprint` attribute (see Job.fingerprint).
+JobFactory = Callable[..., Callable[[], Any]]
+
+
+def resolve(target: str) -> Any:
+    """
+    Import "package.module:attr" (attr may be dotted) and return the object.
+    """
+    module_name, _, attr = target.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for part in filter(None, attr.split(".")):
+        obj = getattr(obj, part)
+    return obj
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """
+    A job known by name and description only; its module is imported and its
+    handler built by `load`, the first time the job is actually needed.
+    factory is a JobFactory or a "package.module:function" string.
+    """
+
+    name: str
+    description: str
+    factory: Union[str, JobFactory]
+
+    def load(self, **options: Any) -> Job:
+        factory = self.factory
+        if isinstance(factory, str):
+            factory = resolve(factory)
+        handler = factory(**options)
+        return Job(
+            name=self.name,
+            description=self.description,
+            handler=handler,
+            fingerprint=getattr(handler, "fingerprint", None),
+        )
+
 
 @dataclass
 class Registry:
     """
     In-memory registry of jobs.
+    Lazy jobs (JobSpec) are built on first `get`, with `options` as factory
+    keyword arguments.
     """
 
     _jobs: Dict[str, Job] = field(default_factory=dict)
+    _specs: Dict[str, JobSpec] = field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def _check_free(self, name: str) -> None:
+        if name in self._jobs or name in self._specs:
+            raise ValueError(f"Job '{name}' is already registered")
 
     def register(self, job: Job) -> None:
         """
         Register a job. Raises ValueError if the name already exists.
         """
-        if job.name in self._jobs:
-            raise ValueError(f"Job '{job.name}' is already registered")
+        self._check_free(job.name)
         self._jobs[job.name] = job
 
+    def register_lazy(self, spec: JobSpec) -> None:
+        """
+        Register a job without importing it. Raises ValueError if the name
+        already exists.
+        """
+        self._check_free(spec.name)
+        self._specs[spec.name] = spec
+
     def get(self, name: str) -> Optional[Job]:
         """
-        Get a job by name. Returns None if it doesn't exist.
+        Get a job by name (building it if it was registered lazily).
+        Returns None if it doesn't exist.
+        """
+        job = self._jobs.get(name)
+        if job is None and name in self._specs:
+            job = self._specs[name].load(**self.options)
+            self._jobs[name] = job
+        return job
+
+    def get_spec(self, name: str) -> Optional[JobSpec]:
+        """
+        The lazy spec a job was registered with, without building it.
+        None for jobs registered as Job objects or not registered at all.
+        """
+        return self._specs.get(name)
+
+    def describe(self, name: str) -> Optional[str]:
+        """
+        Description of a job, without building it. None if it doesn't exist.
         """
-        return self._jobs.get(name)
+        if name in self._specs:
+            return self._specs[name].description
+        job = self._jobs.get(name)
+        return job.description if job is not None else None
 
     def list_names(self) -> List[str]:
         """
         List all registered job names.
         """
-        return sorted(self._jobs.keys())
+        return sorted({*self._jobs, *self._specs})
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
-from autoops.core.job import JobResult
-from autoops.core.registry import Registry
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from autoops.core.job import Job, JobResult
+from autoops.core.registry import JobSpec, Registry
+
+if TYPE_CHECKING:
+    from autoops.core.process_pool import ProcessJobPool
+
+DEFAULT_MAX_PARALLEL = 4
 
 
 def run(registry: Registry, job_name: str) -> JobResult:
@@ -19,3 +30,156 @@ def run(registry: Registry, job_name: str) -> JobResult:
         )
 
     return job.run()
+
+
+@dataclass
+class JobRun:
+    """
+    Outcome of one job inside run_many (or one pipeline step).
+    status: "succeeded", "failed", "cancelled" (fail-fast stopped it before
+    it started), "skipped" (an upstream pipeline step failed) or "not_found".
+    """
+
+    name: str
+    status: str
+    result: JobResult
+    started_at: Optional[float] = None  # seconds since the batch started
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "started_at": (
+                None if self.started_at is None else round(self.started_at, 6)
+            ),
+            "seconds": round(self.seconds, 6),
+            "message": self.result.message,
+            "data": self.result.data,
+            "error": self.result.error,
+            "metrics": self.result.metrics,
+            "cached": self.result.cached,
+        }
+
+
+@dataclass
+class RunManyResult:
+    runs: List[JobRun] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return all(r.status == "succeeded" for r in self.runs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "seconds": round(self.seconds, 6),
+            "jobs": [r.to_dict() for r in self.runs],
+        }
+
+
+def run_many(
+    registry: Registry,
+    job_names: Iterable[str],
+    *,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    fail_fast: bool = False,
+    instrument: bool = False,
+    pool: Optional[ProcessJobPool] = None,
+    timeout: Optional[float] = None,
+) -> RunManyResult:
+    """
+    Run several jobs concurrently (at most `max_parallel` at a time) and
+    collect every outcome in input order.
+
+    By default jobs run on threads of this process, which suits the
+    I/O-bound jobs autoops runs (file moves, hashing with GIL-releasing C
+    code). With a ProcessJobPool, each job runs on a pool worker instead:
+    CPU-bound jobs use all cores, and `timeout` (seconds per job) bounds
+    how long one may run. Jobs are resolved from the registry up front, on
+    the calling thread. A failing job does not affect the others; with
+    fail_fast=True, jobs that have not started yet are cancelled instead
+    (jobs already running always finish). Names are run once each.
+    """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
+    if timeout is not None and pool is None:
+        raise ValueError("timeout needs a process pool (threads cannot be killed)")
+
+    names = list(dict.fromkeys(job_names))
+    runs: Dict[str, JobRun] = {}
+    jobs: Dict[str, Union[Job, JobSpec]] = {}
+    for name in names:
+        job: Union[Job, JobSpec, None] = None
+        if pool is not None:
+            # workers build lazy jobs themselves, from the registry options
+            job = registry.get_spec(name)
+        if job is None:
+            job = registry.get(name)
+        if job is None:
+            runs[name] = JobRun(
+                name=name,
+                status="not_found",
+                result=JobResult(success=False, message=f"Job '{name}' not found"),
+            )
+        else:
+            jobs[name] = job
+
+    batch_start = time.perf_counter()
+    stop = threading.Event()
+
+    def execute(name: str) -> JobRun:
+        if stop.is_set():
+            return _cancelled(name)
+        start = time.perf_counter()
+        if pool is not None:
+            result = pool.run(
+                jobs[name],
+                registry.options,
+                timeout=timeout,
+                instrument=instrument,
+            )
+        else:
+            result = jobs[name].run(instrument=instrument)
+        return JobRun(
+            name=name,
+            status="succeeded" if result.success else "failed",
+            result=result,
+            started_at=start - batch_start,
+            seconds=time.perf_counter() - start,
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parallel, max(len(jobs), 1)),
+        thread_name_prefix="autoops-job",
+    ) as executor:
+        futures: Dict[Future, str] = {executor.submit(execute, n): n for n in jobs}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures[future]
+                if future.cancelled():
+                    runs[name] = _cancelled(name)
+                    continue
+                runs[name] = future.result()
+                if fail_fast and runs[name].status == "failed":
+                    stop.set()
+                    for other in pending:
+                        other.cancel()
+
+    return RunManyResult(
+        runs=[runs[name] for name in names],
+        seconds=time.perf_counter() - batch_start,
+    )
+
+
+def _cancelled(name: str) -> JobRun:
+    return JobRun(
+        name=name,
+        status="cancelled",
+        result=JobResult(
+            success=False, message="Not started: an earlier job failed (fail-fast)"
+        ),
+    )
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from autoops.core.job import Job
+from autoops.core.memo import ResultCache
+from autoops.core.registry import Registry
+from autoops.core.runner import DEFAULT_MAX_PARALLEL, JobRun
+from autoops.utils.appdirs import data_dir
+from autoops.utils.cron import CronExpression
+
+
+def default_state_path() -> Path:
+    return data_dir() / "schedule-state.json"
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """
+    A job and when to run it: on a cron expression (local time) or every
+    `every` seconds, aligned to multiples of the interval since the epoch
+    (so restarts do not shift the ticks). Each run starts a random
+    0..jitter seconds after its tick. With catch_up, an occurrence missed
+    while the scheduler was not running (or busy) is run once at startup.
+    """
+
+    name: str
+    job: str
+    cron: Optional[str] = None
+    every: Optional[float] = None
+    jitter: float = 0.0
+    catch_up: bool = False
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if (self.cron is None) == (self.every is None):
+            raise ValueError(f"Schedule '{self.name}' needs exactly one of cron, every")
+        if self.every is not None and self.every <= 0:
+            raise ValueError(f"Schedule '{self.name}': every must be > 0")
+
+
+class _Trigger:
+    def __init__(self, entry: ScheduledJob) -> None:
+        self._cron = CronExpression(entry.cron) if entry.cron is not None else None
+        self._every = entry.every
+
+    def next_after(self, ts: float) -> float:
+        if self._cron is not None:
+            return self._cron.next_timestamp(ts)
+        every = self._every
+        return (math.floor(ts / every) + 1) * every
+
+
+@dataclass
+class SchedulerStats:
+    runs: int = 0
+    failures: int = 0
+    skipped_overlap: int = 0
+    caught_up: int = 0
+
+
+class Scheduler:
+    """
+    Long-lived dispatcher: keeps one timer heap of (fire time, tick, job),
+    sleeps until the earliest entry is due, and hands due jobs to a thread
+    pool. Jobs are built once (from the registry options plus the entry's
+    options) and reused for every run, so a tick costs a heap operation and
+    a thread hand-off rather than an interpreter start.
+
+    A job still running when its next tick comes is not started twice: that
+    occurrence is skipped (counted in stats.skipped_overlap). Ticks missed
+    because the process was suspended or busy collapse into one run. The
+    last tick dispatched per entry is kept in `state_path` (JSON) so a
+    restart can tell what it missed.
+
+    With a `cache`, jobs are memoized (see Job.run): an occurrence whose
+    job inputs did not change since its last successful run reuses that
+    run's result instead of running the job again.
+    """
+
+    def __init__(
+        self,
+        registry: Registry,
+        entries: Iterable[ScheduledJob],
+        *,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+        state_path: Optional[Path] = None,
+        on_run: Optional[Callable[[JobRun], None]] = None,
+        clock: Callable[[], float] = time.time,
+        rng: Optional[random.Random] = None,
+        instrument: bool = False,
+        cache: Optional[ResultCache] = None,
+    ) -> None:
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be >= 1")
+        self.entries: Dict[str, ScheduledJob] = {}
+        for entry in entries:
+            if entry.name in self.entries:
+                raise ValueError(f"Schedule '{entry.name}' is defined twice")
+            self.entries[entry.name] = entry
+        if not self.entries:
+            raise ValueError("Nothing to schedule")
+
+        self.max_parallel = max_parallel
+        self.state_path = state_path or default_state_path()
+        self.on_run = on_run
+        self.instrument = instrument
+        self.cache = cache
+        self.stats = SchedulerStats()
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._triggers = {name: _Trigger(e) for name, e in self.entries.items()}
+        # resolved up front, on this thread: Registry is not thread-safe
+        self._jobs = {name: _build(registry, e) for name, e in self.entries.items()}
+        self._heap: List[Tuple[float, float, str]] = []  # (fire at, tick, name)
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._state: Dict[str, float] = self._read_state()
+
+    def _read_state(self) -> Dict[str, float]:
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: float(v) for k, v in data.items() if isinstance(v, (int, float))}
+
+    def _write_state(self) -> None:
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self._state), encoding="utf-8")
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass  # only catch-up after a restart depends on it
+
+    def _push(self, name: str, tick: float) -> None:
+        jitter = self.entries[name].jitter
+        fire_at = tick + (self._rng.uniform(0, jitter) if jitter else 0.0)
+        heapq.heappush(self._heap, (fire_at, tick, name))
+
+    def _seed(self, now: float) -> None:
+        for name, trigger in self._triggers.items():
+            last = self._state.get(name)
+            if (
+                last is not None
+                and self.entries[name].catch_up
+                and trigger.next_after(last) <= now
+            ):
+                self.stats.caught_up += 1
+                heapq.heappush(self._heap, (now, now, name))
+            else:
+                self._push(name, trigger.next_after(now))
+
+    def next_due(self) -> Optional[Tuple[float, str]]:
+        """
+        (fire time, entry name) of the next run, once the scheduler runs.
+        """
+        return (self._heap[0][0], self._heap[0][2]) if self._heap else None
+
+    def run(self, stop: Optional[threading.Event] = None) -> SchedulerStats:
+        """
+        Dispatch jobs until `stop` is set (or forever). Returns after the
+        running jobs have finished.
+        """
+        stop = stop or threading.Event()
+        self._seed(self._clock())
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel, thread_name_prefix="autoops-schedule"
+        ) as executor:
+            while not stop.is_set():
+                fire_at, tick, name = self._heap[0]
+                delay = fire_at - self._clock()
+                if delay > 0:
+                    stop.wait(min(delay, 60.0))  # re-check the clock after suspend
+                    continue
+
+                heapq.heappop(self._heap)
+                now = self._clock()
+                # the next tick after now: missed ticks collapse into this run
+                self._push(name, self._triggers[name].next_after(max(tick, now)))
+                self._dispatch(executor, name, tick)
+        return self.stats
+
+    def _dispatch(self, executor: ThreadPoolExecutor, name: str, tick: float) -> None:
+        with self._lock:
+            if name in self._running:
+                self.stats.skipped_overlap += 1
+                return
+            self._running.add(name)
+        self._state[name] = tick
+        self._write_state()
+        executor.submit(self._execute, name)
+
+    def _execute(self, name: str) -> None:
+        start = time.perf_counter()
+        try:
+            result = self._jobs[name].run(
+                instrument=self.instrument, cache=self.cache
+            )
+        finally:
+            with self._lock:
+                self._running.discard(name)
+        run = JobRun(
+            name=name,
+            status="succeeded" if result.success else "failed",
+            result=result,
+            seconds=time.perf_counter() - start,
+        )
+        with self._lock:
+            self.stats.runs += 1
+            if not result.success:
+                self.stats.failures += 1
+        if self.on_run is not None:
+            self.on_run(run)
+
+
+def _build(registry: Registry, entry: ScheduledJob) -> Job:
+    spec = registry.get_spec(entry.job)
+    if spec is not None and entry.options:
+        return spec.load(**{**registry.options, **entry.options})
+    job = registry.get(entry.job)
+    if job is None:
+        raise ValueError(f"Schedule '{entry.name}': job '{entry.job}' not found")
+    if entry.options:
+        raise ValueError(
+            f"Schedule '{entry.name}': options need a lazily registered job"
+        )
+    return job
+
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import warnings
+from typing import Any, Optional
+
+from autoops.core.registry import JobSpec, Registry
+
+# Built-in jobs: registered by name only, imported when they run.
+BUILTIN_JOBS = (
+    JobSpec(
+        name="example",
+        description="Example job for demonstration purposes",
+        factory="autoops.jobs.example:example_factory",
+    ),
+    JobSpec(
+        name="organize-files",
+        description="Organize files into categorized folders",
+        factory="autoops.jobs.organize_files:organize_files_factory",
+    ),
+)
+
+
+def build_registry(
+    *, plugins: bool = True, for_job: Optional[str] = None, **options: Any
+) -> Registry:
+    """
+    Builds and returns a registry with all available jobs.
+
+    Nothing is imported or read here: jobs are lazy specs, and `options`
+    (config_path, source_dir, dry_run, on_move, ...) are handed to the job
+    factory only when a job is fetched with registry.get(). With plugins=True,
+    jobs installed through the "autoops.jobs" entry point group are added
+    from the cached discovery manifest; for_job naming a built-in job skips
+    that lookup, since only that job is going to be used.
+    """
+    registry = Registry(options=options)
+    for spec in BUILTIN_JOBS:
+        registry.register_lazy(spec)
+
+    if for_job is not None and registry.describe(for_job) is not None:
+        plugins = False
+    if plugins:
+        from autoops.core.plugins import discover_jobs
+
+        for spec in discover_jobs():
+            try:
+                registry.register_lazy(spec)
+            except ValueError:
+                warnings.warn(
+                    f"Ignoring job plugin '{spec.name}': name already in use",
+                    stacklevel=2,
+                )
+
+    return registry
@@ -16,3 +16,10 @@ example_job = Job(
     description="Example job for demonstration purposes",
     handler=example_handler,
 )
+
+
+def example_factory(**_options):
+    """
+    Job factory for the lazy registry (the example job takes no options).
+    """
+    return example_handler
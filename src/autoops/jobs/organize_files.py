@@ -1,86 +1,776 @@
 from __future__ import annotations
 
-import shutil
+import hashlib
+import multiprocessing
+import os
+import pickle
+import stat
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
+from autoops.config.categories import CategoryIndex
+from autoops.config.loader import (
+    OrganizeDedupConfig,
+    OrganizeFilesLoadedConfig,
+    OrganizeSniffConfig,
+    OrganizeThrottleConfig,
+    OrganizeTransferConfig,
+    load_organize_files_config,
+    organize_sources,
+)
+from autoops.core.job import JobResult
+from autoops.core.metrics import Metrics, collecting, current_metrics
+from autoops.utils.collisions import NameIndexes
+from autoops.utils.dedup import HashCache, default_hash_cache_path, find_duplicates
+from autoops.utils.journal import MoveJournal, locate_moved
+from autoops.utils.moves import make_executor, move_file
+from autoops.utils.plan import MovePlan
+from autoops.utils.scan import scan_files
+from autoops.utils.scan_state import ScanState, default_state_path
+from autoops.utils.sniff import Sniffer
+from autoops.utils.throttle import IOThrottle, thread_priority
+from autoops.utils.transfer import FileCopier, ProgressCallback
 
-def _dedupe_target_path(target_path: Path) -> Path:
+# Files classified together when content sniffing is on: unknown files in a
+# window are sniffed as one parallel batch, and the window keeps scan order.
+_SNIFF_WINDOW = 256
+
+# Planned moves checked, journaled and handed to the movers at a time by
+# apply_plan (target folders are created once per batch).
+_APPLY_BATCH = 4096
+
+# A directory modified this recently may still change within the same mtime
+# tick, so its mtime cannot vouch for its contents (git's "racy" entries).
+_RACY_SECONDS = 2.0
+
+
+class PlannedMove(NamedTuple):
+    """
+    One file the pipeline decided to move (NamedTuple: cheap per-file record).
+    """
+
+    source: str
+    rel_source: str
+    category: str
+    target_dir: Path
+    name: str
+    inode: int = 0
+    size: int = -1  # -1: not known without a stat
+
+    @property
+    def rel_target(self) -> str:
+        return os.path.join(self.category, self.name)
+
+
+class FileRef(NamedTuple):
+    """
+    Minimal DirEntry stand-in for files handed to the pipeline explicitly.
+    """
+
+    path: str
+    name: str
+    ino: int = 0
+
+    def inode(self) -> int:
+        return self.ino
+
+
+def _existing_files(paths: Iterable[str], metrics: Metrics) -> Iterator[FileRef]:
+    for path in paths:
+        if metrics.enabled:
+            metrics.count("stat_calls")
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            yield FileRef(path=path, name=os.path.basename(path), ino=st.st_ino)
+
+
+def _classify(
+    entries: Iterable[os.DirEntry],
+    index: CategoryIndex,
+    others_dir: str,
+    sniffer: Optional[Sniffer] = None,
+) -> Iterator[Tuple[os.DirEntry, str]]:
+    lookup = index.lookup
+    if sniffer is None:
+        for entry in entries:
+            yield entry, lookup(entry.name) or others_dir
+        return
+
+    by_extension = index.by_extension
+    window: List[Tuple[os.DirEntry, Optional[str]]] = []
+
+    def drain() -> Iterator[Tuple[os.DirEntry, str]]:
+        unknown = [entry.path for entry, category in window if category is None]
+        detected = sniffer.sniff(unknown) if unknown else {}
+        for entry, category in window:
+            if category is None:
+                ext = detected.get(entry.path)
+                category = (ext and by_extension.get(ext)) or others_dir
+            yield entry, category
+        window.clear()
+
+    for entry in entries:
+        window.append((entry, lookup(entry.name)))
+        if len(window) >= _SNIFF_WINDOW:
+            yield from drain()
+    yield from drain()
+
+
+def _plan(
+    classified: Iterable[Tuple[os.DirEntry, str]],
+    source_dir: Path,
+    destination_dir: Path,
+    with_inode: bool = False,
+    with_size: bool = False,
+) -> Iterator[PlannedMove]:
+    prefix_len = len(os.path.join(str(source_dir), ""))
+    target_dirs: Dict[str, Path] = {}
+    for entry, category in classified:
+        target_dir = target_dirs.get(category)
+        if target_dir is None:
+            target_dir = target_dirs[category] = destination_dir / category
+        yield PlannedMove(
+            source=entry.path,
+            rel_source=entry.path[prefix_len:],
+            category=category,
+            target_dir=target_dir,
+            name=entry.name,
+            # free on POSIX (from the listing), a stat on Windows: only on demand
+            inode=entry.inode() if with_inode else 0,
+            # only when the scan already stat'ed the entry (DirEntry caches it)
+            size=entry.stat().st_size if with_size else -1,
+        )
+
+
+def category_dirs(
+    index: CategoryIndex,
+    others_dir: str,
+    source_dir: Path,
+    destination_dir: Path,
+    extra: Iterable[str] = (),
+) -> List[Path]:
+    """
+    Directories a recursive scan must not descend into: the category folders
+    (already organized output), or the whole destination when it is separate.
+    """
+    if destination_dir != source_dir:
+        return [destination_dir]
+    return [destination_dir / c for c in (*index.categories, others_dir, *extra)]
+
+
+def _find_planned_duplicates(
+    moves: List[PlannedMove], dedup: OrganizeDedupConfig
+) -> Dict[str, str]:
+    """
+    Compare planned moves against each other and against the files already
+    in their target folders. Returns {source: canonical_path}.
+    """
+    existing: List[str] = []
+    for target_dir in {move.target_dir for move in moves}:
+        try:
+            with os.scandir(target_dir) as it:
+                existing.extend(e.path for e in it if e.is_file())
+        except FileNotFoundError:
+            continue
+
+    with HashCache(default_hash_cache_path()) as cache:
+        return find_duplicates(
+            [move.source for move in moves],
+            sorted(existing),
+            workers=dedup.hash_workers,
+            cache=cache,
+        )
+
+
+def _link_into(canonical: str, target: str) -> None:
+    """
+    Atomically replace `target` (a reserved placeholder) with a hard link to
+    `canonical`.
     """
-    If target_path exists, create a non-colliding variant like:
-    file.ext -> file_1.ext -> file_2.ext ...
+    tmp = f"{target}.autoops-link"
+    os.link(canonical, tmp)
+    try:
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _scan_fingerprint(
+    index: CategoryIndex,
+    others_dir: str,
+    destination_dir: Path,
+    recursive: bool,
+    max_depth: Optional[int],
+    exclude: Iterable[str],
+) -> str:
+    """
+    Identify the settings an incremental scan state was recorded under.
+    """
+    parts = (
+        str(destination_dir),
+        others_dir,
+        recursive,
+        max_depth,
+        sorted(exclude),
+        sorted(index.by_extension.items()),
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _subdirectories(root: Path, max_depth: Optional[int]) -> Iterator[str]:
+    pending = [(str(root), 0)]
+    while pending:
+        path, depth = pending.pop()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield entry.path
+                        pending.append((entry.path, depth + 1))
+        except OSError:
+            continue
+
+
+def input_fingerprint(
+    loaded: OrganizeFilesLoadedConfig, *extra: Any
+) -> Optional[str]:
     """
-    if not target_path.exists():
-        return target_path
+    Cheap identity of what an organize run would see: the resolved config
+    plus (device, inode, mtime) of every source folder (and its subfolders
+    when recursive) and of the destination and category folders. Adding,
+    removing or renaming a file changes its folder's mtime; editing a
+    file's bytes does not, which only matters for dedup and sniffing.
+
+    None when a folder changed in the last _RACY_SECONDS.
+    """
+    folders: List[str] = []
+    for source, destination in organize_sources(loaded):
+        folders += [str(source), str(destination)]
+        folders += [str(destination / c) for c in loaded.category_index.categories]
+        folders.append(str(destination / loaded.others_dir))
+        if loaded.dedup.enabled:
+            folders.append(str(destination / loaded.dedup.quarantine_dir))
+        if loaded.recursive:
+            folders += sorted(_subdirectories(source, loaded.max_depth))
+
+    now = time.time()
+    stats: List[Optional[Tuple[int, int, int]]] = []
+    for folder in folders:
+        try:
+            st = os.stat(folder)
+        except OSError:
+            stats.append(None)
+            continue
+        if now - st.st_mtime < _RACY_SECONDS:
+            return None
+        stats.append((st.st_dev, st.st_ino, st.st_mtime_ns))
+
+    digest = hashlib.sha256(pickle.dumps(loaded, protocol=4))
+    digest.update(repr((extra, folders, stats)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_io_throttle(
+    config: Optional[OrganizeThrottleConfig],
+) -> Optional[IOThrottle]:
+    """
+    The move budget of a throttle config, or None when it sets no limit.
+    """
+    if config is None or (
+        config.bytes_per_second is None
+        and config.ops_per_second is None
+        and config.target_latency is None
+    ):
+        return None
+    return IOThrottle(
+        bytes_per_second=config.bytes_per_second,
+        ops_per_second=config.ops_per_second,
+        target_latency=config.target_latency,
+    )
+
+
+def _priority_initializer(
+    config: Optional[OrganizeThrottleConfig],
+) -> Optional[Callable[[], None]]:
+    # applied to the run's own move threads only: the caller's thread may be
+    # a pool thread (run-many, schedule) that runs unrelated jobs afterwards
+    if config is None:
+        return None
+    return thread_priority(
+        nice=config.nice, ionice=config.ionice, level=config.ionice_level
+    )
 
-    stem = target_path.stem
-    suffix = target_path.suffix
-    parent = target_path.parent
 
-    i = 1
-    while True:
-        candidate = parent / f"{stem}_{i}{suffix}"
-        if not candidate.exists():
-            return candidate
-        i += 1
+def _file_copier(
+    config: Optional[OrganizeTransferConfig],
+    throttle: Optional[IOThrottle],
+    metrics: Metrics,
+    progress: Optional[ProgressCallback],
+) -> FileCopier:
+    config = config or OrganizeTransferConfig()
+    return FileCopier(
+        workers=config.workers,
+        parallel_min_size=config.parallel_min_size,
+        verify=config.verify,
+        throttle=throttle,
+        progress=progress,
+        metrics=metrics,
+    )
 
 
 def organize_files(
     source_dir: Path,
     destination_dir: Path,
-    categories: Dict[str, List[str]],
+    categories: Union[CategoryIndex, Mapping[str, List[str]]],
     others_dir: str,
     dry_run: bool = True,
     preview: bool = False,
+    *,
+    recursive: bool = False,
+    max_depth: Optional[int] = None,
+    exclude: Iterable[str] = (),
+    workers: int = 1,
+    on_move: Optional[Callable[[Dict[str, Any]], None]] = None,
+    preview_limit: Optional[int] = None,
+    incremental: bool = False,
+    state_path: Optional[Path] = None,
+    only: Optional[Iterable[str]] = None,
+    dedup: Optional[OrganizeDedupConfig] = None,
+    journal: Optional[MoveJournal] = None,
+    sniff: Optional[OrganizeSniffConfig] = None,
+    throttle: Optional[OrganizeThrottleConfig] = None,
+    transfer: Optional[OrganizeTransferConfig] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    io_throttle: Optional[IOThrottle] = None,
 ) -> Dict:
+    """
+    Move files from source_dir into <destination_dir>/<category>/ folders.
+
+    `categories` may be a precompiled CategoryIndex (what the config loader
+    produces) or a plain {category: [extensions]} mapping.
+
+    Files flow through a lazy generator pipeline (scan -> classify -> plan ->
+    execute), so memory stays flat regardless of directory size.
+    With recursive=True, subdirectories are scanned too (bounded by max_depth,
+    filtered by `exclude` globs) and their files are flattened into the
+    category folders.
+    With workers > 1, moves run on a thread pool; moves into the same
+    category folder stay serialized in scan order, so collision renames and
+    the returned counts match a serial run.
+
+    on_move, when given, is called with one record per file as the pipeline
+    goes ({"type": "planned" | "moved", "source", "target", "category"}),
+    always from one thread at a time. preview_limit caps how many planned
+    moves are kept in `preview_moves` and reported to on_move; counting
+    continues past the cap.
+
+    With incremental=True, a per-source ScanState (SQLite under the user data
+    dir, or `state_path`) lets the run skip unchanged directories and files
+    an earlier run already handled. Dry-run/preview runs keep their own state,
+    so previewing never hides files from a later real run.
+
+    `only` replaces the directory scan with an explicit list of file paths
+    inside source_dir (used by watch mode); missing paths are ignored.
+
+    With an enabled `dedup` config, planned moves are checked for byte-identical
+    copies (among themselves and against files already in the target folders)
+    before anything moves; duplicates are skipped, hard-linked to the existing
+    copy or moved to the quarantine folder, and reported under "duplicates".
+    This stage needs the full plan, so memory grows with the number of files.
+
+    With a `journal` (real runs only), every move is recorded as planned
+    (with its action: move, quarantine or link) before it starts and as done
+    after it finishes, with one fsync per batch. Plans left unfinished by a
+    crashed attempt (journal.pending) are completed first from the journal
+    alone: each is found where it landed or replayed with its own action,
+    after deleting the empty names the crash left reserved. The run then
+    continues with a normal scan of source_dir, which only finds files the
+    crashed attempt never planned (incremental runs also skip the folders
+    it had finished); `undo_run` can revert a journaled run.
+
+    With an enabled `sniff` config, files whose extension matches no category
+    are identified by their first bytes and filed under the category of the
+    detected type (others_dir when that type is not configured either).
+
+    With an enabled `throttle` config, every move (and cross-device copy)
+    draws on one IOThrottle shared by the move threads: `io_throttle` when
+    given (a budget that outlives the call, e.g. across watch batches),
+    else one built from the config. nice/ionice are applied to move
+    threads the run starts for itself (even for workers=1) and that exit
+    with it, so the caller's thread keeps its priority.
+
+    Moves across filesystems are copied in the kernel by a FileCopier set
+    up from `transfer` (large files in parallel ranges, optionally verified
+    before the source is removed); on_progress(source, copied, total) is
+    called from the copying threads as each chunk lands.
+
+    When the calling job runs instrumented (Job.run(instrument=True)), the
+    pipeline records exclusive-time spans (scan, classify, plan, dedup,
+    mkdir, claim, move, copy, verify, journal, wait) and counters
+    (files_scanned, files_moved, bytes_moved, files_copied, bytes_copied,
+    copy_<method>, stat_calls, mkdir_calls, renamed_on_collision).
+    Instrumentation adds no syscalls: stat_calls counts the stats the
+    pipeline makes anyway, and bytes_moved sums the sizes it already knows
+    (from the incremental scan's stat, else the bytes a copy moved).
+    Uninstrumented runs skip all of it.
+    """
+    if isinstance(categories, CategoryIndex):
+        index = categories
+    else:
+        index = CategoryIndex.compile(categories)
+
     moved_by_category: Dict[str, int] = {}
     preview_moves: List[Tuple[str, str]] = []
 
-    for category in categories:
+    for category in index.categories:
         moved_by_category[category] = 0
     moved_by_category[others_dir] = 0
 
     source_dir = source_dir.resolve()
     destination_dir = destination_dir.resolve()
 
-    for item in source_dir.iterdir():
-        if not item.is_file():
-            continue
+    metrics = current_metrics()
+    instrumented = metrics.enabled
+    dedup_enabled = dedup is not None and dedup.enabled
+    journaling = journal is not None and not (preview or dry_run)
+    initializer = None
+    if preview or dry_run:
+        io_throttle = None
+    else:
+        io_throttle = io_throttle or build_io_throttle(throttle)
+        initializer = _priority_initializer(throttle)
+    copier = _file_copier(transfer, io_throttle, metrics, on_progress)
+    stack = ExitStack()
+    state: Optional[ScanState] = None
+    if incremental and only is None:
+        state = stack.enter_context(
+            ScanState(
+                state_path
+                or default_state_path(
+                    source_dir, "dry" if (preview or dry_run) else ""
+                ),
+                fingerprint=_scan_fingerprint(
+                    index, others_dir, destination_dir, recursive, max_depth, exclude
+                ),
+            )
+        )
+
+    if only is not None:
+        entries: Iterable = _existing_files(only, metrics)
+    else:
+        entries = scan_files(
+            source_dir,
+            recursive=recursive,
+            max_depth=max_depth,
+            exclude=exclude,
+            skip_dirs=(
+                category_dirs(
+                    index,
+                    others_dir,
+                    source_dir,
+                    destination_dir,
+                    extra=(dedup.quarantine_dir,) if dedup_enabled else (),
+                )
+                if recursive
+                else ()
+            ),
+            state=state,
+        )
+    sniffer: Optional[Sniffer] = None
+    if sniff is not None and sniff.enabled:
+        sniffer = stack.enter_context(
+            Sniffer(
+                workers=sniff.workers,
+                cache=stack.enter_context(HashCache(default_hash_cache_path())),
+            )
+        )
+    moves: Iterable[PlannedMove] = metrics.timed_iter(
+        "plan",
+        _plan(
+            metrics.timed_iter(
+                "classify",
+                _classify(
+                    metrics.timed_iter("scan", entries, "files_scanned"),
+                    index,
+                    others_dir,
+                    sniffer,
+                ),
+            ),
+            source_dir,
+            destination_dir,
+            with_inode=journaling,
+            with_size=instrumented and state is not None,
+        ),
+    )
+
+    duplicates_of: Dict[str, str] = {}
+    deferred_links: List[Tuple[PlannedMove, str]] = []
+    final_paths: Dict[str, str] = {}
+    if dedup_enabled:
+        moves = list(moves)
+        with metrics.span("dedup"):
+            duplicates_of = _find_planned_duplicates(moves, dedup)
+    canonical_sources = set(duplicates_of.values())
 
-        ext = item.suffix.lower()
-        target_category = None
+    counts_lock = threading.Lock()
+    name_indexes = NameIndexes()
+    made_dirs: Set[Path] = set()
 
-        for category, extensions in categories.items():
-            if ext in extensions:
-                target_category = category
-                break
+    def place(
+        source: str,
+        target_dir: Path,
+        name: str,
+        seq: Optional[int],
+        size: int = -1,
+    ) -> str:
+        if target_dir not in made_dirs:
+            with metrics.span("mkdir"):
+                target_dir.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(target_dir)
+            if instrumented:
+                metrics.count("mkdir_calls")
 
-        if target_category is None:
-            target_category = others_dir
+        # Avoid collisions safely: file.ext -> file_1.ext -> file_2.ext ...
+        names = name_indexes.for_directory(str(target_dir))
+        with metrics.span("claim"):
+            final_target = names.claim(name)
+        try:
+            with metrics.span("move"):
+                copied = move_file(source, final_target, io_throttle, copier)
+        except BaseException:
+            names.release(final_target)
+            raise
+        if seq is not None:
+            journal.record_done(seq, final_target)
+        if instrumented:
+            metrics.count("files_moved")
+            metrics.count("bytes_moved", size if size >= 0 else copied)
+            if os.path.basename(final_target) != name:
+                metrics.count("renamed_on_collision")
+        return final_target
 
-        target_dir = destination_dir / target_category
-        target_path = target_dir / item.name
+    def link(
+        source: str, target_dir: Path, name: str, canonical: str, seq: Optional[int]
+    ) -> str:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        names = name_indexes.for_directory(str(target_dir))
+        final_target = names.claim(name)
+        try:
+            _link_into(canonical, final_target)
+        except BaseException:
+            names.release(final_target)
+            raise
+        os.unlink(source)
+        if seq is not None:
+            journal.record_done(seq, final_target)
+        return final_target
 
-        # preview list uses relative paths to be readable
-        preview_moves.append(
-            (
-                str(item.relative_to(source_dir)),
-                str(target_path.relative_to(destination_dir)),
+    def report_duplicate(move: PlannedMove, canonical: str) -> None:
+        if on_move is not None:
+            on_move(
+                {
+                    "type": "duplicate",
+                    "source": move.rel_source,
+                    "duplicate_of": canonical,
+                    "action": dedup.action,
+                    "category": move.category,
+                }
             )
+
+    def quarantine(move: PlannedMove, canonical: str, seq: Optional[int]) -> None:
+        place(
+            move.source,
+            destination_dir / dedup.quarantine_dir,
+            move.name,
+            seq,
+            move.size,
         )
+        with counts_lock:
+            report_duplicate(move, canonical)
 
-        # dry-run / preview: count but do not touch filesystem
-        if preview or dry_run:
-            moved_by_category[target_category] += 1
-            continue
+    def execute(move: PlannedMove, seq: Optional[int]) -> None:
+        final_target = place(move.source, move.target_dir, move.name, seq, move.size)
+        with counts_lock:
+            if move.source in canonical_sources:
+                final_paths[move.source] = final_target
+            moved_by_category[move.category] += 1
+            if on_move is not None:
+                on_move(
+                    {
+                        "type": "moved",
+                        "source": move.rel_source,
+                        "target": os.path.join(
+                            move.category, os.path.basename(final_target)
+                        ),
+                        "category": move.category,
+                    }
+                )
 
-        target_dir.mkdir(parents=True, exist_ok=True)
+    batch: List[Tuple[Path, Callable[[], None]]] = []
+
+    def flush_batch() -> None:
+        # write-ahead: the plans are durable before any of these moves start
+        with metrics.span("journal"):
+            journal.commit()
+        for key, task in batch:
+            executor.submit(key, task)
+        batch.clear()
+
+    def submit(
+        target_dir: Path,
+        move: PlannedMove,
+        task: Callable[[Optional[int]], None],
+        action: str = "move",
+    ) -> None:
+        if not journaling:
+            executor.submit(target_dir, lambda: task(None))
+            return
+        seq = journal.record_plan(
+            move.source, str(target_dir), move.name, move.category, move.inode, action
+        )
+        batch.append((target_dir, lambda: task(seq)))
+        if len(batch) >= journal.batch_size:
+            flush_batch()
+
+    resumed = 0
+    duplicates_total = 0
+    if journaling and journal.pending:
+        unfinished: List[Dict[str, Any]] = []
+        finished: List[Dict[str, Any]] = []
+        for plan in journal.pending:
+            # a link can be made with its source still there; a move cannot
+            found = (
+                locate_moved(plan, journal.placed)
+                if plan.get("act") == "link" or not os.path.lexists(plan["src"])
+                else None
+            )
+            if found is None:
+                unfinished.append(plan)
+                continue
+            if os.path.lexists(plan["src"]):
+                os.unlink(plan["src"])
+            journal.record_done(plan["seq"], found)
+            journal.placed.add(found)
+            finished.append(plan)
+        for plan in unfinished:
+            journal.drop_placeholders(plan)
+        for plan in unfinished:
+            if not os.path.lexists(plan["src"]):
+                journal.record_lost(plan["seq"])
+                continue
+            target_dir = Path(plan["dir"])
+            if plan.get("act") == "link" and os.path.exists(plan["canon"]):
+                link(plan["src"], target_dir, plan["name"], plan["canon"], plan["seq"])
+            else:
+                # a link whose copy has gone keeps its data by moving instead
+                place(plan["src"], target_dir, plan["name"], plan["seq"])
+            finished.append(plan)
+        for plan in finished:
+            if plan.get("act", "move") == "move":
+                category = plan["cat"]
+                moved_by_category[category] = moved_by_category.get(category, 0) + 1
+            else:
+                duplicates_total += 1
+            resumed += 1
+        journal.pending = []
+        journal.placed = set()
+        journal.commit()
+
+    planned_reported = 0
+    with stack, make_executor(workers, initializer=initializer) as executor:
+        try:
+            for move in moves:
+                canonical = duplicates_of.get(move.source)
+                if canonical is not None:
+                    duplicates_total += 1
+                    if preview or dry_run or dedup.action == "skip":
+                        report_duplicate(move, canonical)
+                    elif dedup.action == "hardlink":
+                        # after all moves, so the canonical copy is in its final place
+                        deferred_links.append((move, canonical))
+                    else:
+                        submit(
+                            destination_dir / dedup.quarantine_dir,
+                            move,
+                            partial(quarantine, move, canonical),
+                            "quarantine",
+                        )
+                    continue
+
+                # dry-run / preview: count but do not touch filesystem
+                if preview or dry_run:
+                    if preview_limit is None or planned_reported < preview_limit:
+                        planned_reported += 1
+                        # preview list uses relative paths to be readable
+                        if preview:
+                            preview_moves.append((move.rel_source, move.rel_target))
+                        if on_move is not None:
+                            on_move(
+                                {
+                                    "type": "planned",
+                                    "source": move.rel_source,
+                                    "target": move.rel_target,
+                                    "category": move.category,
+                                }
+                            )
+                    moved_by_category[move.category] += 1
+                    continue
+
+                submit(move.target_dir, move, partial(execute, move))
 
-        # Avoid collisions safely
-        final_target = _dedupe_target_path(target_path)
+            if batch:
+                flush_batch()
+            with metrics.span("wait"):
+                executor.close()
 
-        shutil.move(str(item), str(final_target))
-        moved_by_category[target_category] += 1
+            for move, canonical in deferred_links:
+                linked_to = final_paths.get(canonical, canonical)
+                seq = None
+                if journaling:
+                    seq = journal.record_plan(
+                        move.source,
+                        str(move.target_dir),
+                        move.name,
+                        move.category,
+                        move.inode,
+                        "link",
+                        linked_to,
+                    )
+                    journal.commit()
+                link(move.source, move.target_dir, move.name, linked_to, seq)
+                report_duplicate(move, canonical)
+
+            if state is not None:
+                state.commit()
+        finally:
+            if journaling:
+                journal.commit()
 
     return {
         "moved_total": sum(moved_by_category.values()),
@@ -90,4 +780,527 @@ def organize_files(
         "source_dir": str(source_dir),
         "destination_dir": str(destination_dir),
         "preview_moves": preview_moves if preview else [],
+        "incremental": incremental,
+        "run_id": journal.run_id if journaling else None,
+        "resumed": resumed,
+        "duplicates": (
+            {"action": dedup.action, "total": duplicates_total}
+            if dedup_enabled
+            else None
+        ),
+    }
+
+
+def plan_organize(
+    source_dir: Path,
+    destination_dir: Path,
+    categories: Union[CategoryIndex, Mapping[str, List[str]]],
+    others_dir: str,
+    *,
+    recursive: bool = False,
+    max_depth: Optional[int] = None,
+    exclude: Iterable[str] = (),
+    sniff: Optional[OrganizeSniffConfig] = None,
+) -> MovePlan:
+    """
+    Decide an organize run without moving anything: scan and classify as
+    organize_files does, recording each file's move with the inode and
+    mtime it had, for apply_plan. Duplicate detection and incremental
+    state are not part of plans.
+    """
+    index = (
+        categories
+        if isinstance(categories, CategoryIndex)
+        else CategoryIndex.compile(categories)
+    )
+    source_dir = source_dir.resolve()
+    destination_dir = destination_dir.resolve()
+    metrics = current_metrics()
+    plan = MovePlan(
+        str(source_dir), str(destination_dir), [*index.categories, others_dir]
+    )
+    entries = scan_files(
+        source_dir,
+        recursive=recursive,
+        max_depth=max_depth,
+        exclude=exclude,
+        skip_dirs=(
+            category_dirs(index, others_dir, source_dir, destination_dir)
+            if recursive
+            else ()
+        ),
+    )
+    prefix_len = len(os.path.join(str(source_dir), ""))
+    with ExitStack() as stack:
+        sniffer: Optional[Sniffer] = None
+        if sniff is not None and sniff.enabled:
+            sniffer = stack.enter_context(
+                Sniffer(
+                    workers=sniff.workers,
+                    cache=stack.enter_context(HashCache(default_hash_cache_path())),
+                )
+            )
+        classified = _classify(
+            metrics.timed_iter("scan", entries, "files_scanned"),
+            index,
+            others_dir,
+            sniffer,
+        )
+        for entry, category in metrics.timed_iter("classify", classified):
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue  # gone since the listing
+            plan.add(
+                os.path.dirname(entry.path[prefix_len:]),
+                entry.name,
+                category,
+                st.st_ino,
+                st.st_mtime_ns,
+            )
+    return plan
+
+
+def apply_plan(
+    plan: MovePlan,
+    *,
+    workers: int = 1,
+    journal: Optional[MoveJournal] = None,
+    dry_run: bool = False,
+    throttle: Optional[OrganizeThrottleConfig] = None,
+    transfer: Optional[OrganizeTransferConfig] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict:
+    """
+    Execute a plan from plan_organize. A file whose inode or mtime differs
+    from the planned one (replaced or modified since) is skipped as stale,
+    a missing one as missing; the others move exactly as in organize_files
+    (collision renames, `workers` move threads, optional journal). Target
+    folders are created once per batch of moves, not once per file.
+    dry_run only checks the plan against the files. `throttle`, `transfer`
+    and on_progress work as in organize_files.
+
+    Returns the organize_files result shape plus "stale" and "missing".
+    """
+    metrics = current_metrics()
+    instrumented = metrics.enabled
+    source_dir = Path(plan.source_dir)
+    destination_dir = Path(plan.destination_dir)
+    target_dirs = [destination_dir / c for c in plan.categories]
+    moved_by_category = {c: 0 for c in plan.categories}
+    counts_lock = threading.Lock()
+    name_indexes = NameIndexes()
+    made: Set[int] = set()
+    stale = missing = 0
+    io_throttle = None if dry_run else build_io_throttle(throttle)
+    initializer = None if dry_run else _priority_initializer(throttle)
+    copier = _file_copier(transfer, io_throttle, metrics, on_progress)
+
+    def execute(
+        category_id: int, source: str, name: str, size: int, seq: Optional[int]
+    ) -> None:
+        names = name_indexes.for_directory(str(target_dirs[category_id]))
+        with metrics.span("claim"):
+            final_target = names.claim(name)
+        try:
+            with metrics.span("move"):
+                move_file(source, final_target, io_throttle, copier)
+        except BaseException:
+            names.release(final_target)
+            raise
+        if seq is not None:
+            journal.record_done(seq, final_target)
+        with counts_lock:
+            moved_by_category[plan.categories[category_id]] += 1
+        if instrumented:
+            metrics.count("files_moved")
+            metrics.count("bytes_moved", size)
+            if os.path.basename(final_target) != name:
+                metrics.count("renamed_on_collision")
+
+    with make_executor(workers, initializer=initializer) as executor:
+        try:
+            for batch in plan.batches(_APPLY_BATCH):
+                tasks: List[Tuple[int, Callable[[], None]]] = []
+                for entry in batch:
+                    source = os.path.join(
+                        plan.source_dir, plan.dirs[entry.dir_id], entry.name
+                    )
+                    try:
+                        st = os.lstat(source)
+                    except FileNotFoundError:
+                        missing += 1
+                        continue
+                    if (st.st_ino, st.st_mtime_ns) != (entry.inode, entry.mtime_ns):
+                        stale += 1
+                        continue
+                    if dry_run:
+                        moved_by_category[plan.categories[entry.category_id]] += 1
+                        continue
+                    seq = None
+                    if journal is not None:
+                        seq = journal.record_plan(
+                            source,
+                            str(target_dirs[entry.category_id]),
+                            entry.name,
+                            plan.categories[entry.category_id],
+                            entry.inode,
+                        )
+                    tasks.append(
+                        (
+                            entry.category_id,
+                            partial(
+                                execute,
+                                entry.category_id,
+                                source,
+                                entry.name,
+                                st.st_size,
+                                seq,
+                            ),
+                        )
+                    )
+                if instrumented:
+                    metrics.count("stat_calls", len(batch))
+
+                with metrics.span("mkdir"):
+                    for category_id in {c for c, _ in tasks} - made:
+                        target_dirs[category_id].mkdir(parents=True, exist_ok=True)
+                        made.add(category_id)
+                        if instrumented:
+                            metrics.count("mkdir_calls")
+                if journal is not None and tasks:
+                    # write-ahead: the plans are durable before these moves start
+                    with metrics.span("journal"):
+                        journal.commit()
+                for category_id, task in tasks:
+                    executor.submit(category_id, task)
+            with metrics.span("wait"):
+                executor.close()
+        finally:
+            if journal is not None:
+                journal.commit()
+
+    return {
+        "moved_total": sum(moved_by_category.values()),
+        "moved_by_category": moved_by_category,
+        "dry_run": dry_run,
+        "preview": False,
+        "source_dir": str(source_dir),
+        "destination_dir": str(destination_dir),
+        "preview_moves": [],
+        "incremental": False,
+        "run_id": journal.run_id if journal is not None else None,
+        "resumed": 0,
+        "duplicates": None,
+        "stale": stale,
+        "missing": missing,
+    }
+
+
+def _organize_shard(
+    options: Dict[str, Any], journal: bool, instrument: bool
+) -> Tuple[Dict, Optional[Dict[str, Any]]]:
+    """
+    One shard of organize_many (run in a worker process, or inline):
+    organize_files on one source, journaled on its own when `journal`.
+    With instrument, the shard's spans and counters are returned too.
+    """
+    move_journal = None
+    if journal:
+        move_journal = MoveJournal.create(
+            source_dir=str(options["source_dir"]),
+            destination_dir=str(options["destination_dir"]),
+        )
+    status = "failed"
+    try:
+        if instrument:
+            metrics = Metrics()
+            with collecting(metrics):
+                result = organize_files(**options, journal=move_journal)
+            status = "completed"
+            return result, metrics.as_dict()
+        result = organize_files(**options, journal=move_journal)
+        status = "completed"
+        return result, None
+    finally:
+        if move_journal is not None:
+            move_journal.close(status)
+
+
+def organize_many(
+    shards: Sequence[Tuple[Path, Path]],
+    categories: Union[CategoryIndex, Mapping[str, List[str]]],
+    others_dir: str,
+    dry_run: bool = True,
+    preview: bool = False,
+    *,
+    processes: Optional[int] = None,
+    journal: bool = False,
+    on_move: Optional[Callable[[Dict[str, Any]], None]] = None,
+    preview_limit: Optional[int] = None,
+    **options: Any,
+) -> Dict:
+    """
+    Organize several (source, destination) folders, one shard per source.
+    Each shard runs the whole organize_files pipeline (scan, classify, plan,
+    move) in a pool of `processes` worker processes (default: one per CPU,
+    at most one per shard); `options` are passed on to every shard.
+
+    Shards that share a destination need no coordination beyond what one
+    run already does: every target name is reserved with an exclusive
+    create before the file moves (DirectoryNameIndex.claim), so a name
+    another shard took first is skipped, never overwritten. A `throttle`
+    budget is split evenly between the worker processes.
+
+    The result has the organize_files shape with counts and preview moves
+    merged across shards, plus one summary per shard under "sources" (with
+    its journal run_id, or the error that stopped it). A failing shard does
+    not stop the others. With on_move (not shareable between processes) or
+    a single worker, shards run one after the other in this process.
+    """
+    index = (
+        categories
+        if isinstance(categories, CategoryIndex)
+        else CategoryIndex.compile(categories)
+    )
+    common = dict(
+        options,
+        categories=index,
+        others_dir=others_dir,
+        dry_run=dry_run,
+        preview=preview,
+        preview_limit=preview_limit,
+    )
+    journal = journal and not (preview or dry_run)
+    workers = min(processes or os.cpu_count() or 1, len(shards)) or 1
+    throttle = options.get("throttle")
+    if throttle is not None and workers > 1 and on_move is None:
+        # one budget per process: split the configured one between them
+        common["throttle"] = replace(
+            throttle,
+            bytes_per_second=throttle.bytes_per_second
+            and max(1, throttle.bytes_per_second // workers),
+            ops_per_second=throttle.ops_per_second
+            and throttle.ops_per_second / workers,
+        )
+
+    outcomes: List[Tuple[Optional[Dict], Optional[BaseException]]] = []
+    metrics = current_metrics()
+    if workers == 1 or on_move is not None:
+        for source, destination in shards:
+            shard = dict(common, source_dir=source, destination_dir=destination)
+            try:
+                result, _ = _organize_shard(
+                    dict(shard, on_move=on_move), journal, False
+                )
+            except Exception as exc:
+                outcomes.append((None, exc))
+            else:
+                outcomes.append((result, None))
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in methods else "spawn"
+        )
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _organize_shard,
+                    dict(common, source_dir=source, destination_dir=destination),
+                    journal,
+                    metrics.enabled,
+                )
+                for source, destination in shards
+            ]
+            for future in futures:
+                try:
+                    result, shard_metrics = future.result()
+                except Exception as exc:
+                    outcomes.append((None, exc))
+                    continue
+                outcomes.append((result, None))
+                if shard_metrics is not None:
+                    for name, span in shard_metrics["spans"].items():
+                        metrics.add_time(name, span["seconds"], span["calls"])
+                    for name, n in shard_metrics["counters"].items():
+                        metrics.count(name, n)
+
+    moved_by_category: Dict[str, int] = {c: 0 for c in index.categories}
+    moved_by_category[others_dir] = 0
+    preview_moves: List[Tuple[str, str]] = []
+    duplicates_total = 0
+    resumed = 0
+    summaries: List[Dict[str, Any]] = []
+    for (source, destination), (result, error) in zip(shards, outcomes):
+        summary: Dict[str, Any] = {
+            "source_dir": str(source),
+            "destination_dir": str(destination),
+            "moved_total": 0,
+            "run_id": None,
+            "error": None if error is None else f"{type(error).__name__}: {error}",
+        }
+        if result is not None:
+            summary["moved_total"] = result["moved_total"]
+            summary["run_id"] = result["run_id"]
+            for category, n in result["moved_by_category"].items():
+                moved_by_category[category] = moved_by_category.get(category, 0) + n
+            preview_moves.extend(result["preview_moves"])
+            resumed += result["resumed"]
+            if result["duplicates"]:
+                duplicates_total += result["duplicates"]["total"]
+        summaries.append(summary)
+
+    dedup = options.get("dedup")
+    destinations = {str(destination) for _, destination in shards}
+    return {
+        "moved_total": sum(moved_by_category.values()),
+        "moved_by_category": moved_by_category,
+        "dry_run": dry_run,
+        "preview": preview,
+        "source_dir": None,
+        "destination_dir": destinations.pop() if len(destinations) == 1 else None,
+        "preview_moves": preview_moves[:preview_limit],
+        "incremental": bool(options.get("incremental")),
+        "run_id": None,
+        "resumed": resumed,
+        "duplicates": (
+            {"action": dedup.action, "total": duplicates_total}
+            if dedup is not None and dedup.enabled
+            else None
+        ),
+        "sources": summaries,
     }
+
+
+def organize_files_factory(
+    *,
+    config_path: Optional[Path] = None,
+    source_dir: Optional[Path] = None,
+    destination_dir: Optional[Path] = None,
+    dry_run: bool = True,
+    preview: bool = False,
+    recursive: Optional[bool] = None,
+    workers: Optional[int] = None,
+    incremental: Optional[bool] = None,
+    journal: Optional[bool] = None,
+    resume: Optional[str] = None,
+    on_move: Optional[Callable[[Dict[str, Any]], None]] = None,
+    preview_limit: Optional[int] = None,
+    **_options: Any,
+) -> Callable[[], Dict]:
+    """
+    Job factory for the lazy registry: returns the organize-files handler.
+    The YAML config (configs/organize_files.yaml unless config_path is given)
+    is only read when the handler runs; the other arguments override it.
+    The handler's `fingerprint` (input_fingerprint) lets Job.run skip runs
+    whose folders did not change; runs that stream moves or resume a
+    journal are never skipped.
+    """
+
+    def load() -> OrganizeFilesLoadedConfig:
+        return load_organize_files_config(
+            config_path or Path("configs/organize_files.yaml"),
+            source_dir=source_dir,
+            destination_dir=destination_dir,
+            dry_run=dry_run,
+            recursive=recursive,
+            workers=workers,
+            incremental=incremental,
+            journal=journal,
+        )
+
+    def fingerprint() -> Optional[str]:
+        if resume is not None or on_move is not None:
+            return None
+        return input_fingerprint(load(), preview, preview_limit)
+
+    def organize_handler() -> Dict:
+        loaded = load()
+
+        # preview = show what would be moved, without touching files
+        effective_dry_run = True if preview else loaded.dry_run
+
+        if loaded.sources:
+            if resume is not None:
+                raise ValueError("--resume needs a single source (--source-dir)")
+            return organize_all(loaded, effective_dry_run)
+
+        move_journal = None
+        if resume is not None:
+            if effective_dry_run:
+                raise ValueError("--resume needs a real run (--no-dry-run)")
+            move_journal = MoveJournal.resume(resume)
+        elif loaded.journal and not effective_dry_run:
+            move_journal = MoveJournal.create(
+                source_dir=str(loaded.source_dir),
+                destination_dir=str(loaded.destination_dir),
+            )
+
+        status = "failed"
+        try:
+            result = organize_files(
+                source_dir=loaded.source_dir,
+                destination_dir=loaded.destination_dir,
+                categories=loaded.category_index,
+                others_dir=loaded.others_dir,
+                dry_run=effective_dry_run,
+                preview=preview,
+                recursive=loaded.recursive,
+                max_depth=loaded.max_depth,
+                exclude=loaded.exclude,
+                workers=loaded.workers,
+                on_move=on_move,
+                preview_limit=preview_limit,
+                incremental=loaded.incremental,
+                dedup=loaded.dedup,
+                sniff=loaded.sniff,
+                throttle=loaded.throttle,
+                transfer=loaded.transfer,
+                journal=move_journal,
+            )
+            status = "completed"
+            return result
+        finally:
+            if move_journal is not None:
+                move_journal.close(status)
+
+    def organize_all(
+        loaded: OrganizeFilesLoadedConfig, effective_dry_run: bool
+    ) -> Union[Dict, JobResult]:
+        shards = organize_sources(loaded)
+        if not shards:
+            raise ValueError("organize_files.sources matches no folder")
+        result = organize_many(
+            shards,
+            categories=loaded.category_index,
+            others_dir=loaded.others_dir,
+            dry_run=effective_dry_run,
+            preview=preview,
+            processes=loaded.processes,
+            journal=loaded.journal,
+            on_move=on_move,
+            preview_limit=preview_limit,
+            recursive=loaded.recursive,
+            max_depth=loaded.max_depth,
+            exclude=loaded.exclude,
+            workers=loaded.workers,
+            incremental=loaded.incremental,
+            dedup=loaded.dedup,
+            sniff=loaded.sniff,
+            throttle=loaded.throttle,
+            transfer=loaded.transfer,
+        )
+        failed = [s for s in result["sources"] if s["error"] is not None]
+        if not failed:
+            return result
+        return JobResult(
+            success=False,
+            message=f"{len(failed)} of {len(shards)} source(s) failed",
+            data=result,
+            error=RuntimeError(
+                "; ".join(f"{s['source_dir']}: {s['error']}" for s in failed)
+            ),
+        )
+
+    organize_handler.fingerprint = fingerprint  # type: ignore[attr-defined]
+    return organize_handler
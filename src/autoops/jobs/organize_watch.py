@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from autoops.config.loader import OrganizeFilesLoadedConfig
+from autoops.jobs.organize_files import (
+    build_io_throttle,
+    category_dirs,
+    organize_files,
+)
+from autoops.utils.scan import scan_files
+from autoops.utils.watch import make_watcher
+
+
+class _Stabilizer:
+    """
+    Tracks candidate files until their size and mtime stop changing.
+    """
+
+    def __init__(self, settle_seconds: float) -> None:
+        self.settle_seconds = settle_seconds
+        # path -> ((size, mtime_ns), stable_since)
+        self._pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def track(self, path: str, now: float) -> None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._pending.pop(path, None)
+            return
+        self._pending[path] = ((st.st_size, st.st_mtime_ns), now)
+
+    def pop_ready(self, now: float) -> List[str]:
+        """
+        Return (and forget) files unchanged for at least settle_seconds.
+        """
+        ready: List[str] = []
+        for path, (sig, since) in list(self._pending.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self._pending[path]
+                continue
+            current = (st.st_size, st.st_mtime_ns)
+            if current != sig:
+                self._pending[path] = (current, now)
+            elif now - since >= self.settle_seconds:
+                del self._pending[path]
+                ready.append(path)
+        return ready
+
+
+def watch_organize(
+    loaded: OrganizeFilesLoadedConfig,
+    *,
+    dry_run: bool,
+    on_batch: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_move: Optional[Callable[[Dict[str, Any]], None]] = None,
+    stop: Optional[threading.Event] = None,
+    force_polling: Optional[bool] = None,
+    on_error: Optional[Callable[[Exception, List[str]], None]] = None,
+) -> None:
+    """
+    Keep organizing loaded.source_dir as files arrive, until `stop` is set.
+
+    The config and compiled category index stay resident; each batch of
+    stable files goes through organize_files(only=...). Files already present
+    at startup are handled as the first batch. Files in
+    loaded.watch.hold_categories (e.g. .crdownload/.part) are never moved here:
+    browsers rename them once complete, which shows up as a new file.
+
+    A batch that fails (unreadable file, target gone mid-move, disk full:
+    OSError/ValueError) does not stop the watcher: the error and the batch's
+    files go to on_error (default: a line on stderr) and watching goes on.
+    Those files are picked up again when they next change.
+
+    loaded.throttle and loaded.transfer apply as in a one-shot run; the I/O
+    budget is shared by all batches, so a steady trickle of files cannot
+    exceed it by starting each batch with a fresh burst.
+
+    Watching covers one folder: a config with `sources` raises ValueError
+    (pass a source_dir override instead).
+    """
+    if loaded.sources:
+        raise ValueError("Watch mode covers one source folder (use --source-dir)")
+    settings = loaded.watch
+    stop = stop or threading.Event()
+    source_dir = loaded.source_dir.resolve()
+    destination_dir = loaded.destination_dir.resolve()
+    index = loaded.category_index
+    hold = set(settings.hold_categories)
+    skip_dirs = (
+        category_dirs(
+            index,
+            loaded.others_dir,
+            source_dir,
+            destination_dir,
+            extra=(loaded.dedup.quarantine_dir,) if loaded.dedup.enabled else (),
+        )
+        if loaded.recursive
+        else ()
+    )
+
+    watcher = make_watcher(
+        source_dir,
+        recursive=loaded.recursive,
+        max_depth=loaded.max_depth,
+        exclude=loaded.exclude,
+        skip_dirs=skip_dirs,
+        poll_interval=settings.poll_interval,
+        force_polling=settings.polling if force_polling is None else force_polling,
+    )
+    stabilizer = _Stabilizer(settings.settle_seconds)
+    io_throttle = None if dry_run else build_io_throttle(loaded.throttle)
+
+    def track(path: str, now: float) -> None:
+        if index.lookup(os.path.basename(path)) in hold:
+            return
+        stabilizer.track(path, now)
+
+    try:
+        now = time.monotonic()
+        for entry in scan_files(
+            source_dir,
+            recursive=loaded.recursive,
+            max_depth=loaded.max_depth,
+            exclude=loaded.exclude,
+            skip_dirs=skip_dirs,
+        ):
+            track(entry.path, now)
+
+        while not stop.is_set():
+            # Block on events when idle; tick at the debounce interval while
+            # files are settling so they are picked up as soon as they are stable.
+            timeout = settings.debounce_seconds if len(stabilizer) else 0.5
+            for path in watcher.poll(timeout):
+                track(path, time.monotonic())
+
+            ready = stabilizer.pop_ready(time.monotonic())
+            if not ready:
+                continue
+
+            try:
+                result = organize_files(
+                    source_dir=source_dir,
+                    destination_dir=destination_dir,
+                    categories=index,
+                    others_dir=loaded.others_dir,
+                    dry_run=dry_run,
+                    workers=loaded.workers,
+                    on_move=on_move,
+                    only=sorted(ready),
+                    dedup=loaded.dedup,
+                    sniff=loaded.sniff,
+                    throttle=loaded.throttle,
+                    transfer=loaded.transfer,
+                    io_throttle=io_throttle,
+                )
+            except (OSError, ValueError) as exc:
+                if on_error is not None:
+                    on_error(exc, ready)
+                else:
+                    print(
+                        f"autoops watch: batch of {len(ready)} file(s) failed: {exc}",
+                        file=sys.stderr,
+                    )
+                continue
+            if on_batch is not None:
+                on_batch(result)
+    finally:
+        watcher.close()
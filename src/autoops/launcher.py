@@ -0,0 +1,151 @@
+"""
+Console entry point with a fast path that never imports typer.
+
+Schedulers invoke autoops thousands of times a day, so interpreter startup
+dominates. `version`, `list` and exit-code-only runs (`run <job> --quiet`
+with the simple options below) are handled here with the standard library;
+every other command line (help, errors, other output modes, other commands)
+falls through to the full typer CLI in autoops.cli.
+
+Keep this module's imports minimal (even typing and pathlib cost several
+milliseconds, hence builtin generics in annotations): tests/test_startup.py
+enforces that typer and PyYAML stay out of the fast path.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def _path(value: str) -> object:
+    from pathlib import Path
+
+    return Path(value)
+
+
+# `run` options understood by the fast path (all also defined in cli.run).
+# Flag -> (factory option, value)
+_RUN_FLAGS: dict[str, tuple[str, object]] = {
+    "--dry-run": ("dry_run", True),
+    "--no-dry-run": ("dry_run", False),
+    "--preview": ("preview", True),
+    "--recursive": ("recursive", True),
+    "--no-recursive": ("recursive", False),
+    "--incremental": ("incremental", True),
+    "--no-incremental": ("incremental", False),
+    "--journal": ("journal", True),
+    "--no-journal": ("journal", False),
+    "--history": ("history", True),  # not a factory option: see _fast_path
+    "--no-history": ("history", False),
+    "--force": ("force", True),  # not a factory option either
+}
+# Option taking a value -> (factory option, converter)
+_RUN_VALUES: dict[str, tuple[str, object]] = {
+    "--config": ("config_path", _path),
+    "--source-dir": ("source_dir", _path),
+    "--destination-dir": ("destination_dir", _path),
+    "--workers": ("workers", int),
+    "--resume": ("resume", str),
+}
+
+
+def parse_quiet_run(args: list[str]) -> tuple[str, dict[str, object]] | None:
+    """
+    Parse `<job> [options] --quiet` into (job name, factory options).
+    Returns None for anything the fast path does not fully understand.
+    """
+    if not args or args[0].startswith("-"):
+        return None
+
+    job_name = args[0]
+    options: dict[str, object] = {"dry_run": True, "preview": False}
+    quiet = False
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg == "--quiet":
+            quiet = True
+        elif arg in _RUN_FLAGS:
+            key, value = _RUN_FLAGS[arg]
+            options[key] = value
+        elif arg in _RUN_VALUES and i + 1 < len(args):
+            key, convert = _RUN_VALUES[arg]
+            try:
+                options[key] = convert(args[i + 1])
+            except ValueError:
+                return None
+            i += 1
+        else:
+            return None
+        i += 1
+
+    if not quiet or options.get("workers", 1) < 1:
+        return None
+    if job_name == "organize-files" and "destination_dir" not in options:
+        if "source_dir" in options:
+            options["destination_dir"] = options["source_dir"]
+    return job_name, options
+
+
+def _fast_path(args: list[str]) -> int | None:
+    """
+    Handle the command line without typer, returning the exit code, or None
+    when the full CLI is needed.
+    """
+    if args == ["version"]:
+        from autoops import __version__
+
+        print(f"AutoOps version {__version__}")
+        return 0
+
+    if args == ["list"]:
+        from autoops.jobs import build_registry
+
+        for name in build_registry().list_names():
+            print(name)
+        return 0
+
+    if args[:1] == ["run"]:
+        parsed = parse_quiet_run(args[1:])
+        if parsed is None:
+            return None
+        from autoops.jobs import build_registry
+
+        job_name, options = parsed
+        history = options.pop("history", True)
+        force = bool(options.pop("force", False))
+        job = build_registry(for_job=job_name, **options).get(job_name)
+        if job is None:
+            return 2
+        cache = None
+        if job.fingerprint is not None:
+            from autoops.core.memo import ResultCache
+
+            cache = ResultCache()
+        if not history:
+            return 0 if job.run(cache=cache, force=force).success else 1
+
+        from time import perf_counter
+
+        from autoops.utils.history import record_runs
+
+        start = perf_counter()
+        result = job.run(cache=cache, force=force)
+        if not record_runs([(job_name, result, perf_counter() - start, None)]):
+            print("Warning: could not write the run history", file=sys.stderr)
+        return 0 if result.success else 1
+
+    return None
+
+
+def entry() -> None:
+    """
+    Console entry point (used by [project.scripts]).
+    """
+    code = _fast_path(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    from autoops.cli import app
+
+    app()
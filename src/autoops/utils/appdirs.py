@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+APP_NAME = "autoops"
+
+
+def data_dir() -> Path:
+    """
+    Directory for persistent application state.
+    Override with AUTOOPS_DATA_DIR.
+    """
+    override = os.environ.get("AUTOOPS_DATA_DIR")
+    if override:
+        return Path(override)
+
+    from platformdirs import user_data_dir
+
+    return Path(user_data_dir(APP_NAME))
+
+
+def cache_dir() -> Path:
+    """
+    Directory for disposable caches (safe to delete at any time).
+    Override with AUTOOPS_CACHE_DIR.
+    """
+    override = os.environ.get("AUTOOPS_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir(APP_NAME))
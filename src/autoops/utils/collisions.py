@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Iterator, Set, Tuple
+
+
+class DirectoryNameIndex:
+    """
+    In-memory view of the names present in one destination directory.
+
+    The directory is listed once; afterwards collision renames
+    (file.ext -> file_1.ext -> file_2.ext ...) are resolved against the
+    in-memory set and a per-stem "next free suffix" counter instead of one
+    stat per candidate.
+
+    The final decision is still made by the filesystem: `claim()` reserves a
+    name with an exclusive create (O_EXCL), so a file created concurrently by
+    another process is detected and skipped rather than overwritten.
+    Not thread-safe on its own; callers serialize work per directory.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._taken: Set[str] = set()
+        self._next_suffix: Dict[Tuple[str, str], int] = {}
+        try:
+            with os.scandir(directory) as it:
+                self._taken.update(entry.name for entry in it)
+        except FileNotFoundError:
+            pass
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._taken
+
+    def _candidates(self, name: str) -> Iterator[str]:
+        if name not in self._taken:
+            yield name
+
+        stem, suffix = os.path.splitext(name)
+        key = (stem, suffix)
+        i = self._next_suffix.get(key, 1)
+        while True:
+            candidate = f"{stem}_{i}{suffix}"
+            if candidate not in self._taken:
+                self._next_suffix[key] = i + 1
+                yield candidate
+            i += 1
+
+    def claim(self, name: str) -> str:
+        """
+        Reserve a non-colliding name and return its full path.
+
+        The reservation is an empty placeholder file created with O_EXCL;
+        the caller replaces it with the real file (or calls `release`).
+        """
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+        for candidate in self._candidates(name):
+            path = os.path.join(self.directory, candidate)
+            try:
+                fd = os.open(path, flags, 0o600)
+            except FileExistsError:
+                # Someone else created it since we listed the directory
+                self._taken.add(candidate)
+                continue
+            os.close(fd)
+            self._taken.add(candidate)
+            return path
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def release(self, path: str) -> None:
+        """
+        Drop a placeholder created by `claim` that was not used.
+        """
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        self._taken.discard(os.path.basename(path))
+
+
+class NameIndexes:
+    """
+    Lazily-built DirectoryNameIndex per destination directory (thread-safe lookup).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, DirectoryNameIndex] = {}
+
+    def for_directory(self, directory: str) -> DirectoryNameIndex:
+        with self._lock:
+            index = self._indexes.get(directory)
+            if index is None:
+                index = self._indexes[directory] = DirectoryNameIndex(directory)
+            return index
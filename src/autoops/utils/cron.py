@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import FrozenSet, List, Optional
+
+# (name, minimum, maximum) of the five cron fields
+_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),  # 0 and 7 are both Sunday
+)
+_MACROS = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+# next_after gives up after this many days without a match (e.g. "0 0 31 2 *")
+_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(raw: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    # "*" and "N/step" stop at Saturday: 7 is only an alias for Sunday
+    top = 6 if name == "day of week" else high
+    values: List[int] = []
+    for part in raw.split(","):
+        part, _, step_raw = part.partition("/")
+        try:
+            step = int(step_raw) if step_raw else 1
+            if part == "*":
+                start, end = low, top
+            elif "-" in part:
+                a, b = part.split("-", 1)
+                start, end = int(a), int(b)
+            else:
+                start = int(part)
+                end = top if step_raw else start
+        except ValueError:
+            raise ValueError(f"Invalid cron {name}: '{raw}'") from None
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"Invalid cron {name}: '{raw}'")
+        values.extend(range(start, end + 1, step))
+    if name == "day of week":
+        values = [v % 7 for v in values]
+    return frozenset(values)
+
+
+class CronExpression:
+    """
+    A standard 5-field cron expression (minute hour day-of-month month
+    day-of-week) with *, lists, ranges, steps and the @daily-style macros.
+    As in cron, when both day fields are restricted a day matching either
+    one matches. Times are local (naive datetimes).
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        fields = _MACROS.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: '{expression}'")
+        parsed = [
+            _parse_field(raw, name, low, high)
+            for raw, (name, low, high) in zip(fields, _FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        self._sorted_hours = sorted(self.hours)
+        self._sorted_minutes = sorted(self.minutes)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, day: dt.date) -> bool:
+        in_days = day.day in self.days
+        in_weekdays = (day.isoweekday() % 7) in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, when: dt.datetime) -> dt.datetime:
+        """
+        First matching minute strictly after `when`.
+        """
+        t = when.replace(second=0, microsecond=0) + dt.timedelta(minutes=1)
+        day = t.date()
+        for _ in range(_SEARCH_DAYS):
+            if day.month in self.months and self._day_matches(day):
+                found = self._first_time(t.time() if day == t.date() else dt.time())
+                if found is not None:
+                    return dt.datetime.combine(day, found)
+            day += dt.timedelta(days=1)
+        raise ValueError(f"Cron expression never matches: '{self.expression}'")
+
+    def _first_time(self, start: dt.time) -> Optional[dt.time]:
+        for hour in self._sorted_hours:
+            if hour < start.hour:
+                continue
+            first_minute = start.minute if hour == start.hour else 0
+            for minute in self._sorted_minutes:
+                if minute >= first_minute:
+                    return dt.time(hour, minute)
+        return None
+
+    def next_timestamp(self, after: float) -> float:
+        """
+        next_after for POSIX timestamps (interpreted in local time).
+        """
+        return self.next_after(dt.datetime.fromtimestamp(after)).timestamp()
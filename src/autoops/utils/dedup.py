@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from autoops.utils.appdirs import cache_dir
+
+BLOCK_SIZE = 64 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+# (st_dev, st_ino, st_size, st_mtime_ns): identifies one version of a file
+FileKey = Tuple[int, int, int, int]
+
+
+def default_hash_cache_path() -> Path:
+    return cache_dir() / "content-hashes.sqlite3"
+
+
+def partial_hash(path: str, size: int, block_size: int = BLOCK_SIZE) -> str:
+    """
+    Hash of the first and last block (the whole file when it is small).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        if size <= 2 * block_size:
+            h.update(fh.read())
+        else:
+            h.update(fh.read(block_size))
+            fh.seek(-block_size, os.SEEK_END)
+            h.update(fh.read(block_size))
+    return h.hexdigest()
+
+
+def full_hash(path: str) -> str:
+    """
+    Streamed hash of the whole file (constant memory).
+    """
+    h = hashlib.blake2b(digest_size=32)
+    buf = bytearray(_CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as fh:
+        while True:
+            n = fh.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+class HashCache:
+    """
+    SQLite cache of content hashes keyed by (device, inode, size, mtime), so
+    unchanged files are never reread. Use from one thread; several processes
+    may share the file (writes are short transactions, see put_many).
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            " dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,"
+            " kind TEXT, digest TEXT NOT NULL,"
+            " PRIMARY KEY (dev, ino, size, mtime_ns, kind)) WITHOUT ROWID"
+        )
+
+    def get(self, key: FileKey, kind: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT digest FROM hashes WHERE dev = ? AND ino = ? AND size = ?"
+            " AND mtime_ns = ? AND kind = ?",
+            (*key, kind),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: FileKey, kind: str, digest: str) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, kind, digest),
+            )
+
+    def put_many(self, entries: Iterable[Tuple[FileKey, str, str]]) -> None:
+        """
+        Store (key, kind, digest) entries in one transaction.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                [(*key, kind, digest) for key, kind, digest in entries],
+            )
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _hash_all(
+    items: Sequence[Tuple[str, FileKey]],
+    kind: str,
+    fn: Callable[[str, FileKey], str],
+    pool: Optional[ThreadPoolExecutor],
+    cache: Optional[HashCache],
+) -> Dict[str, str]:
+    digests: Dict[str, str] = {}
+    todo: List[Tuple[str, FileKey]] = []
+    for path, key in items:
+        cached = cache.get(key, kind) if cache is not None else None
+        if cached is not None:
+            digests[path] = cached
+        else:
+            todo.append((path, key))
+
+    def attempt(item: Tuple[str, FileKey]) -> Optional[str]:
+        try:
+            return fn(*item)
+        except OSError:  # deleted or made unreadable since it was grouped
+            return None
+
+    if pool is not None and len(todo) > 1:
+        results: Iterable[Optional[str]] = pool.map(attempt, todo)
+    else:
+        results = (attempt(item) for item in todo)
+
+    fresh = [
+        (path, key, digest)
+        for (path, key), digest in zip(todo, results)
+        if digest is not None
+    ]
+    for path, _, digest in fresh:
+        digests[path] = digest
+    if cache is not None and fresh:
+        # written after hashing: no write lock is held while files are read
+        cache.put_many((key, kind, digest) for _, key, digest in fresh)
+    return digests
+
+
+def _regroup(
+    groups: Iterable[List[str]], digests: Dict[str, str]
+) -> List[List[str]]:
+    out: List[List[str]] = []
+    for group in groups:
+        by_digest: Dict[str, List[str]] = defaultdict(list)
+        for path in group:
+            digest = digests.get(path)
+            if digest is not None:  # None: could not be hashed, not comparable
+                by_digest[digest].append(path)
+        out.extend(g for g in by_digest.values() if len(g) > 1)
+    return out
+
+
+def find_duplicates(
+    candidates: Sequence[str],
+    existing: Iterable[str] = (),
+    *,
+    workers: int = 4,
+    cache: Optional[HashCache] = None,
+    block_size: int = BLOCK_SIZE,
+) -> Dict[str, str]:
+    """
+    Find candidates whose content is identical to an existing file or to an
+    earlier candidate. Returns {duplicate_candidate: canonical_path}.
+
+    Stages, each only for what is still ambiguous:
+    1. group by size (from stat; empty files are never treated as duplicates)
+    2. hash the first and last block
+    3. full streamed hash, parallelized over `workers` threads
+    Existing files win as canonical copies, then candidates in given order.
+    A file that cannot be read while hashing (deleted or made unreadable
+    meanwhile) is dropped from its group instead of failing the search.
+    """
+    keys: Dict[str, FileKey] = {}
+    is_candidate: Dict[str, bool] = {}
+    ordered: List[str] = []
+    for path in (*existing, *candidates):
+        if path in keys:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if st.st_size == 0:
+            continue
+        keys[path] = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        ordered.append(path)
+    for path in candidates:
+        if path in keys:
+            is_candidate[path] = True
+
+    by_size: Dict[int, List[str]] = defaultdict(list)
+    for path in ordered:
+        by_size[keys[path][2]].append(path)
+    groups = [
+        g
+        for g in by_size.values()
+        if len(g) > 1 and any(is_candidate.get(p) for p in g)
+    ]
+    if not groups:
+        return {}
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        partial = _hash_all(
+            [(p, keys[p]) for g in groups for p in g],
+            f"partial-{block_size}",
+            lambda path, key: partial_hash(path, key[2], block_size),
+            pool,
+            cache,
+        )
+        groups = _regroup(groups, partial)
+
+        # Small files were hashed completely by the partial pass
+        large = [g for g in groups if keys[g[0]][2] > 2 * block_size]
+        small = [g for g in groups if keys[g[0]][2] <= 2 * block_size]
+        full = _hash_all(
+            [(p, keys[p]) for g in large for p in g],
+            "full",
+            lambda path, key: full_hash(path),
+            pool,
+            cache,
+        )
+        groups = small + _regroup(large, full)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    duplicates: Dict[str, str] = {}
+    for group in groups:
+        if not any(is_candidate.get(p) for p in group):
+            continue
+        canonical = group[0]
+        same_inode = keys[canonical][:2]
+        for path in group[1:]:
+            if is_candidate.get(path) and keys[path][:2] != same_inode:
+                duplicates[path] = canonical
+    return duplicates
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from autoops.utils.appdirs import data_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    job TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    success INTEGER NOT NULL,
+    message TEXT,
+    error TEXT,
+    counters TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_job_time ON runs (job, started_at);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (started_at);
+"""
+
+_Row = Tuple[str, float, float, float, int, Optional[str], Optional[str], str]
+
+
+def default_history_path() -> Path:
+    return data_dir() / "history.sqlite3"
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    id: int
+    job: str
+    started_at: float  # unix time
+    finished_at: float
+    duration: float
+    success: bool
+    message: Optional[str]
+    error: Optional[str]
+    counters: Dict[str, int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "job": self.job,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration": self.duration,
+            "success": self.success,
+            "message": self.message,
+            "error": self.error,
+            "counters": self.counters,
+        }
+
+
+@dataclass(frozen=True)
+class JobStats:
+    job: str
+    runs: int
+    failures: int
+    p50: float
+    p95: float
+    mean: float
+    last_run: float
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job": self.job,
+            "runs": self.runs,
+            "failures": self.failures,
+            "failure_rate": round(self.failure_rate, 6),
+            "p50": round(self.p50, 6),
+            "p95": round(self.p95, 6),
+            "mean": round(self.mean, 6),
+            "last_run": self.last_run,
+        }
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    # nearest rank: the smallest value with at least `fraction` of them <= it
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[rank - 1]
+
+
+def _where(
+    job: Optional[str],
+    since: Optional[float],
+    until: Optional[float],
+    success: Optional[bool] = None,
+) -> Tuple[str, List[Any]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+    if job is not None:
+        clauses.append("job = ?")
+        params.append(job)
+    if since is not None:
+        clauses.append("started_at >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("started_at < ?")
+        params.append(until)
+    if success is not None:
+        clauses.append("success = ?")
+        params.append(int(success))
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def _counters(result: Any) -> Dict[str, int]:
+    """
+    The counters of a run: its metrics counters when it ran instrumented,
+    otherwise the integer totals its handler already reports in the result
+    data (moved_total, resumed, ...), so recording costs the job nothing.
+    """
+    metrics = getattr(result, "metrics", None) or {}
+    counters = metrics.get("counters")
+    if counters:
+        return counters
+    data = getattr(result, "data", None)
+    if not isinstance(data, dict):
+        return {}
+    return {
+        key: value
+        for key, value in data.items()
+        if isinstance(value, int) and not isinstance(value, bool)
+    }
+
+
+class RunHistory:
+    """
+    SQLite log of finished job runs (user data dir), for `autoops history`.
+
+    `record` only appends to an in-memory batch; rows reach the database in
+    one transaction when the batch holds `batch_size` runs, `flush_interval`
+    seconds after the oldest buffered run was recorded (a timer thread, so
+    a resident scheduler's last run shows up without waiting for the next
+    one), and on flush()/close(). With flush_interval=None no timer thread
+    is started, for callers that close the store straight away. A one-shot
+    CLI run thus costs one small transaction after the job has finished.
+    Safe to record from several threads.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        batch_size: int = 64,
+        flush_interval: Optional[float] = 5.0,
+    ) -> None:
+        self.path = path or default_history_path()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[_Row] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def record(
+        self,
+        job: str,
+        result: Any,
+        duration: float,
+        *,
+        finished_at: Optional[float] = None,
+    ) -> None:
+        """
+        Buffer one run of `job`. `result` is a JobResult; its counters come
+        from result.metrics when the job ran instrumented, else from the
+        totals in result.data.
+        """
+        finished_at = time.time() if finished_at is None else finished_at
+        error = getattr(result, "error", None)
+        row: _Row = (
+            job,
+            finished_at - duration,
+            finished_at,
+            duration,
+            int(bool(result.success)),
+            getattr(result, "message", None),
+            None if error is None else f"{type(error).__name__}: {error}",
+            json.dumps(_counters(result), separators=(",", ":")),
+        )
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size or (
+                self.flush_interval is not None and self.flush_interval <= 0
+            ):
+                self._flush_locked()
+            elif self._timer is None and self.flush_interval is not None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_due(self) -> None:
+        try:
+            self.flush()
+        except (sqlite3.Error, OSError):
+            pass  # the rows stay buffered: the next flush or close() retries
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO runs (job, started_at, finished_at, duration, success,"
+                " message, error, counters) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def query(
+        self,
+        *,
+        job: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        success: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[HistoryEntry]:
+        """
+        Recorded runs, newest first, filtered by job, start time range
+        [since, until) and outcome.
+        """
+        self.flush()
+        where, params = _where(job, since, until, success)
+        sql = (
+            "SELECT id, job, started_at, finished_at, duration, success, message,"
+            f" error, counters FROM runs{where} ORDER BY started_at DESC, id DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [
+            HistoryEntry(
+                id=row[0],
+                job=row[1],
+                started_at=row[2],
+                finished_at=row[3],
+                duration=row[4],
+                success=bool(row[5]),
+                message=row[6],
+                error=row[7],
+                counters=json.loads(row[8] or "{}"),
+            )
+            for row in rows
+        ]
+
+    def stats(
+        self,
+        *,
+        job: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[JobStats]:
+        """
+        Per-job run count, failures and duration percentiles (p50/p95,
+        nearest rank) over the selected runs, by job name.
+        """
+        self.flush()
+        where, params = _where(job, since, until)
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT job, duration, success, started_at FROM runs{where}"
+                " ORDER BY job, duration",
+                params,
+            ).fetchall()
+
+        grouped: Dict[str, List[Tuple[float, int, float]]] = {}
+        for name, duration, ok, started_at in rows:
+            grouped.setdefault(name, []).append((duration, ok, started_at))
+
+        result: List[JobStats] = []
+        for name, runs in grouped.items():
+            durations = [d for d, _, _ in runs]
+            result.append(
+                JobStats(
+                    job=name,
+                    runs=len(runs),
+                    failures=sum(1 for _, ok, _ in runs if not ok),
+                    p50=_percentile(durations, 0.50),
+                    p95=_percentile(durations, 0.95),
+                    mean=sum(durations) / len(durations),
+                    last_run=max(s for _, _, s in runs),
+                )
+            )
+        return result
+
+    def compact(self, keep_seconds: float, *, now: Optional[float] = None) -> int:
+        """
+        Delete runs that started more than `keep_seconds` ago and reclaim
+        the space. Returns the number of runs deleted.
+        """
+        self.flush()
+        cutoff = (time.time() if now is None else now) - keep_seconds
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                deleted = conn.execute(
+                    "DELETE FROM runs WHERE started_at < ?", (cutoff,)
+                ).rowcount
+            if deleted:
+                conn.execute("VACUUM")
+        return deleted
+
+    def close(self) -> None:
+        """
+        Write buffered runs and close the database.
+        """
+        with self._lock:
+            self._flush_locked()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "RunHistory":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def record_runs(
+    runs: Iterable[Tuple[str, Any, float, Optional[float]]],
+    path: Optional[Path] = None,
+) -> bool:
+    """
+    Record (job, result, duration, finished_at or None) runs in one
+    transaction. History is best-effort: a database that cannot be written
+    (read-only data dir, locked past the timeout) returns False instead of
+    failing the run that was just recorded.
+    """
+    try:
+        # closed right below: no timer thread, one write on close()
+        with RunHistory(path, flush_interval=None) as history:
+            for job, result, duration, finished_at in runs:
+                history.record(job, result, duration, finished_at=finished_at)
+    except (sqlite3.Error, OSError):
+        return False
+    return True
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import secrets
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Container, Dict, Iterator, List, Optional, Pattern, Set
+
+from autoops.utils.appdirs import data_dir
+from autoops.utils.moves import move_file_no_replace
+
+DEFAULT_BATCH_SIZE = 256
+
+# file timestamps come from a coarse kernel clock that may lag time.time()
+_CLOCK_SLACK = 1.0
+
+
+def journal_dir() -> Path:
+    return data_dir() / "journals"
+
+
+def new_run_id() -> str:
+    return time.strftime("%Y%m%dT%H%M%S") + "-" + secrets.token_hex(3)
+
+
+def journal_path(run_id: str, directory: Optional[Path] = None) -> Path:
+    if not run_id or os.sep in run_id or "/" in run_id or run_id.startswith("."):
+        raise ValueError(f"Invalid run id: {run_id!r}")
+    return (directory or journal_dir()) / f"{run_id}.jsonl"
+
+
+def read_journal(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield journal records in order. A torn final line (crash mid-write) is
+    ignored; everything before it was committed.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.endswith("\n"):
+                break
+            try:
+                yield json.loads(line)
+            except ValueError:
+                break
+
+
+class MoveJournal:
+    """
+    Append-only write-ahead journal of one organize run.
+
+    Records (one JSON object per line):
+      begin  - run metadata
+      plan   - a move about to happen (seq, src, dir, name, cat, ino, act:
+               "move", "quarantine" or "link"; a link also has canon, the
+               path it links to)
+      done   - the move finished (seq, dst)
+      undo   - the move was reverted by `undo_run` (seq)
+      end    - the run finished (status)
+
+    Writes are buffered and made durable by `commit()` (flush + fsync), so the
+    organize loop pays one fsync per batch of moves, not per file. Callers
+    commit plan records before starting the corresponding moves.
+    Thread-safe: done records may come from worker threads.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        run_id: str,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fsync: bool = True,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._fh = open(path, "a", encoding="utf-8")
+        self._buffer: List[str] = []
+        self._next_seq = 1
+        # plans of a previous (crashed) attempt that never got a "done"
+        self.pending: List[Dict[str, Any]] = []
+        # set by resume(): when the run began, and where its moves ended up
+        self.started = 0.0
+        self.placed: Set[str] = set()
+
+    @classmethod
+    def create(
+        cls, directory: Optional[Path] = None, *, fsync: bool = True, **metadata: Any
+    ) -> "MoveJournal":
+        run_id = new_run_id()
+        journal = cls(journal_path(run_id, directory), run_id, fsync=fsync)
+        journal._append(
+            {"op": "begin", "run_id": run_id, "ts": time.time(), **metadata}
+        )
+        journal.commit()
+        return journal
+
+    @classmethod
+    def resume(cls, run_id: str, directory: Optional[Path] = None) -> "MoveJournal":
+        """
+        Reopen an existing journal for appending; plans without a matching
+        "done" are exposed as `pending`, the targets of completed moves as
+        `placed`.
+        """
+        path = journal_path(run_id, directory)
+        if not path.exists():
+            raise FileNotFoundError(f"Journal not found for run: {run_id}")
+
+        plans: Dict[int, Dict[str, Any]] = {}
+        placed: Set[str] = set()
+        started = 0.0
+        max_seq = 0
+        for record in read_journal(path):
+            if record.get("op") == "begin":
+                started = record.get("ts", 0.0)
+            seq = record.get("seq")
+            if seq is None:
+                continue
+            max_seq = max(max_seq, seq)
+            if record["op"] == "plan":
+                plans[seq] = record
+            elif record["op"] in ("done", "lost"):
+                plans.pop(seq, None)
+                if record["op"] == "done":
+                    placed.add(record["dst"])
+
+        journal = cls(path, run_id)
+        journal._next_seq = max_seq + 1
+        journal.pending = [plans[seq] for seq in sorted(plans)]
+        journal.started = started
+        journal.placed = placed
+        journal._append({"op": "resume", "ts": time.time()})
+        journal.commit()
+        return journal
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+
+    def record_plan(
+        self,
+        source: str,
+        target_dir: str,
+        name: str,
+        category: str,
+        inode: int,
+        action: str = "move",
+        link_to: Optional[str] = None,
+    ) -> int:
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+        record = {
+            "op": "plan",
+            "seq": seq,
+            "src": source,
+            "dir": target_dir,
+            "name": name,
+            "cat": category,
+            "ino": inode,
+            "act": action,
+        }
+        if link_to is not None:
+            record["canon"] = link_to
+        self._append(record)
+        return seq
+
+    def record_done(self, seq: int, target: str) -> None:
+        self._append({"op": "done", "seq": seq, "dst": target})
+
+    def record_lost(self, seq: int) -> None:
+        self._append({"op": "lost", "seq": seq})
+
+    def record_undo(self, seq: int) -> None:
+        self._append({"op": "undo", "seq": seq})
+
+    def commit(self) -> None:
+        """
+        Write buffered records and fsync (group commit).
+        """
+        with self._lock:
+            if not self._buffer:
+                return
+            self._fh.write("".join(self._buffer))
+            self._buffer.clear()
+            self._fh.flush()
+            if self._fsync:
+                os.fsync(self._fh.fileno())
+
+    def drop_placeholders(self, plan: Dict[str, Any]) -> int:
+        """
+        Delete the empty files a crashed attempt reserved for `plan` (see
+        DirectoryNameIndex.claim) without moving anything into them: names
+        the plan could have claimed, created since the run began, and not
+        in `placed`. Returns how many were deleted.
+        """
+        pattern = _claimable(plan["name"])
+        since = self.started - _CLOCK_SLACK
+        dropped = 0
+        try:
+            with os.scandir(plan["dir"]) as it:
+                for entry in it:
+                    if not pattern.fullmatch(entry.name) or entry.path in self.placed:
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if (
+                        stat.S_ISREG(st.st_mode)
+                        and st.st_size == 0
+                        and st.st_ctime >= since
+                    ):
+                        os.unlink(entry.path)
+                        dropped += 1
+        except FileNotFoundError:
+            pass
+        return dropped
+
+    def close(self, status: Optional[str] = None) -> None:
+        if status is not None:
+            self._append({"op": "end", "status": status, "ts": time.time()})
+        self.commit()
+        self._fh.close()
+
+
+def _claimable(name: str) -> Pattern[str]:
+    """
+    Match the names a collision-free claim of `name` can produce:
+    name.ext, name_1.ext, name_2.ext ...
+    """
+    stem, suffix = os.path.splitext(name)
+    return re.compile(re.escape(stem) + r"(?:_\d+)?" + re.escape(suffix))
+
+
+def locate_moved(plan: Dict[str, Any], exclude: Container[str] = ()) -> Optional[str]:
+    """
+    Find where a planned move ended up when its "done" record was lost:
+    the file keeps its inode across a same-filesystem rename. A hard link
+    ("link" plans) has the inode of the copy it links to instead. Only
+    names the plan could have claimed are considered, never the linked
+    copy itself or a path in `exclude`.
+    """
+    if plan.get("act") == "link":
+        try:
+            inode = os.stat(plan["canon"]).st_ino
+        except OSError:
+            return None
+        exclude = {*exclude, plan["canon"]}
+    else:
+        inode = plan.get("ino")
+    if not inode:
+        return None
+    pattern = _claimable(plan["name"])
+    try:
+        with os.scandir(plan["dir"]) as it:
+            for entry in it:
+                if (
+                    entry.inode() == inode
+                    and pattern.fullmatch(entry.name)
+                    and entry.path not in exclude
+                    and entry.is_file()
+                ):
+                    return entry.path
+    except FileNotFoundError:
+        return None
+    return None
+
+
+def undo_run(run_id: str, directory: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Revert a journaled run by replaying its completed moves in reverse.
+
+    Files are only moved back when their original path is free (checked
+    atomically, see move_file_no_replace); conflicts and files that
+    disappeared are reported, not overwritten. Each revert is
+    journaled ("undo" records) so an interrupted undo can simply be rerun.
+    """
+    path = journal_path(run_id, directory)
+    if not path.exists():
+        raise FileNotFoundError(f"Journal not found for run: {run_id}")
+
+    plans: Dict[int, Dict[str, Any]] = {}
+    done: Dict[int, str] = {}
+    undone: set = set()
+    for record in read_journal(path):
+        op = record.get("op")
+        if op == "plan":
+            plans[record["seq"]] = record
+        elif op == "done":
+            done[record["seq"]] = record["dst"]
+        elif op == "undo":
+            undone.add(record["seq"])
+
+    journal = MoveJournal(path, run_id)
+    restored = 0
+    conflicts: List[str] = []
+    missing: List[str] = []
+    try:
+        for n, seq in enumerate(sorted(done, reverse=True), start=1):
+            if seq in undone:
+                continue
+            source = plans[seq]["src"]
+            target = done[seq]
+            if not os.path.exists(target):
+                missing.append(target)
+                continue
+            if os.path.lexists(source):
+                conflicts.append(source)
+                continue
+
+            os.makedirs(os.path.dirname(source), exist_ok=True)
+            if not move_file_no_replace(target, source):
+                conflicts.append(source)  # created since the check above
+                continue
+            journal.record_undo(seq)
+            restored += 1
+            if n % journal.batch_size == 0:
+                journal.commit()
+    finally:
+        journal.close()
+
+    return {
+        "run_id": run_id,
+        "restored": restored,
+        "conflicts": conflicts,
+        "missing": missing,
+    }
+
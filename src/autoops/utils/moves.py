@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import errno
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Hashable, Optional, Union
+
+from autoops.utils.transfer import FileCopier
+
+if TYPE_CHECKING:
+    from autoops.utils.throttle import IOThrottle
+
+# os.link errors meaning "no hard link possible here", not "target taken"
+_NO_LINK = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOSYS, errno.EOPNOTSUPP}
+)
+
+
+def move_file(
+    source: str,
+    target: str,
+    throttle: Optional[IOThrottle] = None,
+    copier: Optional[FileCopier] = None,
+) -> int:
+    """
+    Move a single file. Returns the number of bytes copied (0 when the
+    file was renamed in place).
+
+    Fast path: os.replace (one rename(2) when both paths share a
+    filesystem). Only when the kernel reports a cross-device move do we fall
+    back to copy + unlink, the copy made by `copier` (default: a serial
+    in-kernel FileCopier, see autoops.utils.transfer); the source is only
+    unlinked once the copy is complete (and verified, if the copier does).
+    A symlink is recreated on the other side (pointing where it pointed),
+    as shutil.move does, never replaced by a copy of its target.
+    An existing target is overwritten; callers reserve the target name first
+    (see autoops.utils.collisions).
+
+    With a `throttle`, the move waits for its operation budget and its
+    latency is reported for adaptive backoff, on every path. A copy paced
+    by this same throttle reports each chunk instead (a finer signal than
+    one sample for a multi-GB file).
+    """
+    if throttle is not None:
+        throttle.op()
+    start = time.perf_counter()
+    try:
+        os.replace(source, target)
+        copied = 0
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        if os.path.islink(source):
+            _move_symlink(source, target)
+            copied = 0
+        else:
+            copier = copier or FileCopier(throttle=throttle)
+            copied = copier.copy(source, target)
+            os.unlink(source)
+            if copier.throttle is throttle:
+                return copied
+    if throttle is not None:
+        throttle.observe(time.perf_counter() - start)
+    return copied
+
+
+def move_file_no_replace(source: str, target: str) -> bool:
+    """
+    Move a single file to `target` only if nothing exists there; returns
+    False (and leaves both paths alone) when `target` is taken.
+
+    Unlike move_file this is atomic against a file created at `target`
+    meanwhile: a hard link (the new name appears only if it is free) then
+    an unlink of the source on one filesystem; elsewhere (cross-device, no
+    hard links) an exclusive create of `target` followed by a copy into it,
+    or a new symlink for a symlink.
+    """
+    try:
+        os.link(source, target, follow_symlinks=False)
+    except FileExistsError:
+        return False
+    except OSError as exc:
+        if exc.errno not in _NO_LINK:
+            raise
+        if os.path.islink(source):
+            try:
+                os.symlink(os.readlink(source), target)
+            except FileExistsError:
+                return False
+        else:
+            try:
+                os.close(os.open(target, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+            except FileExistsError:
+                return False
+            FileCopier().copy(source, target)  # removes the target if it fails
+    os.unlink(source)
+    return True
+
+
+def _move_symlink(source: str, target: str) -> None:
+    # built beside the target, then renamed over the name the caller reserved
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.symlink(os.readlink(source), tmp)
+    try:
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    os.unlink(source)
+
+
+class SerialExecutor:
+    """
+    Runs each submitted task immediately on the calling thread.
+    """
+
+    def submit(self, key: Hashable, task: Callable[[], None]) -> None:
+        task()
+
+    def close(self, *, raise_errors: bool = True) -> None:
+        return None
+
+    def __enter__(self) -> "SerialExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(raise_errors=exc_type is None)
+
+
+class LaneExecutor:
+    """
+    Runs tasks on a thread pool, one lane per key.
+
+    Tasks sharing a key (e.g. a destination directory) run one at a time in
+    submission order, so per-directory behavior (collision renames) matches a
+    serial run; different keys proceed in parallel.
+    At most `max_pending` tasks are queued at once, so a fast producer (the
+    scanner) cannot buffer an entire directory in memory. `initializer` runs
+    once on each pool thread (e.g. to lower its priority); the threads exit
+    on close().
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        max_pending: Optional[int] = None,
+        initializer: Optional[Callable[[], None]] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="autoops-move",
+            initializer=initializer,
+        )
+        self._slots = threading.BoundedSemaphore(max_pending or workers * 64)
+        self._lock = threading.Lock()
+        self._lanes: Dict[Hashable, Deque[Callable[[], None]]] = {}
+        self._error: Optional[BaseException] = None
+        self._idle = threading.Condition(self._lock)
+        self._active = 0
+
+    def submit(self, key: Hashable, task: Callable[[], None]) -> None:
+        self._raise_if_failed()
+        self._slots.acquire()
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is not None:
+                lane.append(task)
+                return
+            self._lanes[key] = deque([task])
+            self._active += 1
+        self._pool.submit(self._drain, key)
+
+    def _drain(self, key: Hashable) -> None:
+        while True:
+            with self._lock:
+                lane = self._lanes[key]
+                if not lane:
+                    del self._lanes[key]
+                    self._active -= 1
+                    self._idle.notify_all()
+                    return
+                task = lane.popleft()
+                failed = self._error is not None
+
+            try:
+                if not failed:
+                    task()
+            except BaseException as exc:  # surfaced to the submitter on close()
+                with self._lock:
+                    if self._error is None:
+                        self._error = exc
+            finally:
+                self._slots.release()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def close(self, *, raise_errors: bool = True) -> None:
+        """
+        Wait for every lane to finish, then re-raise the first task error.
+        """
+        with self._lock:
+            while self._active:
+                self._idle.wait()
+        self._pool.shutdown(wait=True)
+        if raise_errors:
+            self._raise_if_failed()
+
+    def __enter__(self) -> "LaneExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # On an exception in the submitting loop, drain quietly and let it propagate
+        self.close(raise_errors=exc_type is None)
+
+
+def make_executor(
+    workers: int = 1, *, initializer: Optional[Callable[[], None]] = None
+) -> Union[SerialExecutor, LaneExecutor]:
+    """
+    Return a serial executor for workers <= 1, otherwise a threaded one.
+    With an `initializer`, tasks always run on threads of their own (one
+    for workers <= 1), never on the caller's thread.
+    """
+    if workers <= 1 and initializer is None:
+        return SerialExecutor()
+    return LaneExecutor(max(workers, 1), initializer=initializer)
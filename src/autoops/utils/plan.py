@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+_MAGIC = b"AUTOOPS-PLAN\n"
+_FORMAT = 1
+# the per-file arrays of a MovePlan, in file order
+_COLUMNS = ("dir_ids", "category_ids", "inodes", "mtimes")
+
+
+class PlanEntry(NamedTuple):
+    dir_id: int
+    name: str
+    category_id: int
+    inode: int
+    mtime_ns: int
+
+
+class MovePlan:
+    """
+    A decided organize run, stored column-wise: one array per field (source
+    folder id, category id, inode, mtime) plus one blob of NUL-separated
+    file names. Folders (relative to source_dir, "" for the root) and
+    categories are interned in small tables, so a file costs 22 bytes plus
+    its name instead of a tuple of path strings.
+
+    (inode, mtime_ns) are what the planner saw; apply skips files that
+    changed since (see autoops.jobs.organize_files.apply_plan).
+    """
+
+    def __init__(
+        self,
+        source_dir: str,
+        destination_dir: str,
+        categories: List[str],
+        *,
+        created_at: Optional[float] = None,
+    ) -> None:
+        self.source_dir = source_dir
+        self.destination_dir = destination_dir
+        self.categories: List[str] = list(categories)
+        self.dirs: List[str] = []
+        self.created_at = time.time() if created_at is None else created_at
+        self.dir_ids = array("I")
+        self.category_ids = array("H")
+        self.inodes = array("Q")
+        self.mtimes = array("q")
+        self.names = bytearray()
+        self._category_ids: Dict[str, int] = {c: i for i, c in enumerate(categories)}
+        self._dir_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.inodes)
+
+    def add(
+        self, rel_dir: str, name: str, category: str, inode: int, mtime_ns: int
+    ) -> None:
+        """
+        Plan moving `name` from folder `rel_dir` (relative to source_dir)
+        into `category`.
+        """
+        dir_id = self._dir_ids.get(rel_dir)
+        if dir_id is None:
+            dir_id = self._dir_ids[rel_dir] = len(self.dirs)
+            self.dirs.append(rel_dir)
+        category_id = self._category_ids.get(category)
+        if category_id is None:
+            category_id = self._category_ids[category] = len(self.categories)
+            self.categories.append(category)
+        self.dir_ids.append(dir_id)
+        self.category_ids.append(category_id)
+        self.inodes.append(inode)
+        self.mtimes.append(mtime_ns)
+        self.names += os.fsencode(name)
+        self.names.append(0)
+
+    def entries(self) -> Iterator[PlanEntry]:
+        """
+        The planned moves, in planning (scan) order.
+        """
+        names = self.names
+        start = 0
+        for i in range(len(self.inodes)):
+            end = names.index(0, start)
+            yield PlanEntry(
+                self.dir_ids[i],
+                os.fsdecode(bytes(names[start:end])),
+                self.category_ids[i],
+                self.inodes[i],
+                self.mtimes[i],
+            )
+            start = end + 1
+
+    def batches(self, size: int) -> Iterator[List[PlanEntry]]:
+        entries = self.entries()
+        while True:
+            batch = list(islice(entries, size))
+            if not batch:
+                return
+            yield batch
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Planned moves per category (every category of the plan, in order).
+        """
+        counts = [0] * len(self.categories)
+        for category_id in self.category_ids:
+            counts[category_id] += 1
+        return dict(zip(self.categories, counts))
+
+    def write(self, path: Path) -> int:
+        """
+        Write the plan to `path` (atomically). Returns its size in bytes.
+        """
+        columns = [getattr(self, attr) for attr in _COLUMNS]
+        header = json.dumps(
+            {
+                "format": _FORMAT,
+                "byteorder": sys.byteorder,
+                "created_at": self.created_at,
+                "source_dir": self.source_dir,
+                "destination_dir": self.destination_dir,
+                "categories": self.categories,
+                "dirs": self.dirs,
+                "count": len(self),
+                "itemsizes": [column.itemsize for column in columns],
+                "names_size": len(self.names),
+            }
+        ).encode("utf-8")
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(_MAGIC)
+            fh.write(struct.pack("<I", len(header)))
+            fh.write(header)
+            for column in columns:
+                column.tofile(fh)
+            fh.write(self.names)
+        os.replace(tmp, path)
+        return path.stat().st_size
+
+    @classmethod
+    def read(cls, path: Path) -> "MovePlan":
+        """
+        Load a plan written by `write`. Raises ValueError if the file is not
+        a plan (or was written by an incompatible version).
+        """
+        with open(path, "rb") as fh:
+            if fh.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"Not an autoops plan file: {path}")
+            try:
+                (header_size,) = struct.unpack("<I", fh.read(4))
+                header = json.loads(fh.read(header_size).decode("utf-8"))
+            except (struct.error, ValueError):
+                raise ValueError(f"Corrupt plan file: {path}") from None
+            if header.get("format") != _FORMAT:
+                raise ValueError(f"Unsupported plan format in {path}")
+
+            plan = cls(
+                header["source_dir"],
+                header["destination_dir"],
+                header["categories"],
+                created_at=header["created_at"],
+            )
+            plan.dirs = header["dirs"]
+            plan._dir_ids = {d: i for i, d in enumerate(plan.dirs)}
+            count = header["count"]
+            for attr, itemsize in zip(_COLUMNS, header["itemsizes"]):
+                column = getattr(plan, attr)
+                if column.itemsize != itemsize:
+                    raise ValueError(f"Plan {path} was written on another platform")
+                try:
+                    column.fromfile(fh, count)
+                except EOFError:
+                    raise ValueError(f"Truncated plan file: {path}") from None
+                if header["byteorder"] != sys.byteorder:
+                    column.byteswap()
+            plan.names = bytearray(fh.read(header["names_size"]))
+            if len(plan.names) != header["names_size"]:
+                raise ValueError(f"Truncated plan file: {path}")
+        return plan
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from autoops.core.metrics import current_metrics
+
+if TYPE_CHECKING:
+    from autoops.utils.scan_state import ScanState
+
+
+def _compile_excludes(patterns: Iterable[str]) -> Optional[re.Pattern]:
+    """
+    Merge glob patterns into a single regex (None when there are none).
+    """
+    parts = [fnmatch.translate(str(p)) for p in patterns if str(p)]
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in parts))
+
+
+def scan_files(
+    root: Path,
+    *,
+    recursive: bool = False,
+    max_depth: Optional[int] = None,
+    exclude: Iterable[str] = (),
+    skip_dirs: Collection[Path] = (),
+    state: Optional["ScanState"] = None,
+) -> Iterator[os.DirEntry]:
+    """
+    Lazily yield a DirEntry for every regular file under root.
+
+    Built on os.scandir so the file/dir type comes from the directory listing
+    itself (no extra stat per entry), and entries are streamed one at a time.
+
+    - recursive: descend into subdirectories (symlinked dirs are not followed).
+    - max_depth: how many levels below root to descend (None = unlimited).
+      Files directly in root are depth 0.
+    - exclude: glob patterns matched against the entry name and its path
+      relative to root (with "/" separators); matching files and directories
+      are skipped.
+    - skip_dirs: directories never descended into (e.g. the category folders
+      when organizing a directory in place).
+    - state: incremental mode. Directories whose mtime matches the recorded
+      one are not listed, and files already yielded by a previous run (same
+      size, mtime and inode) are skipped; see ScanState.
+
+    A subdirectory that cannot be listed (removed meanwhile, no permission)
+    is skipped; only an unreadable root is an error.
+
+    The stats incremental mode makes are counted as stat_calls in the
+    current job's metrics.
+    """
+    root_str = os.fspath(root)
+    prefix_len = len(os.path.join(root_str, ""))
+    excluded = _compile_excludes(exclude)
+    skipped = {os.path.normcase(os.fspath(d)) for d in skip_dirs}
+    metrics = current_metrics()
+
+    pending: List[Tuple[str, int]] = [(root_str, 0)]
+    while pending:
+        current, depth = pending.pop()
+        descend = recursive and (max_depth is None or depth < max_depth)
+        subdirs: List[str] = []
+
+        processed = None
+        stats = 0
+        if state is not None:
+            if metrics.enabled:
+                metrics.count("stat_calls")
+            try:
+                dir_mtime = os.stat(current).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            known = state.unchanged_subdirs(current, dir_mtime)
+            if known is not None:
+                if descend:
+                    pending.extend((d, depth + 1) for d in reversed(known))
+                continue
+
+        try:
+            it = os.scandir(current)
+        except OSError:
+            if not depth:
+                raise
+            # vanished or unreadable since its parent was listed: skip it
+            continue
+        if state is not None:
+            processed = state.begin_dir(current)
+
+        with it:
+            for entry in it:
+                if excluded is not None:
+                    rel = entry.path[prefix_len:]
+                    if os.sep != "/":
+                        rel = rel.replace(os.sep, "/")
+                    if excluded.match(entry.name) or excluded.match(rel):
+                        continue
+
+                try:
+                    if entry.is_file():
+                        if state is None:
+                            yield entry
+                            continue
+
+                        stats += 1
+                        st = entry.stat()
+                        seen = (st.st_size, st.st_mtime_ns, st.st_ino)
+                        state.record_entry(current, entry.name, *seen)
+                        if processed.get(entry.name) != seen:
+                            yield entry
+                    elif descend and entry.is_dir(follow_symlinks=False):
+                        if os.path.normcase(entry.path) not in skipped:
+                            subdirs.append(entry.path)
+                except OSError:
+                    # Entry vanished or is unreadable between listing and use
+                    continue
+
+        if state is not None:
+            state.end_dir(current, dir_mtime, subdirs)
+        if stats and metrics.enabled:
+            metrics.count("stat_calls", stats)
+
+        # reversed: keep a stable, listing-order depth-first traversal
+        pending.extend((d, depth + 1) for d in reversed(subdirs))
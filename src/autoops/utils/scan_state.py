@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from autoops.utils.appdirs import data_dir
+
+# A directory whose mtime is this close to "now" may still receive files within
+# the same timestamp tick, so its mtime is not trusted for skipping next time.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# bumped when the tables change shape; older state is dropped, not migrated
+_SCHEMA_VERSION = "2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    subdirs TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    PRIMARY KEY (dir, name)
+) WITHOUT ROWID;
+"""
+
+
+def default_state_path(source_dir: Path, namespace: str = "") -> Path:
+    """
+    Per-source-directory state file under the user data dir.
+    """
+    key = hashlib.sha256(os.fsencode(source_dir)).hexdigest()[:24]
+    suffix = f"-{namespace}" if namespace else ""
+    return data_dir() / "scan-state" / f"{key}{suffix}.sqlite3"
+
+
+class ScanState:
+    """
+    SQLite-backed memory of a source tree between runs (used by scan_files).
+
+    Records each scanned directory's mtime (and its subdirectories) plus the
+    files already handed out by a previous run. On the next run an unchanged
+    directory is not listed at all, and in a changed directory only files that
+    are new, modified or replaced (a different inode under the same name,
+    even with the old size and mtime) are yielded.
+
+    All updates happen in one transaction: `commit()` after a successful run,
+    `close()` without committing discards them.
+    `fingerprint` identifies the scan settings; state recorded under a
+    different fingerprint is discarded.
+    """
+
+    def __init__(self, path: Path, *, fingerprint: str = "") -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(str(path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema'"
+        ).fetchone()
+        if row is None or row[0] != _SCHEMA_VERSION:
+            self._conn.executescript(
+                "DROP TABLE dirs; DROP TABLE entries; DELETE FROM meta;" + _SCHEMA
+            )
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema', ?)",
+                (_SCHEMA_VERSION,),
+            )
+        self._conn.execute("BEGIN")
+
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'fingerprint'"
+        ).fetchone()
+        if row is None or row[0] != fingerprint:
+            self._conn.execute("DELETE FROM dirs")
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                (fingerprint,),
+            )
+
+    def unchanged_subdirs(self, path: str, mtime_ns: int) -> Optional[List[str]]:
+        """
+        If `path` still has the recorded mtime, return its known subdirectories
+        (so the caller can skip listing it); otherwise None.
+        """
+        row = self._conn.execute(
+            "SELECT mtime_ns, subdirs FROM dirs WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None or row[0] is None or row[0] != mtime_ns:
+            return None
+        return [os.path.join(path, name) for name in row[1].split("\0") if name]
+
+    def begin_dir(self, path: str) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Start rescanning `path`: return its previously processed files
+        ({name: (size, mtime_ns, ino)}) and forget them until re-recorded.
+        """
+        processed = {
+            name: (size, mtime_ns, ino)
+            for name, size, mtime_ns, ino in self._conn.execute(
+                "SELECT name, size, mtime_ns, ino FROM entries WHERE dir = ?",
+                (path,),
+            )
+        }
+        self._conn.execute("DELETE FROM entries WHERE dir = ?", (path,))
+        return processed
+
+    def record_entry(
+        self, path: str, name: str, size: int, mtime_ns: int, ino: int
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (dir, name, size, mtime_ns, ino) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (path, name, size, mtime_ns, ino),
+        )
+
+    def end_dir(self, path: str, mtime_ns: int, subdirs: List[str]) -> None:
+        """
+        Record a fully scanned directory. `mtime_ns` must be the value read
+        before listing it, so files added during the scan trigger a rescan.
+        """
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            mtime: Optional[int] = None
+        else:
+            mtime = mtime_ns
+        names = "\0".join(os.path.basename(d) for d in subdirs)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO dirs (path, mtime_ns, subdirs) VALUES (?, ?, ?)",
+            (path, mtime, names),
+        )
+
+    def commit(self) -> None:
+        self._conn.execute("COMMIT")
+        self._conn.execute("BEGIN")
+
+    def close(self) -> None:
+        """
+        Close the store, discarding anything not committed.
+        """
+        if self._conn.in_transaction:
+            self._conn.execute("ROLLBACK")
+        self._conn.close()
+
+    def __enter__(self) -> "ScanState":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from autoops.utils.dedup import FileKey, HashCache
+
+# Bytes read from each file: enough for every signature below, including the
+# first ZIP entry name and an ODF/EPUB "mimetype" member.
+HEADER_SIZE = 128
+
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+_ZIP_MIMETYPES = (
+    (b"application/epub+zip", ".epub"),
+    (b"application/vnd.oasis.opendocument.text", ".odt"),
+    (b"application/vnd.oasis.opendocument.spreadsheet", ".ods"),
+    (b"application/vnd.oasis.opendocument.presentation", ".odp"),
+)
+
+
+def _refine_zip(header: bytes) -> str:
+    """
+    Tell office documents and ebooks apart from plain ZIP archives by the
+    first member, which their writers put at the start of the file.
+    """
+    if len(header) < _ZIP_LOCAL_HEADER.size:
+        return ".zip"
+    _magic, name_len, extra_len = _ZIP_LOCAL_HEADER.unpack_from(header)
+    name = header[30 : 30 + name_len]
+    if name.startswith(b"word/"):
+        return ".docx"
+    if name.startswith(b"xl/"):
+        return ".xlsx"
+    if name.startswith(b"ppt/"):
+        return ".pptx"
+    if name == b"mimetype":
+        # stored (uncompressed) right after the local header
+        mimetype = header[30 + name_len + extra_len :]
+        for prefix, ext in _ZIP_MIMETYPES:
+            if mimetype.startswith(prefix):
+                return ext
+    return ".zip"
+
+
+_INTERPRETERS = (
+    (b"python", ".py"),
+    (b"bash", ".sh"),
+    (b"sh", ".sh"),
+    (b"zsh", ".zsh"),
+    (b"fish", ".fish"),
+    (b"node", ".js"),
+    (b"perl", ".pl"),
+    (b"ruby", ".rb"),
+    (b"php", ".php"),
+)
+
+
+def _refine_shebang(header: bytes) -> Optional[str]:
+    line = header[2:].split(b"\n", 1)[0].split()
+    if not line:
+        return None
+    program = line[0].rsplit(b"/", 1)[-1]
+    if program == b"env" and len(line) > 1:
+        program = line[1]
+    for prefix, ext in _INTERPRETERS:
+        if program.startswith(prefix):
+            return ext
+    return None
+
+
+class Signature(NamedTuple):
+    """
+    Byte patterns (offset, magic) that must all match, and the extension a
+    matching file would normally carry. `refine` may narrow the result
+    (or reject the match by returning None).
+    """
+
+    extension: str
+    parts: Tuple[Tuple[int, bytes], ...]
+    refine: Optional[Callable[[bytes], Optional[str]]] = None
+
+
+# Most specific first where signatures share a prefix.
+SIGNATURES: Tuple[Signature, ...] = (
+    Signature(".pdf", ((0, b"%PDF-"),)),
+    Signature(".png", ((0, b"\x89PNG\r\n\x1a\n"),)),
+    Signature(".jpg", ((0, b"\xff\xd8\xff"),)),
+    Signature(".gif", ((0, b"GIF87a"),)),
+    Signature(".gif", ((0, b"GIF89a"),)),
+    Signature(".webp", ((0, b"RIFF"), (8, b"WEBP"))),
+    Signature(".wav", ((0, b"RIFF"), (8, b"WAVE"))),
+    Signature(".avi", ((0, b"RIFF"), (8, b"AVI "))),
+    Signature(".tif", ((0, b"II*\x00"),)),
+    Signature(".tif", ((0, b"MM\x00*"),)),
+    Signature(".psd", ((0, b"8BPS"),)),
+    Signature(".mp3", ((0, b"ID3"),)),
+    Signature(".flac", ((0, b"fLaC"),)),
+    Signature(".ogg", ((0, b"OggS"),)),
+    Signature(".mkv", ((0, b"\x1a\x45\xdf\xa3"),)),
+    Signature(".mov", ((4, b"ftypqt"),)),
+    Signature(".m4a", ((4, b"ftypM4A"),)),
+    Signature(".heic", ((4, b"ftypheic"),)),
+    Signature(".mp4", ((4, b"ftyp"),)),
+    Signature(".zip", ((0, b"PK\x03\x04"),), _refine_zip),
+    Signature(".gz", ((0, b"\x1f\x8b\x08"),)),
+    Signature(".bz2", ((0, b"BZh"),)),
+    Signature(".xz", ((0, b"\xfd7zXZ\x00"),)),
+    Signature(".zst", ((0, b"\x28\xb5\x2f\xfd"),)),
+    Signature(".7z", ((0, b"7z\xbc\xaf\x27\x1c"),)),
+    Signature(".rar", ((0, b"Rar!\x1a\x07"),)),
+    Signature(".exe", ((0, b"MZ"),)),
+    Signature(".elf", ((0, b"\x7fELF"),)),
+    Signature(".sqlite", ((0, b"SQLite format 3\x00"),)),
+    Signature(".rtf", ((0, b"{\\rtf"),)),
+    Signature(".torrent", ((0, b"d8:announce"),)),
+    Signature(".sh", ((0, b"#!"),), _refine_shebang),
+)
+
+
+def _compile(
+    signatures: Sequence[Signature],
+) -> Tuple[Dict[int, Tuple[Signature, ...]], Tuple[Signature, ...]]:
+    """
+    Bucket signatures anchored at offset 0 by their first byte, so a header
+    is only compared against the few that can match; the rest are scanned.
+    """
+    by_first: Dict[int, List[Signature]] = {}
+    floating: List[Signature] = []
+    for sig in signatures:
+        offset, magic = sig.parts[0]
+        if offset == 0:
+            by_first.setdefault(magic[0], []).append(sig)
+        else:
+            floating.append(sig)
+    return {k: tuple(v) for k, v in by_first.items()}, tuple(floating)
+
+
+_BY_FIRST_BYTE, _FLOATING = _compile(SIGNATURES)
+
+
+def match_header(header: bytes) -> Optional[str]:
+    """
+    Return the extension implied by a file's leading bytes, or None.
+    """
+    if not header:
+        return None
+    for sig in (*_BY_FIRST_BYTE.get(header[0], ()), *_FLOATING):
+        if all(header.startswith(magic, offset) for offset, magic in sig.parts):
+            if sig.refine is None:
+                return sig.extension
+            return sig.refine(header)
+    return None
+
+
+def read_header(path: str, size: int = HEADER_SIZE) -> bytes:
+    """
+    Read at most `size` bytes (one unbuffered read, no readahead beyond it).
+    """
+    with open(path, "rb", buffering=0) as fh:
+        return fh.read(size)
+
+
+def _file_key(path: str) -> Optional[FileKey]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _sniff_one(path: str) -> Optional[str]:
+    try:
+        header = read_header(path)
+    except OSError:
+        return None
+    return match_header(header) or ""
+
+
+class Sniffer:
+    """
+    Detects file types from content for files the extension lookup could not
+    place. Header reads (and the stats for cache keys) run on a thread pool,
+    which hides latency on network mounts; verdicts are cached in a HashCache
+    by (device, inode, size, mtime), so rescans do not reread headers.
+    Use from one thread.
+    """
+
+    def __init__(
+        self, *, workers: int = 4, cache: Optional[HashCache] = None
+    ) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._cache = cache
+        self._kind = f"magic-{HEADER_SIZE}"
+
+    def _map(self, fn: Callable, items: Sequence) -> List:
+        if self._pool is not None and len(items) > 1:
+            return list(self._pool.map(fn, items))
+        return [fn(item) for item in items]
+
+    def sniff(self, paths: Sequence[str]) -> Dict[str, str]:
+        """
+        Return {path: extension} for the paths whose type was recognized.
+        """
+        cache = self._cache
+        todo: List[Tuple[str, Optional[FileKey]]] = []
+        found: Dict[str, str] = {}
+        if cache is None:
+            keys: List[Optional[FileKey]] = [None] * len(paths)
+        else:
+            keys = self._map(_file_key, paths)
+        for path, key in zip(paths, keys):
+            cached = cache.get(key, self._kind) if key is not None else None
+            if cached is None:
+                todo.append((path, key))
+            elif cached:
+                found[path] = cached
+
+        verdicts = self._map(_sniff_one, [path for path, _key in todo])
+        learned: List[Tuple[FileKey, str, str]] = []
+        for (path, key), ext in zip(todo, verdicts):
+            if ext is None:
+                continue  # unreadable: try again next time
+            if ext:
+                found[path] = ext
+            if key is not None:
+                learned.append((key, self._kind, ext))
+        if learned:
+            # one short transaction, so dedup and other runs can write too
+            cache.put_many(learned)
+        return found
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "Sniffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import os
+import platform
+import sys
+import threading
+import time
+import warnings
+from functools import partial
+from typing import Callable, Optional
+
+# ioprio_set(2) syscall numbers (Linux), by machine
+_IOPRIO_SET = {
+    "x86_64": 251,
+    "amd64": 251,
+    "i386": 289,
+    "i686": 289,
+    "aarch64": 30,
+    "arm64": 30,
+    "armv7l": 314,
+    "ppc64le": 273,
+    "s390x": 282,
+    "riscv64": 30,
+}
+_IOPRIO_CLASSES = {"realtime": 1, "best-effort": 2, "idle": 3}
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_WHO_PROCESS = 1
+
+# adaptive backoff: latency smoothing, and the pause bounds (seconds)
+_LATENCY_WEIGHT = 0.2
+_MIN_PAUSE = 0.001
+_MAX_PAUSE = 1.0
+
+
+class TokenBucket:
+    """
+    `rate` tokens per second, up to `burst` (default: one second's worth)
+    saved while idle. acquire() reserves tokens and sleeps until they are
+    due, outside the lock, so threads queue fairly and a request larger
+    than the burst is simply paid off over time.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0) -> float:
+        """
+        Take n tokens, waiting for them if needed. Returns the wait.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class IOThrottle:
+    """
+    I/O budget shared by the threads moving files: at most ops_per_second
+    moves (`op`) and bytes_per_second copied bytes (`transfer`).
+
+    With target_latency, callers report how long each operation took
+    (`observe`); while the smoothed latency stays above the target, every
+    operation is preceded by a pause that doubles each time (up to 1s) and
+    halves again once latency recovers, so the job yields the disk to other
+    traffic when it is contended.
+    """
+
+    def __init__(
+        self,
+        *,
+        bytes_per_second: Optional[float] = None,
+        ops_per_second: Optional[float] = None,
+        target_latency: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._bytes = (
+            TokenBucket(bytes_per_second, clock=clock, sleep=sleep)
+            if bytes_per_second
+            else None
+        )
+        self._ops = (
+            TokenBucket(ops_per_second, clock=clock, sleep=sleep)
+            if ops_per_second
+            else None
+        )
+        self.target_latency = target_latency
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._latency = 0.0
+        self.pause = 0.0
+
+    def op(self) -> None:
+        """
+        Wait for the budget of one more operation (a move).
+        """
+        pause = self.pause
+        if pause:
+            self._sleep(pause)
+        if self._ops is not None:
+            self._ops.acquire()
+
+    def transfer(self, nbytes: int) -> None:
+        """
+        Wait for the budget of copying nbytes.
+        """
+        if self._bytes is not None and nbytes:
+            self._bytes.acquire(nbytes)
+
+    def observe(self, seconds: float) -> None:
+        """
+        Report the latency of one operation (for the adaptive backoff).
+        """
+        target = self.target_latency
+        if target is None:
+            return
+        with self._lock:
+            self._latency += _LATENCY_WEIGHT * (seconds - self._latency)
+            if self._latency > target:
+                self.pause = min(_MAX_PAUSE, max(_MIN_PAUSE, self.pause * 2))
+            elif self.pause:
+                self.pause = self.pause / 2 if self.pause > _MIN_PAUSE else 0.0
+
+
+def set_io_priority(
+    *, nice: Optional[int] = None, ionice: Optional[str] = None, level: int = 7
+) -> bool:
+    """
+    Run at niceness `nice` (only ever raised, so calling this again is a
+    no-op) and in I/O scheduling class `ionice` ("idle", "best-effort" with
+    `level` 0-7, or "realtime"). On Linux both apply to the calling thread
+    only (elsewhere nice applies to the whole process), and an unprivileged
+    thread cannot take them back: call this on threads that end with the
+    work (see thread_priority). Returns False when the I/O class is not
+    supported here (not Linux, unknown architecture, or refused by the
+    kernel).
+    """
+    if nice is not None and hasattr(os, "nice"):
+        current = os.nice(0)
+        if nice > current:
+            os.nice(nice - current)
+    if ionice is None:
+        return True
+    if ionice not in _IOPRIO_CLASSES:
+        raise ValueError(f"Unknown ionice class: '{ionice}'")
+    number = _IOPRIO_SET.get(platform.machine().lower())
+    if not sys.platform.startswith("linux") or number is None:
+        return False
+
+    import ctypes
+    import ctypes.util
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    data = 0 if ionice == "idle" else level
+    prio = (_IOPRIO_CLASSES[ionice] << _IOPRIO_CLASS_SHIFT) | data
+    return libc.syscall(number, _IOPRIO_WHO_PROCESS, 0, prio) == 0
+
+
+def thread_priority(
+    *, nice: Optional[int] = None, ionice: Optional[str] = None, level: int = 7
+) -> Optional[Callable[[], None]]:
+    """
+    A thread initializer applying set_io_priority to the thread that runs
+    it, for pools whose threads exit with the job: the lowered priority
+    then cannot leak into unrelated work on a reused thread (run-many,
+    schedule). None when there is nothing to set. Per-thread priorities
+    need Linux; elsewhere, and for an I/O class this machine cannot set, a
+    RuntimeWarning is issued and the setting is ignored.
+    """
+    if ionice is not None and ionice not in _IOPRIO_CLASSES:
+        raise ValueError(f"Unknown ionice class: '{ionice}'")
+    if not sys.platform.startswith("linux"):
+        if nice is not None or ionice is not None:
+            warnings.warn(
+                "nice/ionice need per-thread priorities (Linux); ignoring them",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return None
+    if ionice is not None and platform.machine().lower() not in _IOPRIO_SET:
+        warnings.warn(
+            f"ionice '{ionice}' is not supported here; ignoring it",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        ionice = None
+    if nice is None and ionice is None:
+        return None
+    return partial(set_io_priority, nice=nice, ionice=ionice, level=level)
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+from autoops.core.metrics import NULL_METRICS, Metrics
+
+if TYPE_CHECKING:
+    from autoops.utils.throttle import IOThrottle
+
+DEFAULT_PARALLEL_MIN_SIZE = 256 * 1024 * 1024
+
+# bytes per copy syscall (finer when throttled, so pacing stays smooth)
+_STEP = 8 * 1024 * 1024
+_THROTTLED_STEP = 1024 * 1024
+_VERIFY_CHUNK = 1024 * 1024
+
+# Linux ioctl: make the target share the source's extents (btrfs, XFS,
+# bcachefs...). Works across btrfs subvolumes, where rename(2) gives EXDEV.
+_FICLONE = 0x40049409
+
+# the kernel cannot do this copy (this way): try the next method
+_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTTY}
+)
+
+# in-kernel methods first; "read" (pread/pwrite) works everywhere
+_METHODS: Tuple[str, ...] = tuple(
+    name
+    for name, available in (
+        ("copy_file_range", hasattr(os, "copy_file_range")),
+        ("sendfile", sys.platform.startswith("linux") and hasattr(os, "sendfile")),
+        ("read", True),
+    )
+    if available
+)
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class FileCopier:
+    """
+    Copies files for cross-device moves without passing the data through
+    Python: a reflink when the filesystem can share extents, otherwise
+    copy_file_range(2), then sendfile(2), then pread/pwrite as the last
+    resort (each method is dropped for the rest of a copy once the kernel
+    refuses it).
+
+    Files of at least `parallel_min_size` bytes are split into `workers`
+    ranges copied by as many threads, each with its own descriptors. With
+    verify, the copy is hashed against the source before copy() returns,
+    so the caller only unlinks a source that made it across intact.
+
+    A `throttle` paces the copied bytes and sees each chunk's latency;
+    `progress(source, copied, total)` is called after every chunk (from
+    the copying threads). Instrumented runs record a "copy" span and the
+    files_copied, bytes_copied and copy_<method> counters in `metrics`.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        parallel_min_size: int = DEFAULT_PARALLEL_MIN_SIZE,
+        verify: bool = False,
+        reflink: bool = True,
+        throttle: Optional[IOThrottle] = None,
+        progress: Optional[ProgressCallback] = None,
+        metrics: Metrics = NULL_METRICS,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.parallel_min_size = parallel_min_size
+        self.verify = verify
+        self.reflink = reflink and sys.platform.startswith("linux")
+        self.throttle = throttle
+        self.progress = progress
+        self.metrics = metrics
+        self._step = _THROTTLED_STEP if throttle is not None else _STEP
+
+    def copy(self, source: str, target: str) -> int:
+        """
+        Copy `source` to `target` (created or truncated) with its metadata,
+        as shutil.copy2 does. Returns the number of bytes copied. On any
+        error the partial target is removed.
+        """
+        with self.metrics.span("copy"):
+            try:
+                size, method = self._copy(source, target)
+                if self.verify:
+                    with self.metrics.span("verify"):
+                        _verify(source, target)
+                shutil.copystat(source, target)
+            except BaseException:
+                try:
+                    os.unlink(target)
+                except OSError:
+                    pass
+                raise
+        if self.metrics.enabled:
+            self.metrics.count("files_copied")
+            self.metrics.count("bytes_copied", size)
+            self.metrics.count(f"copy_{method}")
+        return size
+
+    def _copy(self, source: str, target: str) -> Tuple[int, str]:
+        src = os.open(source, os.O_RDONLY)
+        try:
+            size = os.fstat(src).st_size
+            dst = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                progress = (
+                    _Progress(source, size, self.progress)
+                    if self.progress is not None
+                    else None
+                )
+                if self.reflink and size and self._clone(src, dst):
+                    if progress is not None:
+                        progress.add(size)
+                    return size, "reflink"
+                parallel = self.workers > 1 and size >= self.parallel_min_size
+                if not parallel:
+                    method = self._copy_range(source, src, dst, 0, size, progress)
+                    return size, method
+                os.ftruncate(dst, size)  # workers write into place
+            finally:
+                os.close(dst)
+        finally:
+            os.close(src)
+        return size, self._copy_parallel(source, target, size, progress)
+
+    def _clone(self, src: int, dst: int) -> bool:
+        import fcntl
+
+        try:
+            fcntl.ioctl(dst, _FICLONE, src)
+        except OSError as exc:
+            if exc.errno in _UNSUPPORTED or exc.errno in (errno.EPERM, errno.EBADF):
+                return False
+            raise
+        return True
+
+    def _copy_parallel(
+        self, source: str, target: str, size: int, progress: Optional[_Progress]
+    ) -> str:
+        # ranges aligned to the step, so no chunk straddles two workers
+        share = -(-size // self.workers)
+        share = -(-share // self._step) * self._step
+        ranges = [(start, min(share, size - start)) for start in range(0, size, share)]
+
+        def copy_range(start: int, length: int) -> str:
+            src = os.open(source, os.O_RDONLY)
+            try:
+                dst = os.open(target, os.O_WRONLY)
+                try:
+                    return self._copy_range(source, src, dst, start, length, progress)
+                finally:
+                    os.close(dst)
+            finally:
+                os.close(src)
+
+        with ThreadPoolExecutor(
+            max_workers=len(ranges), thread_name_prefix="autoops-copy"
+        ) as pool:
+            futures = [pool.submit(copy_range, *r) for r in ranges]
+            methods = [f.result() for f in futures]
+        # the least efficient method any range fell back to
+        return max(methods, key=_METHODS.index)
+
+    def _copy_range(
+        self,
+        source: str,
+        src: int,
+        dst: int,
+        offset: int,
+        length: int,
+        progress: Optional[_Progress],
+    ) -> str:
+        throttle = self.throttle
+        methods = list(_METHODS)
+        end = offset + length
+        while offset < end:
+            n = min(self._step, end - offset)
+            if throttle is not None:
+                throttle.transfer(n)
+            start = time.perf_counter()
+            while True:
+                try:
+                    done = _copy_chunk(methods[0], src, dst, offset, n)
+                    break
+                except OSError as exc:
+                    if exc.errno not in _UNSUPPORTED or len(methods) == 1:
+                        raise
+                    methods.pop(0)
+            if throttle is not None:
+                throttle.observe(time.perf_counter() - start)
+            if not done:
+                raise OSError(errno.EIO, f"File shrank while being copied: {source}")
+            offset += done
+            if progress is not None:
+                progress.add(done)
+        return methods[0]
+
+
+class _Progress:
+    """
+    Bytes copied so far of one file, summed over the ranges copying it.
+    """
+
+    def __init__(self, source: str, total: int, callback: ProgressCallback) -> None:
+        self.source = source
+        self.total = total
+        self.copied = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def add(self, n: int) -> None:
+        with self._lock:
+            self.copied += n
+            copied = self.copied
+        self._callback(self.source, copied, self.total)
+
+
+def _copy_chunk(method: str, src: int, dst: int, offset: int, n: int) -> int:
+    if method == "copy_file_range":
+        return os.copy_file_range(src, dst, n, offset, offset)
+    if method == "sendfile":
+        os.lseek(dst, offset, os.SEEK_SET)
+        return os.sendfile(dst, src, offset, n)
+    data = os.pread(src, n, offset)
+    view = memoryview(data)
+    written = 0
+    while written < len(data):
+        written += os.pwrite(dst, view[written:], offset + written)
+    return written
+
+
+def _digest(path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=32)
+    buf = bytearray(_VERIFY_CHUNK)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as fh:
+        while True:
+            n = fh.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.digest()
+
+
+def _verify(source: str, target: str) -> None:
+    """
+    Raise OSError(EIO) unless target has the same bytes as source.
+    """
+    if os.stat(source).st_size != os.stat(target).st_size or _digest(
+        source
+    ) != _digest(target):
+        raise OSError(errno.EIO, f"Copy does not match the original: {source}")
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Tuple, Union
+
+from autoops.utils.scan import _compile_excludes, scan_files
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """
+    Portable watcher: rescans the tree every `interval` seconds and reports
+    files that are new or whose size/mtime changed since the previous scan.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        recursive: bool = False,
+        max_depth: Optional[int] = None,
+        exclude: Iterable[str] = (),
+        skip_dirs: Collection[Path] = (),
+        interval: float = 1.0,
+    ) -> None:
+        self._scan_kwargs = dict(
+            recursive=recursive,
+            max_depth=max_depth,
+            exclude=tuple(exclude),
+            skip_dirs=tuple(skip_dirs),
+        )
+        self.root = root
+        self.interval = interval
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._next_scan = 0.0
+
+    def poll(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait up to `timeout` seconds (None = until the next scan) and return
+        paths of files that appeared or changed.
+        """
+        wait = self._next_scan - time.monotonic()
+        if timeout is not None:
+            wait = min(wait, timeout)
+        if wait > 0:
+            time.sleep(wait)
+        if time.monotonic() < self._next_scan:
+            return []
+        self._next_scan = time.monotonic() + self.interval
+
+        changed: List[str] = []
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for entry in scan_files(self.root, **self._scan_kwargs):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            sig = (st.st_size, st.st_mtime_ns)
+            snapshot[entry.path] = sig
+            if self._snapshot.get(entry.path) != sig:
+                changed.append(entry.path)
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+
+class InotifyWatcher:
+    """
+    Linux inotify watcher (via ctypes, no extra dependency).
+
+    Reports files that finished being written (IN_CLOSE_WRITE), were moved in
+    (IN_MOVED_TO) or were created. With recursive=True, new subdirectories
+    are watched as they appear and their existing files are reported.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        recursive: bool = False,
+        max_depth: Optional[int] = None,
+        exclude: Iterable[str] = (),
+        skip_dirs: Collection[Path] = (),
+    ) -> None:
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self._fd = fd
+        self.root = root
+        self._recursive = recursive
+        self._max_depth = max_depth
+        self._exclude = tuple(exclude)
+        self._excluded = _compile_excludes(self._exclude)
+        self._prefix_len = len(os.path.join(os.fspath(root), ""))
+        self._skipped = {os.path.normcase(os.fspath(d)) for d in skip_dirs}
+        self._watches: Dict[int, Tuple[str, int]] = {}
+        self._add_tree(os.fspath(root), 0)
+
+    def _descend(self, depth: int) -> bool:
+        return self._recursive and (self._max_depth is None or depth < self._max_depth)
+
+    def _add_watch(self, path: str, depth: int) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(err, os.strerror(err), path)
+        self._watches[wd] = (path, depth)
+
+    def _add_tree(self, path: str, depth: int) -> None:
+        self._add_watch(path, depth)
+        if not self._descend(depth):
+            return
+        try:
+            with os.scandir(path) as it:
+                subdirs = [
+                    e.path
+                    for e in it
+                    if e.is_dir(follow_symlinks=False)
+                    and os.path.normcase(e.path) not in self._skipped
+                ]
+        except OSError:
+            return
+        for sub in subdirs:
+            self._add_tree(sub, depth + 1)
+
+    def poll(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait up to `timeout` seconds (None = forever) for events and return
+        the affected file paths.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+
+        changed: List[str] = []
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            changed.extend(self._parse(buf))
+        return changed
+
+    def _parse(self, buf: bytes) -> List[str]:
+        changed: List[str] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped: fall back to reporting everything
+                changed.extend(
+                    e.path
+                    for e in scan_files(
+                        self.root,
+                        recursive=self._recursive,
+                        max_depth=self._max_depth,
+                        exclude=self._exclude,
+                        skip_dirs=self._skipped,
+                    )
+                )
+                continue
+
+            watched = self._watches.get(wd)
+            if watched is None:
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if not raw_name:
+                continue
+
+            directory, depth = watched
+            name = os.fsdecode(raw_name)
+            path = os.path.join(directory, name)
+            if self._excluded is not None:
+                rel = path[self._prefix_len :].replace(os.sep, "/")
+                if self._excluded.match(name) or self._excluded.match(rel):
+                    continue
+            if mask & _IN_ISDIR:
+                skipped = os.path.normcase(path) in self._skipped
+                if self._descend(depth) and not skipped:
+                    self._add_tree(path, depth + 1)
+                    changed.extend(
+                        e.path
+                        for e in scan_files(
+                            Path(path),
+                            recursive=True,
+                            max_depth=(
+                                None
+                                if self._max_depth is None
+                                else self._max_depth - depth - 1
+                            ),
+                            exclude=self._exclude,
+                            skip_dirs=self._skipped,
+                        )
+                    )
+                continue
+            changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(
+    root: Path,
+    *,
+    recursive: bool = False,
+    max_depth: Optional[int] = None,
+    exclude: Iterable[str] = (),
+    skip_dirs: Collection[Path] = (),
+    poll_interval: float = 1.0,
+    force_polling: bool = False,
+) -> Union[InotifyWatcher, PollingWatcher]:
+    """
+    Return an inotify watcher on Linux, falling back to polling elsewhere
+    (or when inotify is unavailable, e.g. watch limits exhausted).
+    """
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(
+                root,
+                recursive=recursive,
+                max_depth=max_depth,
+                exclude=exclude,
+                skip_dirs=skip_dirs,
+            )
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(
+        root,
+        recursive=recursive,
+        max_depth=max_depth,
+        exclude=exclude,
+        skip_dirs=skip_dirs,
+        interval=poll_interval,
+    )
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_app_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Keep state, journals and caches (plugin manifest, hashes) out of the
+    user's real directories.
+    """
+    monkeypatch.setenv("AUTOOPS_DATA_DIR", str(tmp_path / "appdata"))
+    monkeypatch.setenv("AUTOOPS_CACHE_DIR", str(tmp_path / "appcache"))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autoops.config.categories import CategoryIndex
+from autoops.config.loader import load_organize_files_config
+
+
+def test_category_index_lookup_is_case_insensitive() -> None:
+    index = CategoryIndex.compile({"pdf": [".PDF"], "images": ["jpg", ".png"]})
+
+    assert index.lookup("report.pdf") == "pdf"
+    assert index.lookup("PHOTO.JPG") == "images"
+    assert index.lookup("notes.txt") is None
+    assert index.lookup("README") is None
+
+
+def test_category_index_longest_suffix_wins() -> None:
+    index = CategoryIndex.compile(
+        {"compressed": [".gz", ".zst"], "tarballs": [".tar.gz", ".tar.zst"]}
+    )
+
+    assert index.lookup("backup.tar.gz") == "tarballs"
+    assert index.lookup("backup.TAR.ZST") == "tarballs"
+    assert index.lookup("log.gz") == "compressed"
+    assert index.lookup("tar.gz") == "compressed"
+
+
+def test_category_index_treats_leading_dot_as_name() -> None:
+    index = CategoryIndex.compile({"config": [".env"]})
+
+    assert index.lookup(".env") is None
+    assert index.lookup("prod.env") == "config"
+
+
+def test_category_index_records_conflicts_first_category_wins() -> None:
+    index = CategoryIndex.compile(
+        {"presentations": [".key"], "security": [".pem", ".key"]}
+    )
+
+    assert index.lookup("slides.key") == "presentations"
+    assert index.conflicts == ((".key", "presentations", "security"),)
+
+
+def test_loader_warns_about_conflicting_extensions(tmp_path: Path) -> None:
+    cfg = tmp_path / "organize.yaml"
+    cfg.write_text(
+        "organize_files:\n"
+        "  source_dir: src\n"
+        "  categories:\n"
+        "    presentations: ['.key']\n"
+        "    security: ['.KEY']\n",
+        encoding="utf-8",
+    )
+
+    with pytest.warns(UserWarning, match=r"\.key"):
+        loaded = load_organize_files_config(cfg)
+
+    assert loaded.category_index.lookup("a.key") == "presentations"
+
+
+def test_shipped_config_has_no_conflicts() -> None:
+    cfg = Path(__file__).resolve().parents[1] / "configs" / "organize_files.yaml"
+
+    loaded = load_organize_files_config(cfg)
+
+    assert loaded.category_index.conflicts == ()
+    assert loaded.category_index.lookup("site.tar.zst") == "archives"
+
+
+def test_category_index_survives_pickling() -> None:
+    import pickle
+
+    index = CategoryIndex.compile({"archives": [".zip", ".tar.gz"], "pdf": [".pdf"]})
+
+    clone = pickle.loads(pickle.dumps(index))
+
+    assert clone == index
+    assert clone.lookup("a.tar.gz") == "archives"
+    with pytest.raises(TypeError):
+        clone.by_extension[".x"] = "y"  # type: ignore[index]
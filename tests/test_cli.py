@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 from typer.testing import CliRunner
 
 from autoops.cli import app
@@ -33,3 +36,255 @@ def test_cli_run_missing_job_returns_error_exit_code_2():
     assert result.exit_code == 2
     assert "❌" in result.stdout
     assert "not found" in result.stdout.lower()
+
+
+def test_cli_run_organize_preview_ndjson_streams_and_truncates(tmp_path):
+    config = Path(__file__).resolve().parents[1] / "configs" / "organize_files.yaml"
+    for i in range(5):
+        (tmp_path / f"f{i}.pdf").write_text("x", encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            "organize-files",
+            "--config",
+            str(config),
+            "--source-dir",
+            str(tmp_path),
+            "--preview",
+            "--output",
+            "ndjson",
+            "--max-preview",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["type"] for r in records] == ["planned", "planned", "summary"]
+    assert records[0]["category"] == "pdf"
+    assert records[-1]["data"]["moved_total"] == 5
+    assert "preview_moves" not in records[-1]["data"]
+    assert (tmp_path / "f0.pdf").exists()
+
+
+def test_cli_run_rejects_unknown_output_format():
+    result = runner.invoke(app, ["run", "example", "--output", "xml"])
+    assert result.exit_code == 2
+
+
+def test_cli_journaled_run_can_be_undone(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUTOOPS_DATA_DIR", str(tmp_path / "appdata"))
+    config = Path(__file__).resolve().parents[1] / "configs" / "organize_files.yaml"
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_text("x", encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            "organize-files",
+            "--config",
+            str(config),
+            "--source-dir",
+            str(src),
+            "--no-dry-run",
+            "--journal",
+            "--json",
+        ],
+    )
+    assert result.exit_code == 0
+    run_id = json.loads(result.stdout)["data"]["run_id"]
+    assert (src / "pdf" / "a.pdf").exists()
+
+    result = runner.invoke(app, ["undo", run_id])
+    assert result.exit_code == 0
+    assert "Restored 1 file(s)" in result.stdout
+    assert (src / "a.pdf").exists()
+
+
+def test_cli_list_and_version_do_not_need_a_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # no configs/organize_files.yaml here
+
+    result = runner.invoke(app, ["list"])
+    assert result.exit_code == 0
+    assert "organize-files" in result.stdout
+    assert runner.invoke(app, ["version"]).exit_code == 0
+
+
+def test_cli_run_reports_missing_config_as_job_failure(tmp_path):
+    result = runner.invoke(
+        app,
+        ["run", "organize-files", "--config", str(tmp_path / "missing.yaml")],
+    )
+    assert "❌" in result.stdout
+    assert "Config file not found" in result.stdout
+
+
+def test_cli_run_json_includes_metrics_and_profile_dump(tmp_path):
+    profile = tmp_path / "run.prof"
+
+    result = runner.invoke(
+        app, ["run", "example", "--json", "--profile", str(profile)]
+    )
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert set(payload["metrics"]) == {"wall_seconds", "spans", "counters"}
+    assert profile.stat().st_size > 0
+
+
+def test_cli_run_many_reports_each_job():
+    result = runner.invoke(app, ["run-many", "example", "example", "--json"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    assert data["success"] is True
+    assert [job["name"] for job in data["jobs"]] == ["example"]
+    assert data["jobs"][0]["status"] == "succeeded"
+
+
+def test_cli_run_many_unknown_job_runs_nothing():
+    result = runner.invoke(app, ["run-many", "example", "nope"])
+
+    assert result.exit_code == 2
+    assert "nope" in result.stdout
+
+
+def test_cli_run_many_isolated_with_timeout():
+    result = runner.invoke(app, ["run-many", "example", "--timeout", "30", "--json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["jobs"][0]["status"] == "succeeded"
+
+
+def test_cli_pipeline_reports_steps_and_rejects_cycles(tmp_path):
+    path = tmp_path / "pipeline.yaml"
+    path.write_text(
+        "pipeline:\n  steps:\n    first: {job: example}\n"
+        "    second: {job: example, needs: [first]}\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["pipeline", str(path), "--json"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    assert [s["status"] for s in data["steps"]] == ["succeeded", "succeeded"]
+    assert data["critical_path"] == ["first", "second"]
+
+    path.write_text(
+        "pipeline:\n  steps:\n    a: {job: example, needs: [b]}\n"
+        "    b: {job: example, needs: [a]}\n",
+        encoding="utf-8",
+    )
+    result = runner.invoke(app, ["pipeline", str(path)])
+
+    assert result.exit_code == 2
+    assert "cycle" in result.stdout
+
+
+def test_cli_runs_are_recorded_in_history():
+    assert runner.invoke(app, ["run", "example", "--quiet"]).exit_code == 0
+    no_history = ["run", "example", "--quiet", "--no-history"]
+    assert runner.invoke(app, no_history).exit_code == 0
+    assert runner.invoke(app, ["run-many", "example", "--quiet"]).exit_code == 0
+
+    result = runner.invoke(app, ["history", "--json"])
+    assert result.exit_code == 0
+    runs = json.loads(result.stdout)
+    assert [r["job"] for r in runs] == ["example", "example"]
+    assert all(r["success"] for r in runs)
+
+    result = runner.invoke(app, ["history", "--stats", "--json"])
+    (stats,) = json.loads(result.stdout)
+    assert stats["job"] == "example" and stats["runs"] == 2
+
+    result = runner.invoke(app, ["history", "--compact", "30d"])
+    assert result.exit_code == 0
+    assert "Deleted 0" in result.stdout
+
+
+def test_cli_run_reuses_unchanged_result_unless_forced(tmp_path):
+    import os
+    import time
+
+    config = Path(__file__).resolve().parents[1] / "configs" / "organize_files.yaml"
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_text("x", encoding="utf-8")
+    os.utime(src, (time.time() - 60, time.time() - 60))
+    args = ["run", "organize-files", "--config", str(config)]
+    args += ["--source-dir", str(src), "--json"]
+
+    first = json.loads(runner.invoke(app, args).stdout)
+    second = json.loads(runner.invoke(app, args).stdout)
+    forced = json.loads(runner.invoke(app, [*args, "--force"]).stdout)
+
+    assert [first["cached"], second["cached"], forced["cached"]] == [
+        False,
+        True,
+        False,
+    ]
+    assert second["data"]["moved_total"] == first["data"]["moved_total"] == 1
+
+
+def test_cli_plan_then_apply(tmp_path):
+    config = Path(__file__).resolve().parents[1] / "configs" / "organize_files.yaml"
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_text("x", encoding="utf-8")
+    plan = tmp_path / "plan.bin"
+
+    result = runner.invoke(
+        app,
+        ["plan", "organize-files", "--config", str(config)]
+        + ["--source-dir", str(src), "-o", str(plan)],
+    )
+    assert result.exit_code == 0
+    assert "a.pdf  ->  pdf/a.pdf" in result.stdout
+    assert (src / "a.pdf").exists()
+
+    result = runner.invoke(app, ["apply", str(plan), "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["data"]["moved_total"] == 1
+    assert (src / "pdf" / "a.pdf").exists()
+
+    assert runner.invoke(app, ["plan", "example", "-o", str(plan)]).exit_code == 2
+    assert runner.invoke(app, ["apply", str(config)]).exit_code == 2
+
+
+def test_cli_schedule_stops_on_sigterm_and_keeps_history(tmp_path: Path):
+    import os
+    import signal
+    import threading
+
+    schedule_file = tmp_path / "schedule.yaml"
+    schedule_file.write_text(
+        "schedule:\n  jobs:\n    tick:\n      job: example\n      every: 1s\n",
+        encoding="utf-8",
+    )
+    timer = threading.Timer(1.5, os.kill, (os.getpid(), signal.SIGTERM))
+    timer.start()
+    result = runner.invoke(app, ["schedule", str(schedule_file)])
+    timer.join()
+
+    assert result.exit_code == 0, result.output
+    history = json.loads(runner.invoke(app, ["history", "--json"]).stdout)
+    assert history and {run["job"] for run in history} == {"example"}
+
+
+def test_cli_watch_rejects_multi_source_config(tmp_path: Path):
+    cfg = tmp_path / "organize.yaml"
+    cfg.write_text(
+        f"organize_files:\n  sources: ['{tmp_path}/inbox-*']\n"
+        "  categories:\n    docs: ['.pdf']\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["watch", "organize-files", "--config", str(cfg)])
+
+    assert result.exit_code == 1
+    assert "one source folder" in result.stdout
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from autoops.utils import collisions
+from autoops.utils.collisions import DirectoryNameIndex, NameIndexes
+
+
+def test_claim_returns_original_name_when_free(tmp_path: Path) -> None:
+    index = DirectoryNameIndex(str(tmp_path))
+
+    path = index.claim("report.pdf")
+
+    assert path == str(tmp_path / "report.pdf")
+    assert (tmp_path / "report.pdf").exists()
+    assert "report.pdf" in index
+
+
+def test_claim_skips_existing_suffixes_without_probing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "report.pdf").touch()
+    for i in range(1, 201):
+        (tmp_path / f"report_{i}.pdf").touch()
+
+    index = DirectoryNameIndex(str(tmp_path))
+    opened = []
+    real_open = collisions.os.open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(collisions.os, "open", counting_open)
+
+    first = index.claim("report.pdf")
+    second = index.claim("report.pdf")
+
+    assert os.path.basename(first) == "report_201.pdf"
+    assert os.path.basename(second) == "report_202.pdf"
+    assert len(opened) == 2
+
+
+def test_claim_detects_files_created_after_listing(tmp_path: Path) -> None:
+    index = DirectoryNameIndex(str(tmp_path))
+
+    # another process drops files after the index was loaded
+    (tmp_path / "a.txt").touch()
+    (tmp_path / "a_1.txt").touch()
+
+    path = index.claim("a.txt")
+
+    assert os.path.basename(path) == "a_2.txt"
+
+
+def test_release_frees_the_name(tmp_path: Path) -> None:
+    index = DirectoryNameIndex(str(tmp_path))
+
+    path = index.claim("a.txt")
+    index.release(path)
+
+    assert not os.path.exists(path)
+    assert index.claim("a.txt") == path
+
+
+def test_name_indexes_reuses_index_per_directory(tmp_path: Path) -> None:
+    indexes = NameIndexes()
+
+    assert indexes.for_directory(str(tmp_path)) is indexes.for_directory(
+        str(tmp_path)
+    )
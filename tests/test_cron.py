@@ -0,0 +1,44 @@
+import datetime as dt
+
+import pytest
+
+from autoops.utils.cron import CronExpression
+
+NOW = dt.datetime(2026, 10, 17, 10, 7, 30)  # a Saturday
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("* * * * *", dt.datetime(2026, 10, 17, 10, 8)),
+        ("*/15 * * * *", dt.datetime(2026, 10, 17, 10, 15)),
+        ("0 9 * * 1-5", dt.datetime(2026, 10, 19, 9, 0)),
+        ("30 2 1 * *", dt.datetime(2026, 11, 1, 2, 30)),
+        ("@daily", dt.datetime(2026, 10, 18, 0, 0)),
+        ("0 12 * * 7", dt.datetime(2026, 10, 18, 12, 0)),
+        ("0 0 29 2 *", dt.datetime(2028, 2, 29, 0, 0)),
+        ("5,35 8-10/2 * * *", dt.datetime(2026, 10, 17, 10, 35)),
+    ],
+)
+def test_cron_next_after(expression, expected):
+    assert CronExpression(expression).next_after(NOW) == expected
+
+
+def test_cron_day_fields_match_either_when_both_are_restricted():
+    # the 13th or any Friday: Friday 23rd comes first
+    assert CronExpression("0 0 13 * 5").next_after(NOW) == dt.datetime(
+        2026, 10, 23, 0, 0
+    )
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "* 24 * * *", "a * * * *", "*/0 * * * *"]
+)
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
+
+
+def test_cron_reports_expressions_that_never_match():
+    with pytest.raises(ValueError, match="never matches"):
+        CronExpression("0 0 31 2 *").next_after(NOW)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autoops.utils import dedup
+from autoops.utils.dedup import HashCache, find_duplicates, partial_hash
+
+
+def _write(path: Path, data: bytes) -> str:
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_find_duplicates_prefers_existing_copy(tmp_path: Path) -> None:
+    existing = _write(tmp_path / "invoice.pdf", b"same")
+    a = _write(tmp_path / "a.pdf", b"same")
+    b = _write(tmp_path / "b.pdf", b"same")
+    other = _write(tmp_path / "c.pdf", b"diff")
+
+    result = find_duplicates([a, b, other], [existing], workers=1)
+
+    assert result == {a: existing, b: existing}
+
+
+def test_find_duplicates_among_candidates_keeps_first(tmp_path: Path) -> None:
+    a = _write(tmp_path / "a.bin", b"x" * 10)
+    b = _write(tmp_path / "b.bin", b"x" * 10)
+
+    assert find_duplicates([a, b], workers=1) == {b: a}
+
+
+def test_find_duplicates_ignores_empty_files_and_unique_sizes(tmp_path: Path) -> None:
+    a = _write(tmp_path / "a", b"")
+    b = _write(tmp_path / "b", b"")
+    c = _write(tmp_path / "c", b"12")
+
+    assert find_duplicates([a, b, c], workers=1) == {}
+
+
+def test_find_duplicates_full_hash_separates_same_edges(tmp_path: Path) -> None:
+    block = 16
+    head, tail = b"h" * block, b"t" * block
+    a = _write(tmp_path / "a", head + b"AAAA" + tail)
+    b = _write(tmp_path / "b", head + b"BBBB" + tail)
+    c = _write(tmp_path / "c", head + b"AAAA" + tail)
+
+    result = find_duplicates([a, b, c], workers=2, block_size=block)
+
+    assert result == {c: a}
+
+
+def test_hash_cache_avoids_rereading_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    a = _write(tmp_path / "a", b"payload")
+    b = _write(tmp_path / "b", b"payload")
+    db = tmp_path / "hashes.sqlite3"
+
+    with HashCache(db) as cache:
+        assert find_duplicates([b], [a], workers=1, cache=cache) == {b: a}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file should not be reread")
+
+    monkeypatch.setattr(dedup, "partial_hash", fail)
+    with HashCache(db) as cache:
+        assert find_duplicates([b], [a], workers=1, cache=cache) == {b: a}
+
+
+def test_partial_hash_reads_head_and_tail(tmp_path: Path) -> None:
+    a = _write(tmp_path / "a", b"h" + b"x" * 100 + b"t")
+    b = _write(tmp_path / "b", b"h" + b"y" * 100 + b"t")
+
+    assert partial_hash(a, 102, block_size=1) == partial_hash(b, 102, block_size=1)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_find_duplicates_drops_files_that_vanish_before_hashing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: int
+) -> None:
+    a = _write(tmp_path / "a.pdf", b"same")
+    b = _write(tmp_path / "b.pdf", b"same")
+    gone = _write(tmp_path / "gone.pdf", b"same")
+    real = dedup.partial_hash
+
+    def vanishing(path, size, block_size=dedup.BLOCK_SIZE):
+        if path == gone:
+            raise FileNotFoundError(2, "No such file or directory", path)
+        return real(path, size, block_size)
+
+    monkeypatch.setattr(dedup, "partial_hash", vanishing)
+
+    assert find_duplicates([a, b, gone], workers=workers) == {b: a}
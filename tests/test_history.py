@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+
+from autoops.core.job import JobResult
+from autoops.utils.history import RunHistory, record_runs
+
+
+def _ok(counters=None):
+    metrics = {"counters": counters} if counters else None
+    return JobResult(success=True, message="ok", metrics=metrics)
+
+
+def _failed():
+    return JobResult(success=False, message="failed", error=ValueError("bad"))
+
+
+def test_history_batches_writes_until_flush(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    history = RunHistory(path, batch_size=3, flush_interval=60)
+
+    history.record("job", _ok(), 0.1)
+    history.record("job", _ok(), 0.2)
+    assert not path.exists()
+
+    history.record("job", _ok(), 0.3)  # batch full
+    assert path.exists()
+    history.record("job", _ok(), 0.4)
+    history.close()
+
+    with RunHistory(path) as reopened:
+        assert len(reopened.query()) == 4
+
+
+def test_history_query_filters_by_job_time_and_outcome(tmp_path):
+    with RunHistory(tmp_path / "h.sqlite3") as history:
+        history.record("a", _ok({"files_moved": 3}), 1.0, finished_at=1001.0)
+        history.record("a", _failed(), 1.0, finished_at=2001.0)
+        history.record("b", _ok(), 1.0, finished_at=3001.0)
+
+        assert [e.job for e in history.query()] == ["b", "a", "a"]
+        assert [e.started_at for e in history.query(job="a")] == [2000.0, 1000.0]
+        assert [e.job for e in history.query(since=1500, until=3000)] == ["a"]
+        assert len(history.query(limit=2)) == 2
+
+        (failure,) = history.query(success=False)
+        assert failure.error == "ValueError: bad"
+        assert history.query(job="a", since=900, until=1500)[0].counters == {
+            "files_moved": 3
+        }
+
+
+def test_history_stats_percentiles_and_failure_rate(tmp_path):
+    with RunHistory(tmp_path / "h.sqlite3") as history:
+        for seconds in range(1, 21):  # 1s .. 20s
+            history.record("job", _ok(), float(seconds))
+        history.record("job", _failed(), 0.5)
+        history.record("other", _ok(), 2.0)
+
+        stats = {s.job: s for s in history.stats()}
+
+    job = stats["job"]
+    assert job.runs == 21 and job.failures == 1
+    assert job.failure_rate == pytest.approx(1 / 21)
+    assert job.p50 == 10.0
+    assert job.p95 == 19.0
+    assert stats["other"].p50 == stats["other"].p95 == 2.0
+
+
+def test_history_compact_deletes_old_runs(tmp_path):
+    now = time.time()
+    with RunHistory(tmp_path / "h.sqlite3") as history:
+        history.record("job", _ok(), 1.0, finished_at=now - 40 * 86400)
+        history.record("job", _ok(), 1.0, finished_at=now - 3600)
+
+        assert history.compact(30 * 86400, now=now) == 1
+        assert len(history.query()) == 1
+
+
+def test_record_runs_is_best_effort(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    assert record_runs([("job", _ok(), 1.0, None)], blocker / "h.sqlite3") is False
+    assert record_runs([("job", _ok(), 1.0, None)], tmp_path / "h.sqlite3") is True
+
+
+def test_record_runs_writes_without_a_timer_thread(tmp_path, monkeypatch):
+    started = []
+    monkeypatch.setattr(threading.Timer, "start", lambda timer: started.append(timer))
+    path = tmp_path / "h.sqlite3"
+
+    assert record_runs([("job", _ok(), 1.0, None)], path) is True
+
+    assert started == []
+    with RunHistory(path) as history:
+        assert [entry.job for entry in history.query()] == ["job"]
+
+
+def test_history_takes_counters_from_result_totals_when_uninstrumented(tmp_path):
+    result = JobResult(
+        success=True,
+        message="ok",
+        data={"moved_total": 7, "resumed": 0, "dry_run": False, "preview_moves": []},
+    )
+    with RunHistory(tmp_path / "h.sqlite3") as history:
+        history.record("organize-files", result, 1.0)
+        (entry,) = history.query()
+
+    assert entry.counters == {"moved_total": 7, "resumed": 0}
+
+
+def test_history_flushes_on_a_timer_without_another_record(tmp_path):
+    path = tmp_path / "h.sqlite3"
+    history = RunHistory(path, batch_size=100, flush_interval=0.05)
+    history.record("job", _ok(), 0.1)
+
+    deadline = time.monotonic() + 5
+    with RunHistory(path) as reader:
+        while not reader.query() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert len(reader.query()) == 1
+    history.close()
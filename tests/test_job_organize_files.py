@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import os
+import sys
+import time
 from pathlib import Path
 
+import pytest
+
+from autoops.config.loader import OrganizeDedupConfig, OrganizeThrottleConfig
 from autoops.jobs.organize_files import organize_files
 
 
@@ -107,3 +113,314 @@ def test_organize_files_handles_name_collision(tmp_path: Path) -> None:
     assert (src / "pdf" / "a.pdf").exists()
     assert (src / "pdf" / "a_1.pdf").exists()
     assert not (src / "a.pdf").exists()
+
+
+def test_organize_files_recursive_skips_category_dirs(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    (src / "nested" / "deeper").mkdir(parents=True)
+    (src / "pdf").mkdir()
+
+    _touch(src / "nested" / "a.pdf")
+    _touch(src / "nested" / "deeper" / "b.pdf")
+    _touch(src / "pdf" / "already.pdf")
+
+    result = organize_files(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        preview=False,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        recursive=True,
+        max_depth=1,
+    )
+
+    assert result["moved_total"] == 1
+    assert (src / "pdf" / "a.pdf").exists()
+    assert (src / "pdf" / "already.pdf").exists()
+    assert (src / "nested" / "deeper" / "b.pdf").exists()
+
+
+def test_organize_files_parallel_matches_serial(tmp_path: Path) -> None:
+    categories = {"pdf": [".pdf"], "images": [".jpg"]}
+    results = []
+
+    for workers in (1, 4):
+        src = tmp_path / f"src{workers}"
+        (src / "pdf").mkdir(parents=True)
+        _touch(src / "pdf" / "a.pdf", "existing")
+        for i in range(20):
+            _touch(src / f"f{i}.jpg")
+            _touch(src / f"f{i}.pdf")
+        _touch(src / "a.pdf", "new")
+
+        result = organize_files(
+            source_dir=src,
+            destination_dir=src,
+            dry_run=False,
+            preview=False,
+            categories=categories,
+            others_dir="others",
+            workers=workers,
+        )
+        results.append(result["moved_by_category"])
+
+        assert sorted(os.listdir(src / "pdf")) == sorted(
+            ["a.pdf", "a_1.pdf"] + [f"f{i}.pdf" for i in range(20)]
+        )
+        assert (src / "pdf" / "a_1.pdf").read_text(encoding="utf-8") == "new"
+
+    assert results[0] == results[1] == {"pdf": 21, "images": 20, "others": 0}
+
+
+def test_organize_files_reports_moves_to_callback(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    (src / "pdf").mkdir(parents=True)
+    _touch(src / "pdf" / "a.pdf")
+    _touch(src / "a.pdf")
+    records = []
+
+    organize_files(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        preview=False,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        on_move=records.append,
+    )
+
+    assert records == [
+        {
+            "type": "moved",
+            "source": "a.pdf",
+            "target": os.path.join("pdf", "a_1.pdf"),
+            "category": "pdf",
+        }
+    ]
+
+
+def test_organize_files_preview_limit_caps_list_not_counts(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(10):
+        _touch(src / f"{i}.pdf")
+
+    result = organize_files(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=True,
+        preview=True,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        preview_limit=3,
+    )
+
+    assert result["moved_total"] == 10
+    assert len(result["preview_moves"]) == 3
+
+
+def test_organize_files_incremental_dry_run_reports_only_new_files(
+    tmp_path: Path,
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    _touch(src / "a.pdf")
+    past = time.time() - 60
+    os.utime(src, (past, past))
+    kwargs = dict(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=True,
+        preview=True,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        incremental=True,
+        state_path=tmp_path / "state.sqlite3",
+    )
+
+    assert organize_files(**kwargs)["moved_total"] == 1
+    assert organize_files(**kwargs)["moved_total"] == 0
+
+    _touch(src / "b.pdf")
+    os.utime(src, (past + 1, past + 1))
+
+    result = organize_files(**kwargs)
+    assert result["moved_total"] == 1
+    assert result["preview_moves"] == [("b.pdf", os.path.join("pdf", "b.pdf"))]
+
+
+@pytest.mark.parametrize("action", ["skip", "hardlink", "quarantine"])
+def test_organize_files_dedup_actions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, action: str
+) -> None:
+    monkeypatch.setenv("AUTOOPS_CACHE_DIR", str(tmp_path / "cache"))
+    src = tmp_path / "src"
+    (src / "pdf").mkdir(parents=True)
+    _touch(src / "pdf" / "invoice.pdf", "same")
+    _touch(src / "invoice.pdf", "same")
+    _touch(src / "other.pdf", "different")
+
+    result = organize_files(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        preview=False,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        dedup=OrganizeDedupConfig(enabled=True, action=action, hash_workers=1),
+    )
+
+    assert result["moved_by_category"]["pdf"] == 1
+    assert result["duplicates"] == {"action": action, "total": 1}
+    assert (src / "pdf" / "other.pdf").exists()
+    if action == "skip":
+        assert (src / "invoice.pdf").exists()
+        assert not (src / "pdf" / "invoice_1.pdf").exists()
+    elif action == "hardlink":
+        assert not (src / "invoice.pdf").exists()
+        linked = src / "pdf" / "invoice_1.pdf"
+        assert linked.stat().st_ino == (src / "pdf" / "invoice.pdf").stat().st_ino
+    else:
+        assert not (src / "invoice.pdf").exists()
+        assert (src / "duplicates" / "invoice.pdf").read_text("utf-8") == "same"
+
+
+def test_organize_handler_is_memoized_until_the_source_changes(
+    tmp_path: Path,
+) -> None:
+    from autoops.core.job import Job
+    from autoops.core.memo import ResultCache
+    from autoops.jobs.organize_files import organize_files_factory
+
+    config = Path(__file__).resolve().parents[1] / "configs" / "organize_files.yaml"
+    src = tmp_path / "src"
+    src.mkdir()
+    _touch(src / "a.pdf")
+    os.utime(src, (time.time() - 100, time.time() - 100))
+
+    handler = organize_files_factory(config_path=config, source_dir=src, dry_run=True)
+    job = Job("organize-files", "", handler, fingerprint=handler.fingerprint)
+    cache = ResultCache(tmp_path / "results.sqlite3")
+
+    first = job.run(cache=cache)
+    second = job.run(cache=cache)
+    assert not first.cached and second.cached
+    assert second.data == first.data
+
+    _touch(src / "b.pdf")
+    assert not job.run(cache=cache).cached  # modified just now: not trusted
+    os.utime(src, (time.time() - 50, time.time() - 50))
+    third = job.run(cache=cache)
+    assert not third.cached and third.data["moved_total"] == 2
+    assert job.run(cache=cache).cached
+    assert not job.run(cache=cache, force=True).cached
+
+
+def test_organize_many_merges_shards_sharing_a_destination(tmp_path: Path) -> None:
+    from autoops.jobs.organize_files import organize_many
+
+    sources = [tmp_path / "in1", tmp_path / "in2"]
+    for src in sources:
+        src.mkdir()
+        _touch(src / "report.pdf", src.name)
+    _touch(sources[1] / "photo.jpg")
+    out = tmp_path / "out"
+    shards = [(src, out) for src in sources] + [(tmp_path / "missing", out)]
+
+    result = organize_many(
+        shards,
+        categories={"pdf": [".pdf"], "images": [".jpg"]},
+        others_dir="others",
+        dry_run=False,
+        processes=2,
+    )
+
+    assert result["moved_total"] == 3
+    assert result["moved_by_category"] == {"pdf": 2, "images": 1, "others": 0}
+    assert result["destination_dir"] == str(out)
+    assert result["resumed"] == 0 and not isinstance(result["resumed"], bool)
+    assert [s["moved_total"] for s in result["sources"]] == [1, 2, 0]
+    assert result["sources"][2]["error"] is not None
+    names = sorted(p.name for p in (out / "pdf").iterdir())
+    assert names == ["report.pdf", "report_1.pdf"]
+    contents = {(out / "pdf" / n).read_text(encoding="utf-8") for n in names}
+    assert contents == {"in1", "in2"}
+
+
+def test_apply_plan_moves_planned_files_and_skips_changed_ones(
+    tmp_path: Path,
+) -> None:
+    from autoops.jobs.organize_files import apply_plan, plan_organize
+    from autoops.utils.plan import MovePlan
+
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    for name in ("a.pdf", "b.pdf", "c.pdf", "sub/d.jpg"):
+        _touch(src / name)
+    categories = {"pdf": [".pdf"], "images": [".jpg"]}
+
+    plan = plan_organize(src, src, categories, "others", recursive=True)
+    plan.write(tmp_path / "plan.bin")
+    assert len(plan) == 4 and plan.counts()["pdf"] == 3
+    assert not (src / "pdf").exists()  # planning moves nothing
+
+    (src / "b.pdf").unlink()
+    (src / "c.pdf").unlink()
+    _touch(src / "c.pdf", "replaced since planned")
+    os.utime(src / "c.pdf", ns=(10**9, 10**9))
+
+    result = apply_plan(MovePlan.read(tmp_path / "plan.bin"))
+
+    assert result["moved_total"] == 2
+    assert result["moved_by_category"] == {"pdf": 1, "images": 1, "others": 0}
+    assert (result["stale"], result["missing"]) == (1, 1)
+    assert (src / "pdf" / "a.pdf").exists()
+    assert (src / "images" / "d.jpg").exists()
+    assert (src / "c.pdf").exists()
+
+
+def test_organize_files_throttled_run_moves_everything(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(5):
+        _touch(src / f"{i}.pdf")
+
+    result = organize_files(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        preview=False,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        workers=2,
+        throttle=OrganizeThrottleConfig(ops_per_second=1000, target_latency=1.0),
+    )
+
+    assert result["moved_total"] == 5
+    assert len(list((src / "pdf").iterdir())) == 5
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="per-thread nice")
+def test_organize_files_lowers_priority_of_its_own_threads_only(
+    tmp_path: Path,
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    _touch(src / "a.pdf")
+    before = os.nice(0)
+    seen = []
+
+    organize_files(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        preview=False,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        on_move=lambda record: seen.append(os.nice(0)),
+        throttle=OrganizeThrottleConfig(nice=min(before + 1, 19)),
+    )
+
+    assert seen == [min(before + 1, 19)]
+    assert os.nice(0) == before
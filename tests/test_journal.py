@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from autoops.jobs.organize_files import organize_files
+from autoops.utils.journal import MoveJournal, journal_path, read_journal, undo_run
+
+CATEGORIES = {"documents": [".pdf"], "images": [".png"]}
+
+
+@pytest.fixture(autouse=True)
+def _data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    data = tmp_path / "appdata"
+    monkeypatch.setenv("AUTOOPS_DATA_DIR", str(data))
+    return data
+
+
+def _organize(src: Path, journal: MoveJournal) -> dict:
+    return organize_files(
+        source_dir=src,
+        destination_dir=src,
+        categories=CATEGORIES,
+        others_dir="others",
+        dry_run=False,
+        journal=journal,
+    )
+
+
+def test_journaled_run_can_be_undone(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_text("a", encoding="utf-8")
+    (src / "b.png").write_text("b", encoding="utf-8")
+
+    journal = MoveJournal.create(source_dir=str(src))
+    result = _organize(src, journal)
+    journal.close("completed")
+
+    assert result["run_id"] == journal.run_id
+    assert (src / "documents" / "a.pdf").exists()
+    ops = [r["op"] for r in read_journal(journal.path)]
+    assert ops.count("plan") == ops.count("done") == 2
+    assert ops[0] == "begin" and ops[-1] == "end"
+
+    undone = undo_run(journal.run_id)
+
+    assert undone["restored"] == 2
+    assert undone["conflicts"] == [] and undone["missing"] == []
+    assert (src / "a.pdf").read_text(encoding="utf-8") == "a"
+    assert (src / "b.png").exists()
+    assert not (src / "documents" / "a.pdf").exists()
+    # running it again is a no-op
+    assert undo_run(journal.run_id)["restored"] == 0
+
+
+def test_undo_never_overwrites_a_new_file_at_the_original_path(
+    tmp_path: Path,
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_text("old", encoding="utf-8")
+
+    journal = MoveJournal.create()
+    _organize(src, journal)
+    journal.close("completed")
+    (src / "a.pdf").write_text("new", encoding="utf-8")
+
+    undone = undo_run(journal.run_id)
+
+    assert undone["restored"] == 0
+    assert undone["conflicts"] == [str(src / "a.pdf")]
+    assert (src / "a.pdf").read_text(encoding="utf-8") == "new"
+
+
+def test_undo_does_not_overwrite_a_file_created_after_its_check(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_text("old", encoding="utf-8")
+
+    journal = MoveJournal.create()
+    _organize(src, journal)
+    journal.close("completed")
+    # the new file appears between the lexists check and the move back
+    (src / "a.pdf").write_text("new", encoding="utf-8")
+    monkeypatch.setattr("autoops.utils.journal.os.path.lexists", lambda p: False)
+
+    undone = undo_run(journal.run_id)
+
+    assert undone["restored"] == 0
+    assert undone["conflicts"] == [str(src / "a.pdf")]
+    assert (src / "a.pdf").read_text(encoding="utf-8") == "new"
+    assert (src / "documents" / "a.pdf").read_text(encoding="utf-8") == "old"
+
+
+def test_resume_completes_plans_left_by_a_crash(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "todo.pdf").write_text("t", encoding="utf-8")
+    (src / "moved.png").write_text("m", encoding="utf-8")
+
+    # Simulate a crash: both plans are durable, only one move happened and
+    # its "done" record never reached the disk.
+    journal = MoveJournal.create()
+    docs, images = src / "documents", src / "images"
+    journal.record_plan(str(src / "todo.pdf"), str(docs), "todo.pdf", "documents", 0)
+    inode = (src / "moved.png").stat().st_ino
+    journal.record_plan(
+        str(src / "moved.png"), str(images), "moved.png", "images", inode
+    )
+    journal.commit()
+    images.mkdir()
+    os.replace(src / "moved.png", images / "moved.png")
+    run_id = journal.run_id
+    journal._fh.close()
+
+    resumed = MoveJournal.resume(run_id)
+    assert [p["name"] for p in resumed.pending] == ["todo.pdf", "moved.png"]
+    result = _organize(src, resumed)
+    resumed.close("completed")
+
+    assert result["resumed"] == 2
+    assert result["moved_total"] == 2
+    assert (docs / "todo.pdf").exists()
+    assert MoveJournal.resume(run_id).pending == []
+    assert undo_run(run_id)["restored"] == 2
+    assert (src / "todo.pdf").exists() and (src / "moved.png").exists()
+
+
+def _crash(journal: MoveJournal) -> str:
+    journal.commit()
+    journal._fh.close()
+    return journal.run_id
+
+
+def test_resume_drops_placeholders_left_by_a_crash(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    docs = src / "documents"
+    docs.mkdir(parents=True)
+    (src / "todo.pdf").write_text("t", encoding="utf-8")
+    (docs / "kept.pdf").write_text("", encoding="utf-8")
+
+    # the name was reserved (an empty file), then the run died
+    journal = MoveJournal.create()
+    journal.record_plan(str(src / "todo.pdf"), str(docs), "todo.pdf", "documents", 0)
+    (docs / "todo.pdf").touch()
+    run_id = _crash(journal)
+
+    resumed = MoveJournal.resume(run_id)
+    result = _organize(src, resumed)
+    resumed.close("completed")
+
+    assert result["resumed"] == 1
+    assert sorted(p.name for p in docs.iterdir()) == ["kept.pdf", "todo.pdf"]
+    assert (docs / "todo.pdf").read_text(encoding="utf-8") == "t"
+
+
+def test_resume_replays_each_plan_with_its_action(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    docs, quarantine = src / "documents", src / "duplicates"
+    docs.mkdir(parents=True)
+    canon = docs / "a.pdf"
+    canon.write_text("same", encoding="utf-8")
+    (src / "copy.pdf").write_text("same", encoding="utf-8")
+    (src / "linked.pdf").write_text("same", encoding="utf-8")
+    (src / "dup.pdf").write_text("same", encoding="utf-8")
+
+    journal = MoveJournal.create()
+    for name in ("copy.pdf", "linked.pdf"):
+        journal.record_plan(
+            str(src / name), str(docs), name, "documents", 0, "link", str(canon)
+        )
+    journal.record_plan(
+        str(src / "dup.pdf"), str(quarantine), "dup.pdf", "documents", 0, "quarantine"
+    )
+    # this link was made, but its source was not removed yet
+    os.link(canon, docs / "linked.pdf")
+    run_id = _crash(journal)
+
+    resumed = MoveJournal.resume(run_id)
+    result = _organize(src, resumed)
+    resumed.close("completed")
+
+    assert result["resumed"] == 3
+    assert result["moved_total"] == 0
+    assert sorted(p.name for p in src.iterdir()) == ["documents", "duplicates"]
+    inode = canon.stat().st_ino
+    assert (docs / "copy.pdf").stat().st_ino == inode
+    assert (docs / "linked.pdf").stat().st_ino == inode
+    assert sorted(p.name for p in docs.iterdir()) == ["a.pdf", "copy.pdf", "linked.pdf"]
+    assert (quarantine / "dup.pdf").read_text(encoding="utf-8") == "same"
+    assert MoveJournal.resume(run_id).pending == []
+
+
+def test_read_journal_ignores_torn_last_line(tmp_path: Path) -> None:
+    path = tmp_path / "run.jsonl"
+    good = json.dumps({"op": "plan", "seq": 1})
+    path.write_text(good + "\n" + '{"op": "do', encoding="utf-8")
+
+    assert list(read_journal(path)) == [{"op": "plan", "seq": 1}]
+
+
+def test_journal_path_rejects_path_like_run_ids(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        journal_path("../etc/passwd", tmp_path)
+    with pytest.raises(FileNotFoundError):
+        undo_run("20200101T000000-abcdef")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from autoops.config import loader
+from autoops.config.loader import load_organize_files_config
+
+CONFIG = """
+organize_files:
+  source_dir: "{source}"
+  dry_run: true
+  categories:
+    pdf: [".pdf"]
+    images: [".png", ".jpg"]
+"""
+
+
+def _write_config(tmp_path: Path, body: str = CONFIG) -> Path:
+    cfg = tmp_path / "organize.yaml"
+    cfg.write_text(body.format(source=tmp_path / "in"), encoding="utf-8")
+    return cfg
+
+
+def _no_parse(raw: str):
+    raise AssertionError("YAML should have come from the cache")
+
+
+def test_loader_reuses_compiled_config_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _write_config(tmp_path)
+    first = load_organize_files_config(cfg)
+
+    monkeypatch.setattr(loader, "_MEMORY_CACHE", {})  # as in a new process
+    monkeypatch.setattr(loader, "_parse_yaml", _no_parse)
+    second = load_organize_files_config(cfg)
+
+    assert second == first
+    assert second.category_index.lookup("x.JPG") == "images"
+
+
+def test_loader_keeps_loaded_configs_in_memory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _write_config(tmp_path)
+    first = load_organize_files_config(cfg)
+
+    monkeypatch.setattr(loader, "_read_cached_config", _no_parse)
+    assert load_organize_files_config(cfg) is first
+
+    cfg.write_text(
+        cfg.read_text(encoding="utf-8").replace(".png", ".gif"), encoding="utf-8"
+    )
+    monkeypatch.undo()
+    assert load_organize_files_config(cfg).category_index.lookup("a.gif") == "images"
+
+
+def test_loader_cache_is_keyed_by_overrides(tmp_path: Path) -> None:
+    cfg = _write_config(tmp_path)
+    load_organize_files_config(cfg)
+
+    loaded = load_organize_files_config(cfg, source_dir=tmp_path / "other")
+
+    assert loaded.source_dir == tmp_path / "other"
+
+
+def test_loader_rebuilds_when_content_changes_behind_same_mtime_and_size(
+    tmp_path: Path,
+) -> None:
+    cfg = _write_config(tmp_path)
+    load_organize_files_config(cfg)
+    st = cfg.stat()
+
+    cfg.write_text(
+        cfg.read_text(encoding="utf-8").replace(".png", ".gif"), encoding="utf-8"
+    )
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cfg.stat().st_size == st.st_size
+
+    loaded = load_organize_files_config(cfg)
+
+    assert loaded.category_index.lookup("a.gif") == "images"
+    assert loaded.category_index.lookup("a.png") is None
+
+
+def test_loader_recovers_from_corrupt_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _write_config(tmp_path)
+    expected = load_organize_files_config(cfg)
+    monkeypatch.setattr(loader, "_MEMORY_CACHE", {})
+    for path in (tmp_path / "appcache" / "config").iterdir():
+        path.write_bytes(b"not a pickle")
+
+    assert load_organize_files_config(cfg) == expected
+
+
+def test_loader_use_cache_false_always_parses(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _write_config(tmp_path)
+    load_organize_files_config(cfg)
+
+    monkeypatch.setattr(loader, "_parse_yaml", _no_parse)
+    with pytest.raises(AssertionError):
+        load_organize_files_config(cfg, use_cache=False)
+
+
+def test_loader_sources_expand_globs_at_run_time(tmp_path: Path) -> None:
+    from autoops.config.loader import organize_sources
+
+    cfg = tmp_path / "organize.yaml"
+    cfg.write_text(
+        f"organize_files:\n  sources: ['{tmp_path}/inbox-*', '{tmp_path}/extra']\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "inbox-b").mkdir()
+    (tmp_path / "inbox-a").mkdir()
+    (tmp_path / "extra").mkdir()
+    loaded = load_organize_files_config(cfg)
+
+    assert loaded.in_place
+    assert organize_sources(loaded) == [
+        (tmp_path / name, tmp_path / name) for name in ("inbox-a", "inbox-b", "extra")
+    ]
+    (tmp_path / "inbox-c").mkdir()
+    assert len(organize_sources(loaded)) == 4
+
+    shared = load_organize_files_config(cfg, destination_dir=tmp_path / "out")
+    assert {d for _, d in organize_sources(shared)} == {tmp_path / "out"}
+
+    single = load_organize_files_config(cfg, source_dir=tmp_path / "extra")
+    assert organize_sources(single) == [(tmp_path / "extra", tmp_path / "extra")]
+
+
+def test_loader_reads_throttle_section(tmp_path: Path) -> None:
+    body = CONFIG + (
+        "  throttle:\n"
+        '    bytes_per_second: "50MB"\n'
+        "    ops_per_second: 200\n"
+        '    target_latency: "20ms"\n'
+        "    nice: 10\n"
+        "    ionice: idle\n"
+    )
+    throttle = load_organize_files_config(_write_config(tmp_path, body)).throttle
+
+    assert throttle.enabled
+    assert throttle.bytes_per_second == 50 * 1024 * 1024
+    assert throttle.ops_per_second == 200
+    assert throttle.target_latency == pytest.approx(0.02)
+    assert (throttle.nice, throttle.ionice) == (10, "idle")
+
+
+def test_loader_rejects_bad_throttle_values(tmp_path: Path) -> None:
+    body = CONFIG + "  throttle:\n    ionice: fast\n"
+    with pytest.raises(ValueError, match="ionice"):
+        load_organize_files_config(_write_config(tmp_path, body), use_cache=False)
+    assert not load_organize_files_config(_write_config(tmp_path)).throttle.enabled
+
+
+def test_loader_reads_transfer_section(tmp_path: Path) -> None:
+    body = CONFIG + (
+        "  transfer:\n"
+        "    workers: 8\n"
+        '    parallel_min_size: "1GiB"\n'
+        "    verify: true\n"
+    )
+    transfer = load_organize_files_config(_write_config(tmp_path, body)).transfer
+
+    assert transfer.workers == 8
+    assert transfer.parallel_min_size == 1024**3
+    assert transfer.verify
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from autoops.core.job import Job, JobResult
+from autoops.core.memo import ResultCache
+
+
+def _counting_job(fingerprint: List[Optional[str]], calls: List[int]) -> Job:
+    def handler() -> int:
+        calls.append(1)
+        return len(calls)
+
+    return Job("count", "", handler, fingerprint=lambda: fingerprint[0])
+
+
+def test_job_reuses_result_while_fingerprint_matches(tmp_path: Path) -> None:
+    fingerprint: List[Optional[str]] = ["v1"]
+    calls: List[int] = []
+    job = _counting_job(fingerprint, calls)
+
+    with ResultCache(tmp_path / "results.sqlite3") as cache:
+        assert job.run(cache=cache).data == 1
+        hit = job.run(cache=cache, instrument=True)
+        assert hit.cached and hit.data == 1 and len(calls) == 1
+        assert hit.metrics is not None and hit.metrics["counters"] == {}
+
+        fingerprint[0] = "v2"
+        assert job.run(cache=cache).data == 2
+        assert job.run(cache=cache, force=True).data == 3
+        assert job.run(cache=cache).data == 3  # force stored the new result
+
+        fingerprint[0] = None  # the job cannot tell: always runs
+        assert job.run(cache=cache).data == 4
+    assert job.run().data == 5  # no cache, no memoization
+
+
+def test_job_does_not_store_failures_or_runs_that_change_inputs(
+    tmp_path: Path,
+) -> None:
+    cache = ResultCache(tmp_path / "results.sqlite3")
+    failing = Job("fail", "", lambda: 1 / 0, fingerprint=lambda: "same")
+    assert not failing.run(cache=cache).success
+    assert cache.get("fail", "same") is None
+
+    state = ["before"]
+
+    def change_inputs() -> None:
+        state[0] = "after"
+
+    job = Job("mutating", "", change_inputs, fingerprint=lambda: state[0])
+    job.run(cache=cache)
+    assert cache.get("mutating", "before") is None
+    assert cache.get("mutating", "after") is None
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "results.sqlite3", max_bytes=800)  # two results
+    payload = "x" * 200
+    cache.put("a", "1", JobResult(True, "ok", payload))
+    cache.put("b", "1", JobResult(True, "ok", payload))
+    assert cache.get("a", "1") is not None  # "b" is now the least recent
+    cache.put("c", "1", JobResult(True, "ok", payload))
+
+    assert cache.get("b", "1") is None
+    assert cache.get("a", "1").data == payload
+    assert cache.get("c", "1").data == payload
+    assert not cache.put("big", "1", JobResult(True, "ok", "x" * 2000))
+
+
+def test_result_cache_skips_unpicklable_results(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "results.sqlite3")
+    assert not cache.put("lock", "1", JobResult(True, "ok", threading.Lock()))
+    assert cache.get("lock", "1") is None
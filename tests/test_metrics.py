@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from autoops.core.job import Job
+from autoops.core.metrics import NULL_METRICS, Metrics, current_metrics
+from autoops.jobs.organize_files import organize_files
+
+
+def _slow(items, delay):
+    for item in items:
+        time.sleep(delay)
+        yield item
+
+
+def test_timed_iter_records_exclusive_time_per_stage() -> None:
+    metrics = Metrics()
+    inner = metrics.timed_iter("inner", _slow(range(5), 0.01), "items")
+    outer = metrics.timed_iter("outer", _slow(inner, 0.002))
+
+    assert list(outer) == [0, 1, 2, 3, 4]
+
+    spans = metrics.as_dict()["spans"]
+    assert spans["inner"]["calls"] == 5
+    assert spans["inner"]["seconds"] >= 0.05
+    # the outer stage does not count the inner stage's time again
+    assert 0.01 <= spans["outer"]["seconds"] < 0.05
+    assert metrics.as_dict()["counters"] == {"items": 5}
+
+
+def test_span_excludes_nested_spans_and_counts_calls() -> None:
+    metrics = Metrics()
+    for _ in range(2):
+        with metrics.span("outer"):
+            with metrics.span("inner"):
+                time.sleep(0.01)
+
+    spans = metrics.as_dict()["spans"]
+    assert spans["inner"]["calls"] == spans["outer"]["calls"] == 2
+    assert spans["outer"]["seconds"] < spans["inner"]["seconds"]
+
+
+def test_null_metrics_pass_iterables_through_unchanged() -> None:
+    items = [1, 2, 3]
+
+    assert NULL_METRICS.timed_iter("scan", items) is items
+    with NULL_METRICS.span("anything"):
+        NULL_METRICS.count("files")
+    assert NULL_METRICS.as_dict() == {"spans": {}, "counters": {}}
+
+
+def test_job_run_attaches_metrics_only_when_instrumented() -> None:
+    def handler():
+        current_metrics().count("widgets", 3)
+        return {"ok": True}
+
+    job = Job(name="j", description="", handler=handler)
+
+    assert job.run().metrics is None
+    metrics = job.run(instrument=True).metrics
+    assert metrics["counters"] == {"widgets": 3}
+    assert metrics["wall_seconds"] >= 0
+
+
+def test_instrumented_organize_reports_phases_and_counters(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_bytes(b"12345")
+    (src / "b.pdf").write_bytes(b"67")
+    (src / "pdf").mkdir()
+    (src / "pdf" / "a.pdf").write_bytes(b"old")
+
+    def handler():
+        return organize_files(
+            source_dir=src,
+            destination_dir=src,
+            categories={"pdf": [".pdf"]},
+            others_dir="others",
+            dry_run=False,
+        )
+
+    metrics = Job(name="o", description="", handler=handler).run(
+        instrument=True
+    ).metrics
+
+    assert {"scan", "classify", "plan", "mkdir", "claim", "move"} <= set(
+        metrics["spans"]
+    )
+    counters = metrics["counters"]
+    assert counters["files_scanned"] == 2
+    assert counters["files_moved"] == 2
+    assert counters["bytes_moved"] == 0  # renamed: sizes unknown, nothing copied
+    assert counters["renamed_on_collision"] == 1
+    assert "stat_calls" not in counters  # a plain scan never stats
+
+
+def test_instrumentation_counts_only_the_stats_the_pipeline_makes(
+    tmp_path: Path,
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.pdf").write_bytes(b"12345")
+    (src / "b.pdf").write_bytes(b"67")
+
+    def handler():
+        return organize_files(
+            source_dir=src,
+            destination_dir=src,
+            categories={"pdf": [".pdf"]},
+            others_dir="others",
+            dry_run=False,
+            incremental=True,
+            state_path=tmp_path / "state.sqlite3",
+        )
+
+    counters = Job(name="o", description="", handler=handler).run(
+        instrument=True
+    ).metrics["counters"]
+
+    assert counters["stat_calls"] == 3  # the source folder and its two files
+    assert counters["bytes_moved"] == 7  # sizes from the scan's stats
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import errno
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from autoops.utils import moves, transfer
+from autoops.utils.moves import (
+    LaneExecutor,
+    make_executor,
+    move_file,
+    move_file_no_replace,
+)
+
+
+def test_move_file_renames_within_filesystem(tmp_path: Path) -> None:
+    src = tmp_path / "a.txt"
+    src.write_text("data", encoding="utf-8")
+
+    move_file(str(src), str(tmp_path / "b.txt"))
+
+    assert not src.exists()
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "data"
+
+
+def test_move_file_falls_back_to_copy_across_devices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.txt"
+    src.write_text("data", encoding="utf-8")
+
+    def cross_device(a, b):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(moves.os, "replace", cross_device)
+
+    move_file(str(src), str(tmp_path / "b.txt"))
+
+    assert not src.exists()
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "data"
+
+
+@pytest.mark.parametrize("cross_device", [False, True])
+def test_move_file_no_replace_never_overwrites(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cross_device: bool
+) -> None:
+    if cross_device:
+
+        def no_link(a, b, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(moves.os, "link", no_link)
+    src = tmp_path / "a.txt"
+    src.write_text("data", encoding="utf-8")
+    taken = tmp_path / "taken.txt"
+    taken.write_text("mine", encoding="utf-8")
+
+    assert not move_file_no_replace(str(src), str(taken))
+    assert taken.read_text(encoding="utf-8") == "mine"
+    assert src.exists()
+
+    assert move_file_no_replace(str(src), str(tmp_path / "b.txt"))
+    assert not src.exists()
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "data"
+
+
+def test_lane_executor_keeps_per_key_order() -> None:
+    seen = {"a": [], "b": []}
+
+    with LaneExecutor(4) as executor:
+        for i in range(50):
+            for key in ("a", "b"):
+                executor.submit(key, lambda key=key, i=i: seen[key].append(i))
+
+    assert seen["a"] == list(range(50))
+    assert seen["b"] == list(range(50))
+
+
+def test_lane_executor_runs_keys_in_parallel() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    with LaneExecutor(2) as executor:
+        executor.submit("a", barrier.wait)
+        executor.submit("b", barrier.wait)
+
+
+def test_lane_executor_reraises_first_error() -> None:
+    def boom():
+        time.sleep(0.01)
+        raise RuntimeError("boom")
+
+    executor = LaneExecutor(2)
+    executor.submit("a", boom)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        executor.close()
+
+
+def test_make_executor_is_serial_for_one_worker() -> None:
+    calls = []
+    with make_executor(1) as executor:
+        executor.submit("k", lambda: calls.append(threading.current_thread()))
+
+    assert calls == [threading.current_thread()]
+
+
+def test_move_file_throttles_cross_device_copies(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.bin"
+    src.write_bytes(b"x" * (3 * transfer._THROTTLED_STEP + 10))
+
+    def cross_device(a, b):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    class Recorder:
+        def __init__(self) -> None:
+            self.ops = 0
+            self.transfers = []
+
+        def op(self) -> None:
+            self.ops += 1
+
+        def transfer(self, nbytes: int) -> None:
+            self.transfers.append(nbytes)
+
+        def observe(self, seconds: float) -> None:
+            pass
+
+    monkeypatch.setattr(moves.os, "replace", cross_device)
+    recorder = Recorder()
+    move_file(str(src), str(tmp_path / "b.bin"), recorder)
+
+    assert not src.exists()
+    assert (tmp_path / "b.bin").stat().st_size == 3 * transfer._THROTTLED_STEP + 10
+    assert recorder.ops == 1
+    assert sum(recorder.transfers) == 3 * transfer._THROTTLED_STEP + 10
+
+
+def test_move_file_recreates_symlinks_across_devices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "real.txt").write_text("data", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to("real.txt")
+    (tmp_path / "out").mkdir()
+    target = tmp_path / "out" / "link.txt"
+    target.touch()  # the name reserved by the caller
+    real_replace = os.replace
+
+    def cross_device(a, b):
+        if a == str(link):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        real_replace(a, b)
+
+    monkeypatch.setattr(moves.os, "replace", cross_device)
+    move_file(str(link), str(target))
+
+    assert not os.path.lexists(link)
+    assert target.is_symlink()
+    assert os.readlink(target) == "real.txt"
+    assert os.listdir(tmp_path / "out") == ["link.txt"]
+
+
+def test_move_file_reports_copy_latency_to_the_throttle(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.txt"
+    src.write_text("data", encoding="utf-8")
+
+    def cross_device(a, b):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    class Recorder:
+        def __init__(self) -> None:
+            self.observed = []
+
+        def op(self) -> None:
+            pass
+
+        def transfer(self, nbytes: int) -> None:
+            pass
+
+        def observe(self, seconds: float) -> None:
+            self.observed.append(seconds)
+
+    monkeypatch.setattr(moves.os, "replace", cross_device)
+    recorder = Recorder()
+    # a copier without the throttle: move_file reports the whole copy
+    move_file(str(src), str(tmp_path / "b.txt"), recorder, transfer.FileCopier())
+
+    assert len(recorder.observed) == 1
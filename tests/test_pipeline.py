@@ -0,0 +1,168 @@
+import threading
+import time
+
+import pytest
+
+from autoops.config.loader import load_pipeline_config
+from autoops.core.job import Job
+from autoops.core.pipeline import Pipeline, run_pipeline
+from autoops.core.registry import JobSpec, Registry
+
+
+def _registry(**handlers):
+    registry = Registry()
+    for name, handler in handlers.items():
+        registry.register(Job(name=name, description=name, handler=handler))
+    return registry
+
+
+def test_pipeline_orders_steps_by_dependencies():
+    pipeline = (
+        Pipeline()
+        .add("archive", needs=["dedup"])
+        .add("dedup", needs=["organize"])
+        .add("organize")
+    )
+
+    assert pipeline.order() == ["organize", "dedup", "archive"]
+
+
+def test_pipeline_rejects_cycles_and_unknown_steps():
+    cyclic = (
+        Pipeline().add("a", needs=["c"]).add("b", needs=["a"]).add("c", needs=["b"])
+    )
+    with pytest.raises(ValueError, match="cycle: a -> c -> b -> a"):
+        cyclic.order()
+
+    with pytest.raises(ValueError, match="unknown step 'nope'"):
+        Pipeline().add("a", needs=["nope"]).order()
+
+
+def test_run_pipeline_runs_independent_branches_in_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+    finished = []
+
+    def branch():
+        barrier.wait()  # deadlocks unless both branches run at the same time
+        finished.append("branch")
+
+    registry = _registry(
+        root=lambda: finished.append("root"),
+        left=branch,
+        right=branch,
+        join=lambda: finished.append("join"),
+    )
+    pipeline = (
+        Pipeline()
+        .add("root")
+        .add("left", needs=["root"])
+        .add("right", needs=["root"])
+        .add("join", needs=["left", "right"])
+    )
+
+    result = run_pipeline(registry, pipeline, max_parallel=2)
+
+    assert result.success is True
+    assert finished == ["root", "branch", "branch", "join"]
+    assert [r.name for r in result.runs] == ["root", "left", "right", "join"]
+
+
+def test_run_pipeline_skips_downstream_of_a_failure_only():
+    def boom():
+        raise RuntimeError("boom")
+
+    registry = _registry(bad=boom, after=lambda: 1, other=lambda: 2, last=lambda: 3)
+    pipeline = (
+        Pipeline()
+        .add("bad")
+        .add("after", needs=["bad"])
+        .add("last", needs=["after", "other"])
+        .add("other")
+    )
+
+    result = run_pipeline(registry, pipeline)
+
+    statuses = {r.name: r.status for r in result.runs}
+    assert statuses == {
+        "bad": "failed",
+        "other": "succeeded",
+        "after": "skipped",
+        "last": "skipped",
+    }
+    assert result.success is False
+
+
+def test_run_pipeline_reports_critical_path():
+    registry = _registry(
+        slow=lambda: time.sleep(0.2), fast=lambda: None, end=lambda: None
+    )
+    pipeline = (
+        Pipeline()
+        .add("slow")
+        .add("fast")
+        .add("end", needs=["fast", "slow"])
+    )
+
+    result = run_pipeline(registry, pipeline)
+
+    assert result.critical_path == ["slow", "end"]
+    assert result.critical_path_seconds >= 0.2
+    assert result.to_dict()["critical_path"] == ["slow", "end"]
+
+
+def test_run_pipeline_rejects_unknown_jobs_before_running():
+    ran = []
+    registry = _registry(a=lambda: ran.append("a"))
+
+    with pytest.raises(ValueError, match="job 'missing' not found"):
+        run_pipeline(registry, Pipeline().add("a").add("b", job="missing"))
+    assert ran == []
+
+
+def test_run_pipeline_step_options_override_registry_options():
+    registry = Registry(options={"value": 1})
+    registry.register_lazy(
+        JobSpec(
+            name="echo",
+            description="Echo",
+            factory=lambda **options: lambda: options["value"],
+        )
+    )
+    pipeline = (
+        Pipeline()
+        .add("one", job="echo")
+        .add("two", job="echo", options={"value": 2})
+    )
+
+    result = run_pipeline(registry, pipeline)
+
+    assert [r.result.data for r in result.runs] == [1, 2]
+
+
+def test_pipeline_from_yaml(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("")
+    path = tmp_path / "pipeline.yaml"
+    path.write_text(
+        """
+pipeline:
+  name: nightly
+  max_parallel: 3
+  steps:
+    organize:
+      job: organize-files
+      options: {source_dir: inbox}
+    example:
+      needs: organize
+""",
+        encoding="utf-8",
+    )
+
+    loaded = load_pipeline_config(path)
+    pipeline = Pipeline.from_config(loaded)
+
+    assert loaded.name == "nightly" and loaded.max_parallel == 3
+    assert pipeline.order() == ["organize", "example"]
+    organize = pipeline.steps[0]
+    assert organize.job == "organize-files"
+    assert organize.options["source_dir"] == (tmp_path / "inbox").resolve()
+    assert pipeline.steps[1].job == "example"
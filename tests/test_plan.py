@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autoops.utils.plan import MovePlan
+
+
+def test_move_plan_round_trips_through_a_file(tmp_path: Path) -> None:
+    plan = MovePlan("/src", "/dst", ["pdf", "others"])
+    plan.add("", "a.pdf", "pdf", 11, 1_000)
+    plan.add("sub/dir", "naïve\udcff.bin", "others", 12, -5)
+    plan.add("sub/dir", "b.pdf", "pdf", 2**63, 3_000)
+    plan.add("", "c.iso", "images", 14, 4_000)  # categories are interned as met
+
+    size = plan.write(tmp_path / "plan.bin")
+    loaded = MovePlan.read(tmp_path / "plan.bin")
+
+    assert size == (tmp_path / "plan.bin").stat().st_size
+    assert (loaded.source_dir, loaded.destination_dir) == ("/src", "/dst")
+    assert loaded.categories == ["pdf", "others", "images"]
+    assert loaded.dirs == ["", "sub/dir"]
+    assert list(loaded.entries()) == list(plan.entries())
+    assert [e.name for e in loaded.entries()][1] == "naïve\udcff.bin"
+    assert loaded.counts() == {"pdf": 2, "others": 1, "images": 1}
+    assert [len(b) for b in loaded.batches(3)] == [3, 1]
+
+
+def test_move_plan_rejects_other_files(tmp_path: Path) -> None:
+    (tmp_path / "junk.bin").write_bytes(b"not a plan")
+    with pytest.raises(ValueError, match="Not an autoops plan"):
+        MovePlan.read(tmp_path / "junk.bin")
+
+    plan = MovePlan("/src", "/dst", ["pdf"])
+    plan.add("", "a.pdf", "pdf", 1, 1)
+    plan.write(tmp_path / "plan.bin")
+    (tmp_path / "cut.bin").write_bytes((tmp_path / "plan.bin").read_bytes()[:-3])
+    with pytest.raises(ValueError, match="Truncated"):
+        MovePlan.read(tmp_path / "cut.bin")
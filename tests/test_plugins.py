@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from autoops.core import plugins
+from autoops.core.plugins import discover_jobs
+
+PLUGIN_MODULE = '''
+def hello_factory(**options):
+    """Say hello from a plugin.
+
+    More text.
+    """
+    return lambda: {"hello": options.get("name", "world")}
+'''
+
+
+@pytest.fixture
+def plugin_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    site = tmp_path / "site"
+    dist_info = site / "autoops_hello-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: autoops-hello\nVersion: 1.0\n",
+        encoding="utf-8",
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[autoops.jobs]\nhello = autoops_hello_jobs:hello_factory\n",
+        encoding="utf-8",
+    )
+    (site / "autoops_hello_jobs.py").write_text(PLUGIN_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(site))
+    yield site
+    sys.modules.pop("autoops_hello_jobs", None)
+
+
+def test_discover_jobs_finds_entry_points_and_caches_manifest(
+    tmp_path: Path, plugin_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest = tmp_path / "plugins.json"
+
+    specs = {s.name: s for s in discover_jobs(manifest)}
+    assert specs["hello"].description == "Say hello from a plugin."
+    assert specs["hello"].factory == "autoops_hello_jobs:hello_factory"
+    assert manifest.exists()
+
+    # Cached: no entry point scan and no plugin import while nothing changed
+    sys.modules.pop("autoops_hello_jobs", None)
+    monkeypatch.setattr(plugins, "_scan_entry_points", lambda: pytest.fail("scan"))
+    specs = {s.name: s for s in discover_jobs(manifest)}
+    assert "hello" in specs
+    assert "autoops_hello_jobs" not in sys.modules
+
+    job = specs["hello"].load(name="tests")
+    assert job.run().data == {"hello": "tests"}
+
+
+def test_discover_jobs_rescans_when_environment_changes(
+    tmp_path: Path, plugin_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest = tmp_path / "plugins.json"
+    discover_jobs(manifest)
+
+    monkeypatch.setattr(plugins, "environment_key", lambda: "something else")
+    monkeypatch.setattr(plugins, "_scan_entry_points", lambda: [])
+
+    assert discover_jobs(manifest) == []
@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+
+import pytest
+
+from autoops.core.job import Job
+from autoops.core.process_pool import ProcessJobPool
+from autoops.core.registry import JobSpec, Registry
+from autoops.core.runner import run_many
+
+
+def _pid():
+    return os.getpid()
+
+
+def _sleep():
+    time.sleep(30)
+
+
+def _raise_value_error():
+    raise ValueError("bad input")
+
+
+class _Unpicklable(Exception):
+    def __init__(self, a, b):
+        super().__init__(a)
+        self.b = b
+
+
+def _raise_unpicklable():
+    raise _Unpicklable("odd", threading.Lock())
+
+
+def _allocate():
+    return len(bytearray(1024 * 1024 * 1024))
+
+
+def _crash():
+    os._exit(3)
+
+
+def pid_factory(**_options):
+    return _pid
+
+
+@pytest.fixture
+def pool():
+    with ProcessJobPool(1) as pool:
+        yield pool
+
+
+def _job(handler):
+    return Job(name=handler.__name__, description="", handler=handler)
+
+
+def test_pool_reuses_warm_workers(pool):
+    first = pool.run(_job(_pid))
+    second = pool.run(_job(_pid))
+
+    assert first.success is True
+    assert first.data == second.data != os.getpid()
+
+
+def test_pool_builds_lazy_jobs_in_the_worker(pool):
+    spec = JobSpec(name="pid", description="", factory=f"{__name__}:pid_factory")
+
+    result = pool.run(spec, {"dry_run": True})
+
+    assert result.success is True
+    assert result.data != os.getpid()
+
+
+def test_pool_transports_exceptions(pool):
+    result = pool.run(_job(_raise_value_error))
+    assert result.success is False
+    assert isinstance(result.error, ValueError)
+    assert str(result.error) == "bad input"
+
+    result = pool.run(_job(_raise_unpicklable))
+    assert isinstance(result.error, RuntimeError)
+    assert "_Unpicklable" in str(result.error)
+
+
+def test_pool_timeout_kills_and_replaces_the_worker(pool):
+    before = pool.run(_job(_pid)).data
+
+    result = pool.run(_job(_sleep), timeout=0.5)
+
+    assert result.success is False
+    assert isinstance(result.error, TimeoutError)
+    after = pool.run(_job(_pid))
+    assert after.success is True
+    assert after.data != before
+
+
+def test_pool_replaces_a_worker_that_dies(pool):
+    result = pool.run(_job(_crash))
+
+    assert result.success is False
+    assert "code 3" in str(result.error)
+    assert pool.run(_job(_pid)).success is True
+
+
+def test_pool_memory_limit_fails_the_job_not_the_worker():
+    with ProcessJobPool(1, memory_limit=512 * 1024 * 1024) as pool:
+        result = pool.run(_job(_allocate))
+        assert isinstance(result.error, MemoryError)
+        assert pool.run(_job(_pid)).success is True
+
+
+def test_pool_reports_jobs_that_cannot_be_sent(pool):
+    result = pool.run(_job(lambda: 1))
+
+    assert result.success is False
+    assert "cannot be sent" in result.message
+    assert pool.run(_job(_pid)).success is True
+
+
+def test_run_many_on_a_pool_with_timeout():
+    registry = Registry()
+    registry.register(_job(_pid))
+    registry.register(_job(_sleep))
+
+    with ProcessJobPool(2) as pool:
+        result = run_many(
+            registry, ["_pid", "_sleep"], max_parallel=2, pool=pool, timeout=1
+        )
+
+    assert [r.status for r in result.runs] == ["succeeded", "failed"]
+    assert result.runs[1].seconds < 10
+
+
+def test_run_many_timeout_needs_a_pool():
+    with pytest.raises(ValueError):
+        run_many(Registry(), ["a"], timeout=1)
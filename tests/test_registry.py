@@ -1,5 +1,7 @@
+import pytest
+
 from autoops.core.job import Job
-from autoops.core.registry import Registry
+from autoops.core.registry import JobSpec, Registry
 
 
 def _noop():
@@ -37,3 +39,55 @@ def test_registry_get_returns_job_or_none():
 
     assert registry.get("example") is job
     assert registry.get("missing") is None
+
+
+def test_registry_builds_lazy_jobs_on_first_get():
+    built = []
+
+    def factory(**options):
+        built.append(options)
+        return lambda: options["value"]
+
+    registry = Registry(options={"value": 7})
+    registry.register_lazy(JobSpec(name="lazy", description="Lazy", factory=factory))
+
+    assert registry.list_names() == ["lazy"]
+    assert registry.describe("lazy") == "Lazy"
+    assert built == []
+
+    job = registry.get("lazy")
+    assert job is not None and job.run().data == 7
+    assert registry.get("lazy") is job
+    assert built == [{"value": 7}]
+
+
+def test_registry_resolves_factory_import_strings():
+    registry = Registry()
+    registry.register_lazy(
+        JobSpec(
+            name="example",
+            description="Example",
+            factory="autoops.jobs.example:example_factory",
+        )
+    )
+
+    assert registry.get("example").run().data["status"] == "ok"
+
+
+def test_registry_rejects_lazy_job_with_taken_name():
+    registry = Registry()
+    registry.register(Job(name="dup", description="Job", handler=_noop))
+
+    with pytest.raises(ValueError):
+        registry.register_lazy(JobSpec(name="dup", description="Spec", factory="x:y"))
+
+
+def test_registry_get_spec_returns_lazy_specs_only():
+    spec = JobSpec(name="lazy", description="Lazy", factory=lambda **_: _noop)
+    registry = Registry()
+    registry.register_lazy(spec)
+    registry.register(Job(name="eager", description="Eager", handler=_noop))
+
+    assert registry.get("lazy") is not None
+    assert registry.get_spec("lazy") is spec
+    assert registry.get_spec("eager") is None
@@ -1,6 +1,10 @@
+import threading
+
+import pytest
+
 from autoops.core.job import Job
 from autoops.core.registry import Registry
-from autoops.core.runner import run
+from autoops.core.runner import run, run_many
 
 
 def test_runner_runs_existing_job_and_returns_success():
@@ -39,3 +43,63 @@ def test_runner_captures_exceptions_from_job_handler():
     assert result.success is False
     assert result.error is not None
     assert isinstance(result.error, RuntimeError)
+
+
+def _registry_with(**handlers):
+    registry = Registry()
+    for name, handler in handlers.items():
+        registry.register(Job(name=name, description=name, handler=handler))
+    return registry
+
+
+def test_run_many_runs_jobs_concurrently_and_keeps_input_order():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waiter():
+        barrier.wait()  # deadlocks unless both jobs run at the same time
+        return "ok"
+
+    registry = _registry_with(a=waiter, b=waiter)
+
+    result = run_many(registry, ["b", "a"], max_parallel=2)
+
+    assert result.success is True
+    assert [r.name for r in result.runs] == ["b", "a"]
+    assert all(r.status == "succeeded" and r.seconds >= 0 for r in result.runs)
+
+
+def test_run_many_failure_does_not_stop_other_jobs():
+    def boom():
+        raise RuntimeError("boom")
+
+    registry = _registry_with(bad=boom, good=lambda: 1)
+
+    result = run_many(registry, ["bad", "good", "missing"], max_parallel=1)
+
+    statuses = {r.name: r.status for r in result.runs}
+    assert statuses == {"bad": "failed", "good": "succeeded", "missing": "not_found"}
+    assert result.success is False
+    assert result.to_dict()["jobs"][0]["error"]
+
+
+def test_run_many_fail_fast_cancels_jobs_not_started():
+    ran = []
+
+    def boom():
+        raise RuntimeError("boom")
+
+    registry = _registry_with(
+        bad=boom, later1=lambda: ran.append(1), later2=lambda: ran.append(2)
+    )
+
+    result = run_many(
+        registry, ["bad", "later1", "later2"], max_parallel=1, fail_fast=True
+    )
+
+    assert [r.status for r in result.runs] == ["failed", "cancelled", "cancelled"]
+    assert ran == []
+
+
+def test_run_many_rejects_non_positive_parallelism():
+    with pytest.raises(ValueError):
+        run_many(Registry(), ["a"], max_parallel=0)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from autoops.utils.scan import scan_files
+
+
+def _tree(root: Path) -> None:
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "skip").mkdir()
+    (root / "top.txt").write_text("x", encoding="utf-8")
+    (root / "a" / "mid.txt").write_text("x", encoding="utf-8")
+    (root / "a" / "b" / "deep.txt").write_text("x", encoding="utf-8")
+    (root / "skip" / "hidden.txt").write_text("x", encoding="utf-8")
+
+
+def _names(entries) -> set:
+    return {e.name for e in entries}
+
+
+def test_scan_files_top_level_only_by_default(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    assert _names(scan_files(tmp_path)) == {"top.txt"}
+
+
+def test_scan_files_recursive_respects_max_depth(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    assert _names(scan_files(tmp_path, recursive=True)) == {
+        "top.txt",
+        "mid.txt",
+        "deep.txt",
+        "hidden.txt",
+    }
+    assert _names(scan_files(tmp_path, recursive=True, max_depth=1)) == {
+        "top.txt",
+        "mid.txt",
+        "hidden.txt",
+    }
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or os.geteuid() == 0,
+    reason="needs POSIX permissions that apply to the current user",
+)
+def test_scan_files_skips_unreadable_subdirectories(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    locked = tmp_path / "a" / "locked"
+    locked.mkdir()
+    (locked / "secret.txt").write_text("x", encoding="utf-8")
+    locked.chmod(0)
+    try:
+        names = _names(scan_files(tmp_path, recursive=True))
+    finally:
+        locked.chmod(0o700)
+
+    assert names == {"top.txt", "mid.txt", "deep.txt", "hidden.txt"}
+
+
+def test_scan_files_skips_subdirectories_removed_during_the_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _tree(tmp_path)
+    gone = str(tmp_path / "a" / "b")
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if path == gone:
+            raise FileNotFoundError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr("autoops.utils.scan.os.scandir", scandir)
+
+    assert _names(scan_files(tmp_path, recursive=True)) == {
+        "top.txt",
+        "mid.txt",
+        "hidden.txt",
+    }
+
+
+def test_scan_files_excludes_globs_and_skip_dirs(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    entries = scan_files(
+        tmp_path,
+        recursive=True,
+        exclude=["a/b", "top.*"],
+        skip_dirs=[tmp_path / "skip"],
+    )
+
+    assert _names(entries) == {"mid.txt"}
+
+
+def test_scan_files_is_lazy(tmp_path: Path) -> None:
+    _tree(tmp_path)
+
+    it = scan_files(tmp_path, recursive=True)
+
+    assert next(it).is_file()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from autoops.utils import scan_state
+from autoops.utils.scan import scan_files
+from autoops.utils.scan_state import ScanState, default_state_path
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Push mtime into the past so it is outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _scan(root: Path, db: Path, *, commit: bool = True, **kwargs) -> set:
+    with ScanState(db, fingerprint="fp") as state:
+        names = {e.name for e in scan_files(root, state=state, **kwargs)}
+        if commit:
+            state.commit()
+    return names
+
+
+def test_unchanged_directory_is_not_listed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.txt").touch()
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+
+    assert _scan(root, db) == {"a.txt"}
+
+    def fail(path):
+        raise AssertionError("directory should not be listed")
+
+    monkeypatch.setattr("autoops.utils.scan.os.scandir", fail)
+    assert _scan(root, db) == set()
+
+
+def test_changed_directory_yields_only_new_or_modified_files(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "old.txt").write_text("1", encoding="utf-8")
+    (root / "edited.txt").write_text("1", encoding="utf-8")
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+    _scan(root, db)
+
+    (root / "new.txt").touch()
+    (root / "edited.txt").write_text("22", encoding="utf-8")
+    _age(root, 30)
+
+    assert _scan(root, db) == {"new.txt", "edited.txt"}
+
+
+def test_replaced_file_with_same_size_and_mtime_is_yielded(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    stamp = (1_600_000_000, 1_600_000_000)
+    (root / "a.txt").write_text("1", encoding="utf-8")
+    os.utime(root / "a.txt", stamp)
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+    _scan(root, db)
+
+    # e.g. restored from a backup: new file, old size and timestamps
+    (tmp_path / "restored.txt").write_text("2", encoding="utf-8")
+    os.utime(tmp_path / "restored.txt", stamp)
+    os.replace(tmp_path / "restored.txt", root / "a.txt")
+    _age(root, 30)
+
+    assert _scan(root, db) == {"a.txt"}
+
+
+def test_state_from_an_older_schema_is_dropped(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.txt").touch()
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+    conn = sqlite3.connect(str(db))
+    conn.executescript(
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        "INSERT INTO meta VALUES ('fingerprint', 'fp');"
+        "CREATE TABLE entries (dir TEXT NOT NULL, name TEXT NOT NULL,"
+        " size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+        " PRIMARY KEY (dir, name)) WITHOUT ROWID;"
+    )
+    conn.close()
+
+    assert _scan(root, db) == {"a.txt"}
+    assert _scan(root, db) == set()
+
+
+def test_recursive_descends_through_unchanged_parents(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    (root / "sub").mkdir(parents=True)
+    (root / "sub" / "a.txt").touch()
+    _age(root / "sub")
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+    assert _scan(root, db, recursive=True) == {"a.txt"}
+
+    # adding a file to sub does not change root's mtime
+    (root / "sub" / "b.txt").touch()
+    _age(root / "sub", 30)
+
+    assert _scan(root, db, recursive=True) == {"b.txt"}
+
+
+def test_uncommitted_scan_is_discarded(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.txt").touch()
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+
+    _scan(root, db, commit=False)
+
+    assert _scan(root, db) == {"a.txt"}
+
+
+def test_racy_directory_mtime_is_not_trusted(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.txt").touch()
+    db = tmp_path / "state.sqlite3"
+    _scan(root, db)
+
+    # same mtime tick as the previous scan: must still be listed
+    (root / "b.txt").touch()
+    os.utime(root, ns=(time.time_ns(), os.stat(root).st_mtime_ns))
+
+    assert "b.txt" in _scan(root, db)
+
+
+def test_fingerprint_change_resets_state(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.txt").touch()
+    _age(root)
+    db = tmp_path / "state.sqlite3"
+    _scan(root, db)
+
+    with ScanState(db, fingerprint="other") as state:
+        assert {e.name for e in scan_files(root, state=state)} == {"a.txt"}
+
+
+def test_default_state_path_uses_data_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("AUTOOPS_DATA_DIR", str(tmp_path))
+
+    path = default_state_path(Path("/some/inbox"), "dry")
+
+    assert path.parent == tmp_path / "scan-state"
+    assert path.name.endswith("-dry.sqlite3")
+    assert scan_state.data_dir() == tmp_path
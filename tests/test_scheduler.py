@@ -0,0 +1,175 @@
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from autoops.config.loader import load_schedule_config
+from autoops.core.job import Job
+from autoops.core.registry import JobSpec, Registry
+from autoops.core.scheduler import ScheduledJob, Scheduler
+
+
+def _registry(**handlers):
+    registry = Registry()
+    for name, handler in handlers.items():
+        registry.register(Job(name=name, description=name, handler=handler))
+    return registry
+
+
+def _run_for(scheduler, seconds):
+    stop = threading.Event()
+    thread = threading.Thread(target=scheduler.run, args=(stop,))
+    thread.start()
+    time.sleep(seconds)
+    stop.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    return scheduler.stats
+
+
+def test_scheduler_runs_interval_jobs_repeatedly(tmp_path):
+    runs = []
+    scheduler = Scheduler(
+        _registry(tick=lambda: None),
+        [ScheduledJob(name="tick", job="tick", every=0.1)],
+        state_path=tmp_path / "state.json",
+        on_run=runs.append,
+    )
+
+    stats = _run_for(scheduler, 0.55)
+
+    assert stats.runs >= 3 and stats.failures == 0
+    assert all(r.status == "succeeded" for r in runs)
+    assert "tick" in json.loads((tmp_path / "state.json").read_text())
+
+
+def test_scheduler_never_overlaps_runs_of_one_job(tmp_path):
+    active = []
+    overlapped = []
+
+    def slow():
+        if active:
+            overlapped.append(True)
+        active.append(1)
+        time.sleep(0.35)
+        active.pop()
+
+    scheduler = Scheduler(
+        _registry(slow=slow),
+        [ScheduledJob(name="slow", job="slow", every=0.1)],
+        max_parallel=4,
+        state_path=tmp_path / "state.json",
+    )
+
+    stats = _run_for(scheduler, 0.6)
+
+    assert overlapped == []
+    assert stats.skipped_overlap >= 2
+
+
+@pytest.mark.parametrize("catch_up, expected_runs", [(True, 1), (False, 0)])
+def test_scheduler_catches_up_missed_runs_once(tmp_path, catch_up, expected_runs):
+    state = tmp_path / "state.json"
+    state.write_text(json.dumps({"hourly": time.time() - 10 * 3600}))
+    scheduler = Scheduler(
+        _registry(job=lambda: None),
+        [ScheduledJob(name="hourly", job="job", every=3600, catch_up=catch_up)],
+        state_path=state,
+    )
+
+    stats = _run_for(scheduler, 0.3)
+
+    assert stats.runs == expected_runs
+    assert stats.caught_up == expected_runs
+
+
+def test_scheduler_applies_jitter_after_the_tick(tmp_path):
+    scheduler = Scheduler(
+        _registry(job=lambda: None),
+        [ScheduledJob(name="job", job="job", every=60, jitter=30)],
+        state_path=tmp_path / "state.json",
+        clock=lambda: 1000.0,
+        rng=random.Random(1),
+    )
+    stop = threading.Event()
+    stop.set()
+
+    scheduler.run(stop)
+
+    fire_at, name = scheduler.next_due()
+    assert name == "job"
+    assert 1020 < fire_at <= 1050
+
+
+def test_scheduler_builds_jobs_once_with_entry_options(tmp_path):
+    built = []
+
+    def factory(**options):
+        built.append(options)
+        return lambda: options["value"]
+
+    registry = Registry(options={"value": 1})
+    registry.register_lazy(JobSpec(name="echo", description="", factory=factory))
+    runs = []
+    scheduler = Scheduler(
+        registry,
+        [ScheduledJob(name="e", job="echo", every=0.1, options={"value": 2})],
+        state_path=tmp_path / "state.json",
+        on_run=runs.append,
+    )
+
+    _run_for(scheduler, 0.35)
+
+    assert built == [{"value": 2}]
+    assert runs and all(r.result.data == 2 for r in runs)
+
+
+def test_scheduler_rejects_unknown_jobs_and_bad_entries(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        Scheduler(Registry(), [ScheduledJob(name="x", job="missing", every=1)])
+    with pytest.raises(ValueError):
+        ScheduledJob(name="x", job="x")
+    with pytest.raises(ValueError):
+        ScheduledJob(name="x", job="x", every=1, cron="* * * * *")
+
+
+def test_schedule_config_from_yaml(tmp_path):
+    path = tmp_path / "schedule.yaml"
+    path.write_text(
+        """
+schedule:
+  max_parallel: 2
+  jobs:
+    organize:
+      job: organize-files
+      every: 15m
+      jitter: 30s
+      catch_up: true
+    example:
+      cron: "0 * * * *"
+""",
+        encoding="utf-8",
+    )
+
+    loaded = load_schedule_config(path)
+
+    organize, example = loaded.entries
+    assert loaded.max_parallel == 2
+    assert organize.job == "organize-files"
+    assert (organize.every, organize.jitter) == (900, 30)
+    assert organize.catch_up is True
+    assert (example.job, example.cron, example.every) == ("example", "0 * * * *", None)
+
+
+def test_schedule_config_rejects_bad_entries(tmp_path):
+    path = tmp_path / "schedule.yaml"
+    for body in (
+        "schedule:\n  jobs:\n    a: {every: 1m, cron: '* * * * *'}\n",
+        "schedule:\n  jobs:\n    a: {cron: '61 * * * *'}\n",
+        "schedule:\n  jobs:\n    a: {every: soon}\n",
+    ):
+        path.write_text(body, encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_schedule_config(path)
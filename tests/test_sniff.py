@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from autoops.config.loader import OrganizeDedupConfig, OrganizeSniffConfig
+from autoops.jobs.organize_files import organize_files
+from autoops.utils import sniff
+from autoops.utils.dedup import HashCache
+from autoops.utils.sniff import Sniffer, match_header
+
+
+def _zip_header(name: bytes, data: bytes = b"") -> bytes:
+    header = struct.pack("<4s22xHH", b"PK\x03\x04", len(name), 0)
+    return header + name + data
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (b"%PDF-1.7\n", ".pdf"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00", ".png"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", ".jpg"),
+        (b"\x7fELF\x02\x01\x01", ".elf"),
+        (b"\x1f\x8b\x08\x00", ".gz"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", ".webp"),
+        (b"\x00\x00\x00\x20ftypisom", ".mp4"),
+        (_zip_header(b"word/document.xml"), ".docx"),
+        (_zip_header(b"mimetype", b"application/epub+zip"), ".epub"),
+        (_zip_header(b"notes.txt"), ".zip"),
+        (b"PK\x03\x04", ".zip"),
+        (b"#!/usr/bin/env python3\n", ".py"),
+        (b"#!/bin/bash\n", ".sh"),
+        (b"#!/opt/unknown\n", None),
+        (b"hello world", None),
+        (b"", None),
+    ],
+)
+def test_match_header(header: bytes, expected) -> None:
+    assert match_header(header) == expected
+
+
+def test_sniffer_caches_verdicts_by_file_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pdf = tmp_path / "scan"
+    pdf.write_bytes(b"%PDF-1.4\n" + b"x" * 1000)
+    text = tmp_path / "notes"
+    text.write_bytes(b"just text")
+    paths = [str(pdf), str(text)]
+    reads = []
+    real_read = sniff.read_header
+    monkeypatch.setattr(
+        sniff, "read_header", lambda path: reads.append(path) or real_read(path)
+    )
+
+    with HashCache(tmp_path / "cache.sqlite3") as cache:
+        with Sniffer(workers=2, cache=cache) as sniffer:
+            assert sniffer.sniff(paths) == {str(pdf): ".pdf"}
+            assert sniffer.sniff(paths) == {str(pdf): ".pdf"}
+
+    assert sorted(reads) == sorted(paths)
+
+
+def test_organize_files_sniffs_files_without_known_extension(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("AUTOOPS_CACHE_DIR", str(tmp_path / "cache"))
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "download").write_bytes(b"%PDF-1.5\n...")
+    (src / "photo.bin").write_bytes(b"\x89PNG\r\n\x1a\n....")
+    (src / "archive").write_bytes(b"7z\xbc\xaf\x27\x1c")
+    (src / "mystery").write_bytes(b"???")
+    (src / "report.pdf").write_bytes(b"not really a pdf")
+
+    result = organize_files(
+        source_dir=src,
+        destination_dir=src,
+        categories={"pdf": [".pdf"], "images": [".png"]},
+        others_dir="others",
+        dry_run=False,
+        sniff=OrganizeSniffConfig(enabled=True, workers=2),
+    )
+
+    assert result["moved_by_category"] == {"pdf": 2, "images": 1, "others": 2}
+    assert (src / "pdf" / "download").exists()
+    assert (src / "images" / "photo.bin").exists()
+    assert (src / "others" / "archive").exists()
+    assert (src / "others" / "mystery").exists()
+
+
+def test_sniff_and_dedup_share_the_hash_cache_in_move_mode(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("AUTOOPS_CACHE_DIR", str(tmp_path / "cache"))
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "download").write_bytes(b"%PDF-1.5\nsame")
+    (src / "copy").write_bytes(b"%PDF-1.5\nsame")
+
+    result = organize_files(
+        source_dir=src,
+        destination_dir=src,
+        categories={"pdf": [".pdf"]},
+        others_dir="others",
+        dry_run=False,
+        sniff=OrganizeSniffConfig(enabled=True, workers=2),
+        dedup=OrganizeDedupConfig(enabled=True, action="quarantine"),
+    )
+
+    assert result["duplicates"] == {"action": "quarantine", "total": 1}
+    assert result["moved_by_category"]["pdf"] == 1
+    assert len(list((src / "duplicates").iterdir())) == 1
@@ -0,0 +1,117 @@
+"""
+Startup budget: the scheduler-facing fast paths must not pay for typer or
+PyYAML, and their import time must stay within budget. Each check runs a
+fresh interpreter with `python -X importtime`.
+
+The forbidden-module checks always run and are exact. Wall-clock time
+depends on the machine and its load, so the time budget is only enforced
+when AUTOOPS_IMPORT_BUDGET_MS is set (e.g. 150 on a quiet benchmark box).
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from autoops import launcher
+
+BUDGET_MS = os.environ.get("AUTOOPS_IMPORT_BUDGET_MS")
+HEAVY_MODULES = ("typer", "click", "yaml", "autoops.cli")
+
+
+def _import_times(args: List[str], cwd: Path) -> Dict[str, int]:
+    """
+    Run `python -X importtime -m autoops <args>` and return
+    {module: cumulative microseconds}; top-level imports keep no leading
+    space, nested ones stay indented.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "autoops", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    times: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name[1:]] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["version"], ["list"], ["run", "example", "--quiet"]],
+    ids=["version", "list", "run-quiet"],
+)
+def test_fast_paths_skip_heavy_imports_and_fit_budget(
+    tmp_path: Path, args: List[str]
+) -> None:
+    _import_times(args, tmp_path)  # warm up the bytecode and plugin caches
+    times = _import_times(args, tmp_path)
+
+    loaded = {name.strip() for name in times}
+    for module in HEAVY_MODULES:
+        assert module not in loaded, f"`autoops {' '.join(args)}` imported {module}"
+
+    if BUDGET_MS is None:
+        return
+    # everything imported after interpreter startup (site is not ours)
+    total_ms = sum(
+        us for name, us in times.items() if name == name.lstrip() and name != "site"
+    ) / 1000
+    assert total_ms < float(BUDGET_MS), f"imports took {total_ms:.1f} ms"
+
+
+def test_run_quiet_fast_path_reports_failure_through_exit_code(tmp_path: Path) -> None:
+    def run(*args: str) -> int:
+        return subprocess.run(
+            [sys.executable, "-m", "autoops", *args], cwd=tmp_path, timeout=60
+        ).returncode
+
+    assert run("run", "example", "--quiet") == 0
+    # no configs/organize_files.yaml in tmp_path: the job fails
+    assert run("run", "organize-files", "--quiet") == 1
+    assert run("run", "missing-job", "--quiet") == 2
+
+
+def test_parse_quiet_run() -> None:
+    job, options = launcher.parse_quiet_run(
+        ["organize-files", "--source-dir", "/in", "--no-dry-run", "--quiet"]
+    )
+    assert job == "organize-files"
+    assert options["dry_run"] is False
+    assert str(options["destination_dir"]) == "/in"
+
+    _, options = launcher.parse_quiet_run(["example", "--no-history", "--quiet"])
+    assert options["history"] is False
+
+    # anything else goes to the full CLI
+    assert launcher.parse_quiet_run(["example"]) is None
+    assert launcher.parse_quiet_run(["example", "--quiet", "--json"]) is None
+    assert launcher.parse_quiet_run(["example", "--quiet", "--workers", "0"]) is None
+    assert launcher.parse_quiet_run(["example", "--quiet", "--workers"]) is None
+
+
+def test_fast_path_options_exist_in_the_full_cli() -> None:
+    import typer.main
+
+    from autoops.cli import app
+
+    run = typer.main.get_command(app).commands["run"]
+    cli_options = {
+        opt for param in run.params for opt in (*param.opts, *param.secondary_opts)
+    }
+
+    fast_options = {*launcher._RUN_FLAGS, *launcher._RUN_VALUES, "--quiet"}
+    assert fast_options <= cli_options
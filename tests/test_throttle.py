@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from autoops.utils.throttle import (
+    IOThrottle,
+    TokenBucket,
+    set_io_priority,
+    thread_priority,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_spends_burst_then_waits() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(10) == 0.0
+    assert bucket.acquire(5) == pytest.approx(0.5)
+
+    clock.now += 10  # idle: refills up to the burst only
+    assert bucket.acquire(10) == 0.0
+    assert bucket.acquire(1) == pytest.approx(0.1)
+
+
+def test_token_bucket_pays_off_requests_larger_than_burst() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(100, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(300) == pytest.approx(2.0)
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_io_throttle_backs_off_while_latency_is_high() -> None:
+    clock = FakeClock()
+    throttle = IOThrottle(target_latency=0.01, clock=clock, sleep=clock.sleep)
+
+    throttle.op()
+    assert clock.slept == []
+
+    for _ in range(20):
+        throttle.observe(0.5)
+    high = throttle.pause
+    assert 0 < high <= 1.0
+
+    throttle.op()
+    assert clock.slept == [high]
+
+    for _ in range(200):
+        throttle.observe(0.0)
+    assert throttle.pause == 0.0
+
+
+def test_io_throttle_limits_ops_and_bytes() -> None:
+    clock = FakeClock()
+    throttle = IOThrottle(
+        bytes_per_second=1000, ops_per_second=2, clock=clock, sleep=clock.sleep
+    )
+
+    for _ in range(4):
+        throttle.op()
+    assert clock.now == pytest.approx(1.0)
+
+    throttle.transfer(3000)
+    assert clock.now == pytest.approx(3.0)
+
+
+def test_set_io_priority_rejects_unknown_class() -> None:
+    with pytest.raises(ValueError):
+        set_io_priority(ionice="fast")
+
+
+def test_thread_priority_is_none_without_settings() -> None:
+    assert thread_priority() is None
+    with pytest.raises(ValueError):
+        thread_priority(ionice="fast")
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from autoops.core.metrics import Metrics
+from autoops.utils import transfer
+from autoops.utils.transfer import FileCopier
+
+
+def _source(tmp_path: Path, size: int) -> Path:
+    src = tmp_path / "big.vmdk"
+    src.write_bytes(bytes(i % 251 for i in range(size)))
+    os.chmod(src, 0o640)
+    os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+    return src
+
+
+def test_copier_copies_bytes_and_metadata(tmp_path: Path) -> None:
+    src = _source(tmp_path, 100_000)
+    metrics = Metrics()
+
+    copied = FileCopier(reflink=False, metrics=metrics).copy(
+        str(src), str(tmp_path / "out")
+    )
+
+    out = tmp_path / "out"
+    assert copied == 100_000
+    assert out.read_bytes() == src.read_bytes()
+    assert out.stat().st_mtime_ns == src.stat().st_mtime_ns
+    assert out.stat().st_mode & 0o777 == 0o640
+    counters = metrics.as_dict()["counters"]
+    assert counters["files_copied"] == 1
+    assert counters["bytes_copied"] == 100_000
+
+
+def test_copier_splits_large_files_into_parallel_ranges(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(transfer, "_STEP", 4096)
+    src = _source(tmp_path, 50_000)
+    seen = []
+
+    copier = FileCopier(
+        workers=4,
+        parallel_min_size=10_000,
+        verify=True,
+        reflink=False,
+        progress=lambda source, copied, total: seen.append((copied, total)),
+    )
+    copier.copy(str(src), str(tmp_path / "out"))
+
+    assert (tmp_path / "out").read_bytes() == src.read_bytes()
+    assert len(seen) == -(-50_000 // 4096)
+    assert max(seen) == (50_000, 50_000)
+
+
+def test_copier_falls_back_when_the_kernel_refuses(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def refuse(*args, **kwargs):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(transfer.os, "copy_file_range", refuse, raising=False)
+    monkeypatch.setattr(transfer.os, "sendfile", refuse, raising=False)
+    src = _source(tmp_path, 20_000)
+    metrics = Metrics()
+
+    FileCopier(reflink=False, metrics=metrics).copy(str(src), str(tmp_path / "out"))
+
+    assert (tmp_path / "out").read_bytes() == src.read_bytes()
+    assert metrics.as_dict()["counters"]["copy_read"] == 1
+
+
+def test_copier_removes_a_copy_that_fails_verification(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(transfer, "_digest", lambda path: path.encode())
+    src = _source(tmp_path, 1000)
+
+    with pytest.raises(OSError) as info:
+        FileCopier(verify=True).copy(str(src), str(tmp_path / "out"))
+
+    assert info.value.errno == errno.EIO
+    assert not (tmp_path / "out").exists()
+    assert src.exists()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from autoops.config.categories import CategoryIndex
+from autoops.config.loader import (
+    OrganizeFilesLoadedConfig,
+    OrganizeThrottleConfig,
+    OrganizeTransferConfig,
+    OrganizeWatchConfig,
+)
+from autoops.jobs import organize_watch
+from autoops.jobs.organize_watch import watch_organize
+from autoops.utils.watch import InotifyWatcher, PollingWatcher
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_polling_watcher_reports_new_and_changed_files(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("1", encoding="utf-8")
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+
+    assert watcher.poll(0) == [str(tmp_path / "a.txt")]
+
+    (tmp_path / "b.txt").write_text("1", encoding="utf-8")
+    time.sleep(0.02)
+    assert watcher.poll(0) == [str(tmp_path / "b.txt")]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify only")
+def test_inotify_watcher_reports_written_files(tmp_path: Path) -> None:
+    watcher = InotifyWatcher(tmp_path)
+    try:
+        (tmp_path / "a.txt").write_text("1", encoding="utf-8")
+
+        assert str(tmp_path / "a.txt") in watcher.poll(1.0)
+    finally:
+        watcher.close()
+
+
+@pytest.mark.parametrize("polling", [True, False])
+def test_watch_organize_moves_stable_files_and_holds_partials(
+    tmp_path: Path, polling: bool
+) -> None:
+    if not polling and not sys.platform.startswith("linux"):
+        pytest.skip("inotify only")
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "existing.pdf").write_text("x", encoding="utf-8")
+    categories = {"pdf": [".pdf"], "partial_downloads": [".part"]}
+    loaded = OrganizeFilesLoadedConfig(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        categories=categories,
+        category_index=CategoryIndex.compile(categories),
+        watch=OrganizeWatchConfig(
+            settle_seconds=0.05, debounce_seconds=0.02, poll_interval=0.05
+        ),
+    )
+    stop = threading.Event()
+    batches = []
+    thread = threading.Thread(
+        target=watch_organize,
+        kwargs=dict(
+            loaded=loaded,
+            dry_run=False,
+            on_batch=batches.append,
+            stop=stop,
+            force_polling=polling,
+        ),
+    )
+    thread.start()
+    try:
+        assert _wait_for(lambda: (src / "pdf" / "existing.pdf").exists())
+
+        (src / "movie.part").write_text("partial", encoding="utf-8")
+        (src / "new.pdf").write_text("x", encoding="utf-8")
+
+        assert _wait_for(lambda: (src / "pdf" / "new.pdf").exists())
+        time.sleep(0.2)
+        assert (src / "movie.part").exists()
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert sum(b["moved_total"] for b in batches) == 2
+
+
+def test_watch_organize_applies_throttle_and_transfer_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "first.pdf").write_text("x", encoding="utf-8")
+    categories = {"pdf": [".pdf"]}
+    loaded = OrganizeFilesLoadedConfig(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        categories=categories,
+        category_index=CategoryIndex.compile(categories),
+        watch=OrganizeWatchConfig(
+            settle_seconds=0.05, debounce_seconds=0.02, poll_interval=0.05
+        ),
+        throttle=OrganizeThrottleConfig(ops_per_second=1000),
+        transfer=OrganizeTransferConfig(verify=True),
+    )
+    calls = []
+
+    def spy(**kwargs):
+        calls.append(kwargs)
+        return real(**kwargs)
+
+    real = organize_watch.organize_files
+    monkeypatch.setattr(organize_watch, "organize_files", spy)
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch_organize,
+        kwargs=dict(loaded=loaded, dry_run=False, stop=stop, force_polling=True),
+    )
+    thread.start()
+    try:
+        assert _wait_for(lambda: (src / "pdf" / "first.pdf").exists())
+        (src / "second.pdf").write_text("x", encoding="utf-8")
+        assert _wait_for(lambda: (src / "pdf" / "second.pdf").exists())
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+    assert len(calls) >= 2
+    assert all(c["throttle"] is loaded.throttle for c in calls)
+    assert all(c["transfer"] is loaded.transfer for c in calls)
+    # one I/O budget for the whole watch, not a fresh burst per batch
+    assert calls[0]["io_throttle"] is not None
+    assert all(c["io_throttle"] is calls[0]["io_throttle"] for c in calls)
+
+
+def test_watch_organize_keeps_watching_after_a_failed_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "bad.pdf").write_text("x", encoding="utf-8")
+    categories = {"pdf": [".pdf"]}
+    loaded = OrganizeFilesLoadedConfig(
+        source_dir=src,
+        destination_dir=src,
+        dry_run=False,
+        categories=categories,
+        category_index=CategoryIndex.compile(categories),
+        watch=OrganizeWatchConfig(
+            settle_seconds=0.05, debounce_seconds=0.02, poll_interval=0.05
+        ),
+    )
+    real = organize_watch.organize_files
+
+    def flaky(**kwargs):
+        if any(path.endswith("bad.pdf") for path in kwargs["only"]):
+            raise PermissionError(13, "Permission denied")
+        return real(**kwargs)
+
+    monkeypatch.setattr(organize_watch, "organize_files", flaky)
+    errors = []
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch_organize,
+        kwargs=dict(
+            loaded=loaded,
+            dry_run=False,
+            stop=stop,
+            force_polling=True,
+            on_error=lambda exc, files: errors.append((exc, files)),
+        ),
+    )
+    thread.start()
+    try:
+        assert _wait_for(lambda: bool(errors))
+        (src / "good.pdf").write_text("x", encoding="utf-8")
+        assert _wait_for(lambda: (src / "pdf" / "good.pdf").exists())
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    exc, files = errors[0]
+    assert isinstance(exc, PermissionError)
+    assert [os.path.basename(f) for f in files] == ["bad.pdf"]